@@ -13,7 +13,10 @@ def create_app(config_name=None):
     database_url = os.getenv('DATABASE_URL')
     
     # Test PostgreSQL connection
-    if database_url:
+    if database_url and database_url.startswith('sqlite'):
+        app.config['SQLALCHEMY_DATABASE_URI'] = database_url
+        print(f"📁 Using SQLite: {database_url}")
+    elif database_url:
         try:
             # Try to import psycopg2 to test if it's working
             import psycopg2
@@ -35,9 +38,14 @@ def create_app(config_name=None):
     # Basic config
     app.config['SECRET_KEY'] = os.getenv('SECRET_KEY', 'dev-secret-key-change-in-production')
     app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
-    app.config['DEBUG'] = os.getenv('FLASK_DEBUG', 'True').lower() == 'true'
+    app.config['DEBUG'] = os.getenv('FLASK_DEBUG', 'False').lower() == 'true'
     app.config['ENV'] = os.getenv('FLASK_ENV', 'development')
     
+    # Pagination
+    app.config['JOBS_PER_PAGE'] = int(os.getenv('JOBS_PER_PAGE', '20'))
+    app.config['MAX_JOBS_PER_PAGE'] = int(os.getenv('MAX_JOBS_PER_PAGE', '100'))
+    app.config['EXPORT_BATCH_SIZE'] = int(os.getenv('EXPORT_BATCH_SIZE', '1000'))
+    
     # CORS Configuration
     cors_origins = os.getenv('CORS_ORIGINS', 'http://localhost:3000').split(',')
     CORS(app, resources={
@@ -48,9 +56,28 @@ def create_app(config_name=None):
         }
     })
     
+    # Connection pool, pre-ping and timeouts from DB_* environment variables
+    from app.engine import build_engine_options, init_engine
+    app.config['SQLALCHEMY_ENGINE_OPTIONS'] = build_engine_options(app.config['SQLALCHEMY_DATABASE_URI'])
+    
     # Initialize database
     from app.models import db
     db.init_app(app)
+    init_engine(app, db)
+    
+    # orjson/msgspec-backed JSON responses when available
+    from app.serializers import FastJSONProvider, JSON_BACKEND
+    app.json = FastJSONProvider(app)
+    print(f"✅ JSON encoder: {JSON_BACKEND}")
+    
+    # gzip/brotli for /api responses, negotiated from Accept-Encoding
+    from app.compression import init_compression
+    init_compression(app)
+    
+    # Listing/facet result cache (memory, redis or none)
+    from app.cache import init_query_cache
+    query_cache = init_query_cache(app)
+    print(f"✅ Query cache: {type(query_cache.backend).__name__}")
     
     # Import and register routes AFTER app is configured
     try:
@@ -66,7 +93,7 @@ def create_app(config_name=None):
         return jsonify({
             'message': 'Job Board API', 
             'status': 'running',
-            'database': 'PostgreSQL' if database_url else 'SQLite',
+            'database': 'PostgreSQL' if app.config['SQLALCHEMY_DATABASE_URI'].startswith('postgres') else 'SQLite',
             'version': '1.0.0'
         })
     
@@ -78,12 +105,5 @@ def create_app(config_name=None):
     def internal_error(error):
         return jsonify({'error': 'Internal server error'}), 500
     
-    # Create database tables
-    with app.app_context():
-        try:
-            db.create_all()
-            print("✅ Database tables created/verified")
-        except Exception as e:
-            print(f"❌ Database error: {e}")
-    
+    # No database I/O here: schema changes are applied by `python migrate.py`
     return app
\ No newline at end of file
@@ -0,0 +1,217 @@
+"""
+Query result cache for job listings
+Results are cached under the normalized filter parameters plus the jobs table
+version (see app/stats.py), so any job write makes older entries unreachable in
+every worker. Local writes also clear the cache right after they commit.
+
+Backends: 'memory' (bounded LRU with TTL, per process), 'redis' (shared by all
+gunicorn workers) or 'none'. Choose with QUERY_CACHE_BACKEND.
+"""
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+
+from flask import current_app, has_app_context
+
+from app.serializers import dumps
+
+try:
+    import redis
+except ImportError:
+    redis = None
+
+# Parameters compared as unordered, case-insensitive comma-separated lists
+LIST_PARAMS = ('tags', 'include')
+
+
+def normalize_params(params):
+    """Canonical, hashable form of a filter dict: empty values dropped, lists sorted"""
+    normalized = {}
+    for key, value in params.items():
+        if value is None:
+            continue
+        value = str(value).strip()
+        if not value:
+            continue
+        if key in LIST_PARAMS:
+            value = ','.join(sorted({part.strip().lower() for part in value.split(',') if part.strip()}))
+        elif key == 'search_term':
+            value = ' '.join(value.lower().split())
+        normalized[key] = value
+    return sorted(normalized.items())
+
+
+class MemoryCache:
+    """Thread-safe LRU cache with a per-entry TTL"""
+
+    def __init__(self, max_entries=512, ttl=300):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """Return (found, value)"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return False, None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return False, None
+            self._entries.move_to_end(key)
+            return True, value
+
+    def set(self, key, value):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def size(self):
+        return len(self._entries)
+
+
+class RedisCache:
+    """Cache stored in Redis so every worker process shares it"""
+
+    def __init__(self, url, ttl=300, prefix='jobboard:query:'):
+        if redis is None:
+            raise ImportError("QUERY_CACHE_BACKEND=redis requires the redis package")
+        self.client = redis.Redis.from_url(url)
+        self.ttl = ttl
+        self.prefix = prefix
+        self.evictions = 0  # Redis evicts on its own (maxmemory-policy)
+
+    def get(self, key):
+        raw = self.client.get(self.prefix + key)
+        if raw is None:
+            return False, None
+        return True, json.loads(raw)
+
+    def set(self, key, value):
+        self.client.set(self.prefix + key, dumps(value), ex=self.ttl)
+
+    def clear(self):
+        keys = list(self.client.scan_iter(match=self.prefix + '*', count=500))
+        if keys:
+            self.client.delete(*keys)
+
+    def size(self):
+        return sum(1 for _ in self.client.scan_iter(match=self.prefix + '*', count=500))
+
+
+class QueryCache:
+    """Counts hits and misses around a cache backend"""
+
+    def __init__(self, backend):
+        self.backend = backend
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def make_key(self, namespace, version, params):
+        digest = hashlib.sha1(json.dumps(normalize_params(params)).encode('utf-8')).hexdigest()
+        return f"{namespace}:{version}:{digest}"
+
+    def get_or_set(self, namespace, version, params, compute):
+        """Return the cached result for params, computing and storing it on a miss"""
+        key = self.make_key(namespace, version, params)
+        try:
+            found, value = self.backend.get(key)
+        except Exception as e:
+            current_app.logger.warning(f"Query cache read failed: {e}")
+            found, value = False, None
+
+        with self._lock:
+            if found:
+                self.hits += 1
+            else:
+                self.misses += 1
+        if found:
+            return value
+
+        value = compute()
+        try:
+            self.backend.set(key, value)
+        except Exception as e:
+            current_app.logger.warning(f"Query cache write failed: {e}")
+        return value
+
+    def invalidate(self):
+        self.backend.clear()
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            'backend': type(self.backend).__name__,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_ratio': round(self.hits / lookups, 4) if lookups else None,
+            'evictions': self.backend.evictions,
+            'entries': self.backend.size()
+        }
+
+
+class NullCache:
+    """Backend for QUERY_CACHE_BACKEND=none: never stores anything"""
+
+    evictions = 0
+
+    def get(self, key):
+        return False, None
+
+    def set(self, key, value):
+        pass
+
+    def clear(self):
+        pass
+
+    def size(self):
+        return 0
+
+
+def init_query_cache(app):
+    """Create the configured cache backend and attach it to the app"""
+    backend_name = app.config.get('QUERY_CACHE_BACKEND', os.getenv('QUERY_CACHE_BACKEND', 'memory')).lower()
+    ttl = int(app.config.get('QUERY_CACHE_TTL', os.getenv('QUERY_CACHE_TTL', '300')))
+
+    if backend_name == 'redis':
+        url = app.config.get('QUERY_CACHE_REDIS_URL', os.getenv('QUERY_CACHE_REDIS_URL', 'redis://localhost:6379/0'))
+        backend = RedisCache(url, ttl=ttl)
+    elif backend_name == 'none':
+        backend = NullCache()
+    else:
+        max_entries = int(app.config.get('QUERY_CACHE_MAX_ENTRIES', os.getenv('QUERY_CACHE_MAX_ENTRIES', '512')))
+        backend = MemoryCache(max_entries=max_entries, ttl=ttl)
+
+    app.extensions['query_cache'] = QueryCache(backend)
+    return app.extensions['query_cache']
+
+
+def get_query_cache():
+    return current_app.extensions['query_cache']
+
+
+def invalidate_query_cache():
+    """Drop cached results after a job write commits (no-op outside an app context)"""
+    if not has_app_context():
+        return
+    cache = current_app.extensions.get('query_cache')
+    if cache is None:
+        return
+    try:
+        cache.invalidate()
+    except Exception as e:
+        current_app.logger.warning(f"Query cache invalidation failed: {e}")
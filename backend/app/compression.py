@@ -0,0 +1,96 @@
+"""
+Negotiated response compression for the API
+Responses are compressed with brotli (when the package is installed) or gzip,
+whichever the client prefers in Accept-Encoding. Streamed responses are
+compressed chunk by chunk so they keep streaming.
+"""
+import gzip
+import os
+import zlib
+
+from flask import request
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+SUPPORTED_ENCODINGS = ['br', 'gzip'] if brotli is not None else ['gzip']
+
+
+def _gzip_stream(chunks, level):
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 31)  # wbits 31 = gzip container
+    for chunk in chunks:
+        data = compressor.compress(chunk)
+        # Sync flush so every chunk reaches the client without waiting for the next
+        data += compressor.flush(zlib.Z_SYNC_FLUSH)
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+def _brotli_stream(chunks, quality):
+    compressor = brotli.Compressor(quality=quality)
+    for chunk in chunks:
+        data = compressor.process(chunk) + compressor.flush()
+        if data:
+            yield data
+    yield compressor.finish()
+
+
+def _as_bytes(chunks):
+    for chunk in chunks:
+        yield chunk.encode('utf-8') if isinstance(chunk, str) else chunk
+
+
+def compress_response(response, config):
+    """Compress `response` in place if the client accepts a supported encoding"""
+    if request.method == 'HEAD' or response.status_code < 200 or response.status_code in (204, 304):
+        return response
+    if response.direct_passthrough or 'Content-Encoding' in response.headers:
+        return response
+    if not (response.mimetype or '').startswith(config['COMPRESS_MIMETYPES']):
+        return response
+
+    response.vary.add('Accept-Encoding')
+    encoding = request.accept_encodings.best_match(SUPPORTED_ENCODINGS)
+    if encoding is None:
+        return response
+
+    if response.is_streamed:
+        chunks = _as_bytes(response.response)
+        if encoding == 'br':
+            response.response = _brotli_stream(chunks, config['COMPRESS_BR_QUALITY'])
+        else:
+            response.response = _gzip_stream(chunks, config['COMPRESS_LEVEL'])
+        response.headers.pop('Content-Length', None)
+    else:
+        body = response.get_data()
+        if len(body) < config['COMPRESS_MIN_SIZE']:
+            return response
+        if encoding == 'br':
+            body = brotli.compress(body, quality=config['COMPRESS_BR_QUALITY'])
+        else:
+            body = gzip.compress(body, compresslevel=config['COMPRESS_LEVEL'])
+        response.set_data(body)
+
+    response.headers['Content-Encoding'] = encoding
+    return response
+
+
+def init_compression(app):
+    """Register the compression hook for /api responses"""
+    app.config.setdefault('COMPRESS_ENABLED', os.getenv('COMPRESS_ENABLED', 'True').lower() == 'true')
+    app.config.setdefault('COMPRESS_MIN_SIZE', int(os.getenv('COMPRESS_MIN_SIZE', '500')))
+    app.config.setdefault('COMPRESS_LEVEL', int(os.getenv('COMPRESS_LEVEL', '6')))
+    app.config.setdefault('COMPRESS_BR_QUALITY', int(os.getenv('COMPRESS_BR_QUALITY', '4')))
+    app.config.setdefault('COMPRESS_MIMETYPES', ('application/json', 'application/x-ndjson', 'text/'))
+
+    if not app.config['COMPRESS_ENABLED']:
+        return
+
+    @app.after_request
+    def compress(response):
+        if request.path.startswith('/api/'):
+            return compress_response(response, app.config)
+        return response
@@ -2,14 +2,17 @@
 Database configuration and utilities
 """
 from flask import current_app
-from app.models import db, Job
+from app.models import db, Job, job_tags
+from app.stats import refresh_job_stats
 from datetime import datetime, timedelta
 import random
+import re
 
 def init_db():
-    """Initialize the database with tables"""
+    """Initialize the database with tables, indexes and search triggers"""
     try:
-        db.create_all()
+        from app.migrations import run_migrations
+        run_migrations()
         print("✅ Database tables created successfully!")
         return True
     except Exception as e:
@@ -97,7 +100,10 @@ def seed_sample_data():
 def clear_all_jobs():
     """Clear all job data from database"""
     try:
+        # Bulk deletes skip ORM cascades, so clear tag links first
+        db.session.execute(job_tags.delete())
         num_deleted = Job.query.delete()
+        refresh_job_stats(commit=False)
         db.session.commit()
         print(f"🗑️ Deleted {num_deleted} jobs from database.")
         return num_deleted
@@ -146,4 +152,62 @@ def check_database_connection():
         return True
     except Exception as e:
         print(f"❌ Database connection failed: {e}")
-        return False
\ No newline at end of file
+        return False
+
+
+def get_hot_queries():
+    """The listing and stats queries the API runs most, as SQLAlchemy statements"""
+    from app.models import Tag
+    
+    def listing(**filters):
+        query, _ = Job.build_search_query(**filters)
+        return query.order_by(Job.posting_date.desc(), Job.id.desc()).limit(21).statement
+    
+    today = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
+    
+    return {
+        'jobs_listing': listing(),
+        'jobs_by_job_type': listing(job_type='Full-time'),
+        'jobs_by_experience_level': listing(experience_level='Senior'),
+        'jobs_by_remote_allowed': listing(remote_allowed=True),
+        'jobs_by_tag': listing(tags='Python'),
+        'stats_distinct_companies': db.select(Job.company).distinct(),
+        'stats_recent_jobs': db.select(db.func.count(Job.id)).where(Job.posting_date >= today),
+        'stats_scraped_jobs': db.select(db.func.count(Job.id)).where(Job.is_scraped == True),
+        'stats_jobs_by_type': db.select(Job.job_type, db.func.count(Job.id)).group_by(Job.job_type),
+        'tag_lookup': db.select(Tag.id).where(Tag.slug.in_(['python', 'sql'])),
+    }
+
+
+def _explain(statement):
+    """Return (plan lines, uses_index) for a statement on the current database"""
+    dialect = db.engine.dialect
+    sql = str(statement.compile(dialect=dialect, compile_kwargs={'literal_binds': True}))
+    
+    if dialect.name == 'postgresql':
+        # Tiny tables always favour sequential scans, so ask which index the planner would use
+        db.session.execute(db.text("SET LOCAL enable_seqscan = off"))
+        plan = db.session.execute(db.text(f"EXPLAIN (FORMAT TEXT) {sql}")).scalars().all()
+        db.session.rollback()
+        # With seq scans disabled the planner only picks one when no index fits,
+        # so any sequential scan of a jobs table means a missing index
+        seq_scans = [line for line in plan if re.search(r'Seq Scan on (jobs|tags|job_tags)\b', line)]
+        return plan, not seq_scans
+    
+    rows = db.session.execute(db.text(f"EXPLAIN QUERY PLAN {sql}")).all()
+    plan = [row[-1] for row in rows]
+    # Every jobs/tags/job_tags access must go through an index, never a bare table scan
+    full_scans = [
+        line for line in plan
+        if line.startswith('SCAN') and 'USING' not in line and 'job_search' not in line
+    ]
+    return plan, not full_scans
+
+
+def explain_hot_queries():
+    """EXPLAIN each hot query; returns {name: {'plan': [...], 'uses_index': bool}}"""
+    results = {}
+    for name, statement in get_hot_queries().items():
+        plan, uses_index = _explain(statement)
+        results[name] = {'plan': plan, 'uses_index': uses_index}
+    return results
@@ -0,0 +1,98 @@
+"""
+Database engine configuration
+Builds SQLALCHEMY_ENGINE_OPTIONS from environment variables and applies SQLite
+pragmas (WAL journal, busy timeout) on every new connection so API readers don't
+block on the scraper's writes.
+
+Environment Variables:
+    DB_POOL_SIZE              Connections kept open per process (default: 5)
+    DB_MAX_OVERFLOW           Extra connections allowed under load (default: 10)
+    DB_POOL_TIMEOUT           Seconds to wait for a free connection (default: 30)
+    DB_POOL_RECYCLE           Reconnect connections older than this many seconds (default: 1800)
+    DB_POOL_PRE_PING          Test connections before use to drop stale ones (default: True)
+    DB_STATEMENT_TIMEOUT_MS   PostgreSQL statement_timeout, 0 disables (default: 30000)
+    SQLITE_BUSY_TIMEOUT_MS    How long SQLite waits for a lock (default: 5000)
+    SQLITE_WAL                Use the WAL journal for SQLite files (default: True)
+"""
+import os
+
+from sqlalchemy import event, text
+
+
+def _env_bool(name, default):
+    return os.getenv(name, default).lower() == 'true'
+
+
+def build_engine_options(database_uri):
+    """Engine keyword arguments for create_engine, chosen per database"""
+    options = {
+        'pool_pre_ping': _env_bool('DB_POOL_PRE_PING', 'True'),
+        'pool_recycle': int(os.getenv('DB_POOL_RECYCLE', '1800')),
+    }
+
+    # In-memory SQLite uses a single static connection; pool sizing doesn't apply
+    if not (database_uri.startswith('sqlite') and ':memory:' in database_uri):
+        options['pool_size'] = int(os.getenv('DB_POOL_SIZE', '5'))
+        options['max_overflow'] = int(os.getenv('DB_MAX_OVERFLOW', '10'))
+        options['pool_timeout'] = int(os.getenv('DB_POOL_TIMEOUT', '30'))
+
+    statement_timeout = int(os.getenv('DB_STATEMENT_TIMEOUT_MS', '30000'))
+    if statement_timeout and database_uri.startswith('postgres'):
+        options['connect_args'] = {'options': f'-c statement_timeout={statement_timeout}'}
+
+    return options
+
+
+def register_sqlite_pragmas(engine, busy_timeout_ms=None, wal=None):
+    """Set busy_timeout (and WAL for file databases) whenever SQLite opens a connection"""
+    if busy_timeout_ms is None:
+        busy_timeout_ms = int(os.getenv('SQLITE_BUSY_TIMEOUT_MS', '5000'))
+    if wal is None:
+        wal = _env_bool('SQLITE_WAL', 'True')
+    use_wal = wal and engine.url.database not in (None, '', ':memory:')
+
+    @event.listens_for(engine, 'connect')
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute(f'PRAGMA busy_timeout = {int(busy_timeout_ms)}')
+        if use_wal:
+            cursor.execute('PRAGMA journal_mode = WAL')
+            # NORMAL is durable under WAL and avoids an fsync per commit
+            cursor.execute('PRAGMA synchronous = NORMAL')
+        cursor.close()
+
+
+def init_engine(app, db):
+    """Attach connection hooks to the app's engine (creating it doesn't connect)"""
+    with app.app_context():
+        if db.engine.dialect.name == 'sqlite':
+            register_sqlite_pragmas(db.engine)
+
+
+def get_pool_stats(db):
+    """Current pool usage plus the effective connection settings"""
+    engine = db.engine
+    pool = engine.pool
+    stats = {
+        'dialect': engine.dialect.name,
+        'pool_class': type(pool).__name__,
+        'status': pool.status(),
+    }
+
+    # QueuePool exposes live counters; static/null pools don't
+    for name in ('size', 'checkedin', 'checkedout', 'overflow'):
+        method = getattr(pool, name, None)
+        if callable(method):
+            stats[name] = method()
+    stats['max_overflow'] = getattr(pool, '_max_overflow', None)
+    stats['timeout'] = getattr(pool, '_timeout', None)
+    stats['recycle'] = getattr(pool, '_recycle', None)
+    stats['pre_ping'] = getattr(pool, '_pre_ping', None)
+
+    if engine.dialect.name == 'sqlite':
+        stats['journal_mode'] = db.session.execute(text('PRAGMA journal_mode')).scalar()
+        stats['busy_timeout_ms'] = db.session.execute(text('PRAGMA busy_timeout')).scalar()
+    elif engine.dialect.name == 'postgresql':
+        stats['statement_timeout'] = db.session.execute(text('SHOW statement_timeout')).scalar()
+
+    return stats
@@ -0,0 +1,130 @@
+"""
+Batched ingestion of scraped jobs
+Shared by the scrape queue, scrape_jobs.py and run_scraper.py. Duplicates are found
+with one bulk lookup per batch on the unique Job.dedupe_key instead of one query per job.
+"""
+import hashlib
+from datetime import datetime, UTC
+
+from app.models import db, Job, Tag, job_tags, split_tags
+from app.stats import record_job_changes
+
+# Fields refreshed on an existing job when a scrape finds different values
+UPDATABLE_FIELDS = (
+    'location', 'job_type', 'description', 'salary_range',
+    'experience_level', 'remote_allowed', 'source_url', 'tags'
+)
+
+# Columns written for new jobs; every row carries all of them so inserts batch cleanly
+INSERT_FIELDS = (
+    'title', 'company', 'location', 'posting_date', 'job_type', 'tags', 'description',
+    'salary_range', 'experience_level', 'remote_allowed', 'source_url', 'is_scraped'
+)
+
+def make_dedupe_key(title, company):
+    """Stable key for a scraped job: case-insensitive title + company"""
+    raw = f"{(title or '').strip().lower()}|{(company or '').strip().lower()}"
+    return hashlib.sha1(raw.encode('utf-8')).hexdigest()
+
+def _normalized_value(field, value):
+    """Compare tags by content, not formatting"""
+    if field == 'tags':
+        return [Tag.slugify(tag) for tag in split_tags(value)]
+    return value
+
+def _insert_row(job_data, key, tags):
+    """Column values for a new job, with model defaults filled in"""
+    row = {field: job_data.get(field) for field in INSERT_FIELDS}
+    row['posting_date'] = row['posting_date'] or datetime.now(UTC)
+    row['job_type'] = row['job_type'] or 'Full-time'
+    row['location'] = row['location'] or 'Remote'
+    row['remote_allowed'] = bool(row['remote_allowed'])
+    row['is_scraped'] = True if row['is_scraped'] is None else row['is_scraped']
+    row['tags'] = ', '.join(tag.name for tag in tags) or None
+    row['dedupe_key'] = key
+    return row
+
+def ingest_jobs(jobs, batch_size=500):
+    """Insert new scraped jobs and refresh changed ones in a handful of statements
+
+    Returns {'saved': n, 'updated': n, 'skipped': n}. Must run inside an app context.
+    """
+    counts = {'saved': 0, 'updated': 0, 'skipped': 0}
+    if not jobs:
+        return counts
+
+    # Drop duplicates within the batch itself, keeping the first occurrence
+    pending = {}
+    for job_data in jobs:
+        if not job_data.get('title') or not job_data.get('company'):
+            counts['skipped'] += 1
+            continue
+        key = make_dedupe_key(job_data['title'], job_data['company'])
+        if key in pending:
+            counts['skipped'] += 1
+            continue
+        pending[key] = job_data
+
+    keys = list(pending)
+    try:
+        # Resolve every tag up front in one query; later lookups hit the session cache
+        all_tags = [tag for job_data in pending.values() for tag in split_tags(job_data.get('tags'))]
+        Tag.get_or_create_many(all_tags)
+        db.session.flush()
+
+        for start in range(0, len(keys), batch_size):
+            chunk = keys[start:start + batch_size]
+            existing = {
+                job.dedupe_key: job
+                for job in Job.query.filter(Job.dedupe_key.in_(chunk))
+            }
+
+            new_rows = []
+            new_tags = {}
+            for key in chunk:
+                job_data = pending[key]
+                job = existing.get(key)
+
+                if job is None:
+                    tags = Tag.get_or_create_many(split_tags(job_data.get('tags')))
+                    new_rows.append(_insert_row(job_data, key, tags))
+                    new_tags[key] = tags
+                    continue
+
+                changed = False
+                for field in UPDATABLE_FIELDS:
+                    if field not in job_data:
+                        continue
+                    if _normalized_value(field, getattr(job, field)) != _normalized_value(field, job_data[field]):
+                        setattr(job, field, job_data[field])
+                        changed = True
+
+                counts['updated' if changed else 'skipped'] += 1
+
+            if new_rows:
+                # One executemany for the jobs, one id lookup, one executemany for tag links
+                db.session.execute(db.insert(Job), new_rows)
+                new_ids = db.session.execute(
+                    db.select(Job.dedupe_key, Job.id).where(Job.dedupe_key.in_(list(new_tags)))
+                ).all()
+                links = [
+                    {'job_id': job_id, 'tag_id': tag.id}
+                    for key, job_id in new_ids
+                    for tag in new_tags[key]
+                ]
+                if links:
+                    db.session.execute(job_tags.insert(), links)
+                # Core inserts skip the ORM flush hook, so update the counters here
+                record_job_changes(
+                    db.session,
+                    added=[(row['company'], row['posting_date']) for row in new_rows]
+                )
+                counts['saved'] += len(new_rows)
+
+        db.session.commit()
+
+    except Exception:
+        db.session.rollback()
+        raise
+
+    return counts
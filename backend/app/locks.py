@@ -0,0 +1,96 @@
+"""
+Cross-process named locks on the application database
+PostgreSQL uses a session-level advisory lock held on a dedicated connection.
+Other databases (SQLite) claim a row in scheduler_locks with an expiry, so a
+holder that crashed can't keep the lock forever.
+
+    with database_lock('scrape:actuarylist', ttl_seconds=1800) as acquired:
+        if acquired:
+            ...
+
+Must run inside an app context.
+"""
+import hashlib
+import os
+import socket
+import uuid
+from contextlib import contextmanager
+from datetime import datetime, timedelta, UTC
+
+from sqlalchemy.exc import IntegrityError
+
+from app.models import db, SchedulerLock
+
+# Identifies this process in lock rows, for whoever has to debug a stuck lock
+LOCK_OWNER = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+
+def _utcnow():
+    # Lock rows hold naive UTC so SQLite compares them consistently
+    return datetime.now(UTC).replace(tzinfo=None)
+
+
+def advisory_key(name):
+    """Signed 64-bit key for pg_try_advisory_lock derived from the lock name"""
+    return int.from_bytes(hashlib.sha1(name.encode('utf-8')).digest()[:8], 'big', signed=True)
+
+
+def _try_row_lock(name, ttl_seconds):
+    now = _utcnow()
+    expires_at = now + timedelta(seconds=ttl_seconds)
+    try:
+        # Take over an expired row, or create it; either statement is atomic on its own
+        taken = db.session.execute(
+            db.update(SchedulerLock)
+            .where(SchedulerLock.name == name, SchedulerLock.expires_at < now)
+            .values(owner=LOCK_OWNER, acquired_at=now, expires_at=expires_at)
+        ).rowcount
+        if not taken:
+            db.session.execute(db.insert(SchedulerLock).values(
+                name=name, owner=LOCK_OWNER, acquired_at=now, expires_at=expires_at
+            ))
+        db.session.commit()
+        return True
+    except IntegrityError:
+        db.session.rollback()
+        return False
+
+
+def _release_row_lock(name):
+    try:
+        db.session.execute(
+            db.delete(SchedulerLock).where(SchedulerLock.name == name, SchedulerLock.owner == LOCK_OWNER)
+        )
+        db.session.commit()
+    except Exception as e:
+        db.session.rollback()
+        print(f"⚠️ Could not release lock {name}: {e}")
+
+
+@contextmanager
+def database_lock(name, ttl_seconds=1800):
+    """Try once to take `name`; yields True if this process now holds it, False if someone else does
+
+    `ttl_seconds` only applies to the lock row: advisory locks end with their
+    connection, so they need no expiry.
+    """
+    if db.engine.dialect.name == 'postgresql':
+        connection = db.engine.connect()
+        key = advisory_key(name)
+        try:
+            acquired = connection.execute(db.text('SELECT pg_try_advisory_lock(:key)'), {'key': key}).scalar()
+            try:
+                yield bool(acquired)
+            finally:
+                if acquired:
+                    connection.execute(db.text('SELECT pg_advisory_unlock(:key)'), {'key': key})
+        finally:
+            connection.close()
+        return
+
+    acquired = _try_row_lock(name, ttl_seconds)
+    try:
+        yield acquired
+    finally:
+        if acquired:
+            _release_row_lock(name)
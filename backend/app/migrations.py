@@ -0,0 +1,110 @@
+"""
+Idempotent schema migrations for things db.create_all() can't express
+Every step is safe to run repeatedly against new and existing databases
+"""
+from sqlalchemy import inspect
+
+from app.models import db, Job, JobStats, ScrapeRun, job_tags
+from app.search import ensure_search_index
+from app.stats import refresh_job_stats
+
+def add_missing_columns(model, column_names):
+    """ALTER TABLE ... ADD COLUMN for model columns an older database lacks"""
+    table = model.__table__
+    existing = {column['name'] for column in inspect(db.engine).get_columns(table.name)}
+    
+    for name in column_names:
+        if name in existing:
+            continue
+        column = table.c[name]
+        column_type = column.type.compile(dialect=db.engine.dialect)
+        default = ''
+        if not column.nullable and column.default is not None:
+            default = f" NOT NULL DEFAULT {column.default.arg!r}"
+        db.session.execute(db.text(f"ALTER TABLE {table.name} ADD COLUMN {name} {column_type}{default}"))
+        print(f"✅ Added column {table.name}.{name}")
+    db.session.commit()
+
+def add_new_columns():
+    """Columns added after the first release; must run before anything queries them"""
+    add_missing_columns(Job, ['dedupe_key'])
+    add_missing_columns(ScrapeRun, ['jobs_updated', 'jobs_unchanged', 'source'])
+    add_missing_columns(JobStats, ['version', 'last_modified'])
+
+def add_dedupe_keys(batch_size=500):
+    """Backfill Job.dedupe_key for scraped jobs and create its unique index"""
+    from app.ingest import make_dedupe_key
+    
+    # Oldest job wins when earlier scrapes left duplicates behind
+    taken = {key for (key,) in db.session.query(Job.dedupe_key).filter(Job.dedupe_key.isnot(None))}
+    last_id = 0
+    backfilled = 0
+    while True:
+        jobs = Job.query.filter(
+            Job.is_scraped == True,
+            Job.dedupe_key.is_(None),
+            Job.id > last_id
+        ).order_by(Job.id).limit(batch_size).all()
+        if not jobs:
+            break
+        for job in jobs:
+            key = make_dedupe_key(job.title, job.company)
+            if key not in taken:
+                job.dedupe_key = key
+                taken.add(key)
+                backfilled += 1
+        db.session.commit()
+        last_id = jobs[-1].id
+    
+    if backfilled:
+        print(f"✅ Backfilled dedupe keys for {backfilled} scraped jobs")
+
+def backfill_job_tags(batch_size=500):
+    """Populate tags/job_tags from the legacy comma-separated Job.tags column"""
+    untagged = Job.query.filter(
+        Job.tags.isnot(None),
+        Job.tags != '',
+        ~Job.id.in_(db.select(job_tags.c.job_id))
+    ).order_by(Job.id)
+    
+    migrated = 0
+    last_id = 0
+    while True:
+        jobs = untagged.filter(Job.id > last_id).limit(batch_size).all()
+        if not jobs:
+            break
+        for job in jobs:
+            # Re-assigning runs the validator that writes through to the tag table
+            job.tags = job.tags
+        db.session.commit()
+        migrated += len(jobs)
+        last_id = jobs[-1].id
+    
+    if migrated:
+        print(f"✅ Migrated tags for {migrated} jobs")
+
+def create_indexes():
+    """Create any model-declared indexes missing from existing tables"""
+    for table in db.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(db.engine, checkfirst=True)
+    print("✅ Indexes created/verified")
+
+# Ordered (name, step) pairs; each step runs inside an app context
+MIGRATIONS = [
+    ('new_columns', add_new_columns),
+    ('full_text_search', ensure_search_index),
+    ('normalized_tags', backfill_job_tags),
+    ('dedupe_keys', add_dedupe_keys),
+    ('indexes', create_indexes),
+    ('job_stats', refresh_job_stats),
+]
+
+def run_migrations():
+    """Create missing tables, then apply every migration step in order"""
+    db.create_all()
+    print("✅ Database tables created/verified")
+    
+    for name, step in MIGRATIONS:
+        print(f"🔄 Applying migration: {name}")
+        step()
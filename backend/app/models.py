@@ -1,17 +1,113 @@
 """
 Database models for the Job Board application
 """
+import uuid
 from datetime import datetime, UTC
 from flask_sqlalchemy import SQLAlchemy
 from marshmallow import Schema, fields, post_load
+from sqlalchemy import event
+from sqlalchemy.orm import Session, validates
 
 db = SQLAlchemy()
 
+def split_tags(tags):
+    """Normalize a comma-separated string or list of tags into a clean list"""
+    if not tags:
+        return []
+    if isinstance(tags, str):
+        tags = tags.split(',')
+    return [tag.strip()[:100] for tag in tags if tag and tag.strip()]
+
+# Association between jobs and normalized tags; (tag_id, job_id) serves tag filters
+job_tags = db.Table(
+    'job_tags',
+    db.Column('job_id', db.Integer, db.ForeignKey('jobs.id', ondelete='CASCADE'), primary_key=True),
+    db.Column('tag_id', db.Integer, db.ForeignKey('tags.id', ondelete='CASCADE'), primary_key=True),
+    db.Index('ix_job_tags_tag_id_job_id', 'tag_id', 'job_id')
+)
+
+class Tag(db.Model):
+    """Normalized job tag, matched case-insensitively through its slug"""
+    
+    __tablename__ = 'tags'
+    
+    id = db.Column(db.Integer, primary_key=True)
+    name = db.Column(db.String(100), nullable=False)
+    slug = db.Column(db.String(100), nullable=False, unique=True, index=True)
+    
+    def __repr__(self):
+        return f'<Tag {self.id}: {self.name}>'
+    
+    @staticmethod
+    def slugify(name):
+        """Lookup key for a tag name"""
+        return name.strip().lower()
+    
+    @staticmethod
+    def _session_cache():
+        """Tags already resolved in the current transaction, keyed by slug"""
+        return db.session.info.setdefault('tag_cache', {})
+    
+    @classmethod
+    def get_or_create_many(cls, names):
+        """Resolve tag names to Tag rows in one query, creating any that are missing"""
+        cache = cls._session_cache()
+        
+        display_names = {}
+        for name in split_tags(names):
+            display_names.setdefault(cls.slugify(name), name)
+        
+        missing = [slug for slug in display_names if slug not in cache]
+        if missing:
+            for tag in cls.query.filter(cls.slug.in_(missing)):
+                cache[tag.slug] = tag
+            for slug in missing:
+                if slug not in cache:
+                    tag = cls(name=display_names[slug], slug=slug)
+                    db.session.add(tag)
+                    cache[slug] = tag
+        
+        return [cache[slug] for slug in display_names]
+
+@event.listens_for(Session, 'after_transaction_end')
+def _clear_tag_cache(session, transaction):
+    """Drop cached Tag rows once the outermost transaction ends"""
+    if transaction.parent is None:
+        session.info.pop('tag_cache', None)
+
+@event.listens_for(Session, 'after_flush')
+def _track_job_counts(session, flush_context):
+    """Keep the materialized job_stats row in step with ORM inserts, updates and deletes"""
+    from app.stats import record_flushed_jobs
+    record_flushed_jobs(session)
+
+@event.listens_for(Session, 'after_commit')
+def _invalidate_query_cache(session):
+    """Drop cached listing results once a transaction that wrote jobs commits"""
+    if session.info.pop('jobs_changed', False):
+        from app.cache import invalidate_query_cache
+        invalidate_query_cache()
+
+@event.listens_for(Session, 'after_rollback')
+def _forget_job_changes(session):
+    session.info.pop('jobs_changed', None)
+
 class Job(db.Model):
     """Job model representing a job posting"""
     
     __tablename__ = 'jobs'
     
+    # Indexes matching the hot query shapes: listings sort by (posting_date, id) with
+    # optional equality filters, stats count/group by company, is_scraped and job_type
+    __table_args__ = (
+        db.Index('ix_jobs_posting_date_id', 'posting_date', 'id'),
+        db.Index('ix_jobs_job_type_posting_date', 'job_type', 'posting_date', 'id'),
+        db.Index('ix_jobs_experience_level_posting_date', 'experience_level', 'posting_date', 'id'),
+        db.Index('ix_jobs_remote_allowed_posting_date', 'remote_allowed', 'posting_date', 'id'),
+        db.Index('ix_jobs_is_scraped', 'is_scraped'),
+        db.Index('ix_jobs_company', 'company'),
+    )
+    
     # Primary key
     id = db.Column(db.Integer, primary_key=True)
     
@@ -27,7 +123,8 @@ class Job(db.Model):
     
     # Job details
     job_type = db.Column(db.String(50), nullable=False, default='Full-time')
-    tags = db.Column(db.Text)  # Stored as comma-separated string
+    tags = db.Column(db.Text)  # Comma-separated copy of tag_objects, kept for legacy readers
+    tag_objects = db.relationship('Tag', secondary=job_tags, order_by='Tag.name', lazy='selectin')
     
     # Optional fields
     description = db.Column(db.Text)
@@ -38,25 +135,28 @@ class Job(db.Model):
     # Source tracking (for scraped jobs)
     source_url = db.Column(db.String(500))
     is_scraped = db.Column(db.Boolean, default=False)
+    dedupe_key = db.Column(db.String(40), unique=True, index=True)  # Set by app.ingest for scraped jobs
     
     def __repr__(self):
         return f'<Job {self.id}: {self.title} at {self.company}>'
     
+    @validates('tags')
+    def _sync_tag_objects(self, key, value):
+        """Write tags through to the normalized tag table whenever they're assigned"""
+        self.tag_objects = Tag.get_or_create_many(split_tags(value))
+        return ', '.join(tag.name for tag in self.tag_objects) or None
+    
     def get_tags_list(self):
-        """Convert comma-separated tags string to list"""
-        if not self.tags:
-            return []
-        return [tag.strip() for tag in self.tags.split(',') if tag.strip()]
+        """Get tag names from the normalized tag table"""
+        return [tag.name for tag in self.tag_objects]
     
     def set_tags_from_list(self, tags_list):
-        """Convert list of tags to comma-separated string"""
-        if tags_list:
-            self.tags = ', '.join([tag.strip() for tag in tags_list if tag.strip()])
-        else:
-            self.tags = None
+        """Replace this job's tags with the given list"""
+        self.tags = tags_list
     
     def to_dict(self):
         """Convert job instance to dictionary"""
+        tags_list = self.get_tags_list()
         return {
             'id': self.id,
             'title': self.title,
@@ -66,8 +166,8 @@ class Job(db.Model):
             'created_at': self.created_at.isoformat() if self.created_at else None,
             'updated_at': self.updated_at.isoformat() if self.updated_at else None,
             'job_type': self.job_type,
-            'tags': self.tags,  # Keep as string for API consistency
-            'tags_list': self.get_tags_list(),  # Provide list version too
+            'tags': ', '.join(tags_list) if tags_list else None,  # Keep as string for API consistency
+            'tags_list': tags_list,  # Provide list version too
             'description': self.description,
             'salary_range': self.salary_range,
             'experience_level': self.experience_level,
@@ -122,20 +222,21 @@ class Job(db.Model):
         self.updated_at = datetime.now(UTC)
     
     @staticmethod
-    def search_jobs(search_term=None, job_type=None, location=None, 
-                   experience_level=None, remote_allowed=None, tags=None):
-        """Search jobs with multiple filters"""
+    def build_search_query(search_term=None, job_type=None, location=None,
+                           experience_level=None, remote_allowed=None, tags=None,
+                           tag_mode='all'):
+        """Build an unordered, filtered job query
+
+        Returns (query, rank): rank is a (expression, descending) pair for relevance
+        ordering when a full-text search term is given, otherwise None.
+        """
+        from app.search import apply_search
+        
         query = Job.query
+        rank = None
         
         if search_term:
-            search_pattern = f"%{search_term}%"
-            query = query.filter(
-                db.or_(
-                    Job.title.ilike(search_pattern),
-                    Job.company.ilike(search_pattern),
-                    Job.description.ilike(search_pattern)
-                )
-            )
+            query, rank = apply_search(query, search_term)
         
         if job_type and job_type.lower() != 'all':
             query = query.filter(Job.job_type == job_type)
@@ -153,15 +254,207 @@ class Job(db.Model):
             query = query.filter(Job.remote_allowed == remote_allowed)
         
         if tags:
-            if isinstance(tags, str):
-                tags = [tag.strip() for tag in tags.split(',')]
-            for tag in tags:
-                if tag.strip():
-                    tag_pattern = f"%{tag.strip()}%"
-                    query = query.filter(Job.tags.ilike(tag_pattern))
+            slugs = list({Tag.slugify(tag) for tag in split_tags(tags)})
+            if slugs:
+                # Resolved via the tags.slug and job_tags (tag_id, job_id) indexes
+                matching_jobs = (
+                    db.select(job_tags.c.job_id)
+                    .join(Tag, Tag.id == job_tags.c.tag_id)
+                    .where(Tag.slug.in_(slugs))
+                )
+                if tag_mode != 'any':
+                    # Every tag must match: intersect by counting matches per job
+                    matching_jobs = matching_jobs.group_by(job_tags.c.job_id).having(
+                        db.func.count(job_tags.c.tag_id) == len(slugs)
+                    )
+                query = query.filter(Job.id.in_(matching_jobs))
+        
+        return query, rank
+    
+    @staticmethod
+    def search_jobs(search_term=None, job_type=None, location=None, 
+                   experience_level=None, remote_allowed=None, tags=None,
+                   tag_mode='all'):
+        """Search jobs with multiple filters, most relevant first when searching"""
+        query, rank = Job.build_search_query(
+            search_term=search_term,
+            job_type=job_type,
+            location=location,
+            experience_level=experience_level,
+            remote_allowed=remote_allowed,
+            tags=tags,
+            tag_mode=tag_mode
+        )
+        
+        if rank:
+            rank_expression, descending = rank
+            return query.order_by(
+                rank_expression.desc() if descending else rank_expression.asc(),
+                Job.posting_date.desc()
+            )
         
         return query.order_by(Job.posting_date.desc())
 
+class ScrapeRun(db.Model):
+    """A queued or finished scraper run, polled through GET /api/scrape/<run_id>"""
+    
+    __tablename__ = 'scrape_runs'
+    
+    id = db.Column(db.String(32), primary_key=True, default=lambda: uuid.uuid4().hex)
+    status = db.Column(db.String(20), nullable=False, default='queued', index=True)  # queued, running, completed, failed
+    trigger = db.Column(db.String(20), nullable=False, default='api')  # api or schedule
+    source = db.Column(db.String(200), nullable=False, default='actuarylist')  # comma-separated source names
+    progress = db.Column(db.String(200))
+    
+    # Counts
+    jobs_found = db.Column(db.Integer, nullable=False, default=0)
+    jobs_saved = db.Column(db.Integer, nullable=False, default=0)
+    jobs_updated = db.Column(db.Integer, nullable=False, default=0)
+    jobs_skipped = db.Column(db.Integer, nullable=False, default=0)
+    jobs_unchanged = db.Column(db.Integer, nullable=False, default=0)  # listings the crawl state says haven't changed
+    error = db.Column(db.Text)
+    
+    # Timing
+    created_at = db.Column(db.DateTime, nullable=False, default=lambda: datetime.now(UTC))
+    started_at = db.Column(db.DateTime)
+    finished_at = db.Column(db.DateTime)
+    
+    def __repr__(self):
+        return f'<ScrapeRun {self.id}: {self.status}>'
+    
+    @property
+    def is_finished(self):
+        return self.status in ('completed', 'failed')
+    
+    def to_dict(self):
+        """Convert run to dictionary"""
+        duration = None
+        if self.started_at:
+            # SQLite hands back naive datetimes, so compare without tzinfo
+            end = (self.finished_at or datetime.now(UTC)).replace(tzinfo=None)
+            duration = round((end - self.started_at.replace(tzinfo=None)).total_seconds(), 2)
+        
+        return {
+            'run_id': self.id,
+            'status': self.status,
+            'trigger': self.trigger,
+            'source': self.source,
+            'progress': self.progress,
+            'jobs_found': self.jobs_found,
+            'jobs_saved': self.jobs_saved,
+            'jobs_updated': self.jobs_updated,
+            'jobs_skipped': self.jobs_skipped,
+            'jobs_unchanged': self.jobs_unchanged,
+            'error': self.error,
+            'created_at': self.created_at.isoformat() if self.created_at else None,
+            'started_at': self.started_at.isoformat() if self.started_at else None,
+            'finished_at': self.finished_at.isoformat() if self.finished_at else None,
+            'duration_seconds': duration
+        }
+
+class ScrapeSchedule(db.Model):
+    """Scheduler bookkeeping for one source: when it runs next and how the last run went"""
+    
+    __tablename__ = 'scrape_schedules'
+    
+    source = db.Column(db.String(50), primary_key=True)
+    spec = db.Column(db.String(100))  # interval or cron expression it was scheduled with
+    next_run_at = db.Column(db.DateTime)
+    last_run_id = db.Column(db.String(32))
+    last_status = db.Column(db.String(20))
+    last_finished_at = db.Column(db.DateTime)
+    consecutive_failures = db.Column(db.Integer, nullable=False, default=0)
+    
+    def __repr__(self):
+        return f'<ScrapeSchedule {self.source}: next {self.next_run_at}>'
+    
+    def to_dict(self):
+        """Convert schedule to dictionary"""
+        return {
+            'source': self.source,
+            'spec': self.spec,
+            'next_run_at': self.next_run_at.isoformat() if self.next_run_at else None,
+            'last_run_id': self.last_run_id,
+            'last_status': self.last_status,
+            'last_finished_at': self.last_finished_at.isoformat() if self.last_finished_at else None,
+            'consecutive_failures': self.consecutive_failures
+        }
+
+class SchedulerLock(db.Model):
+    """Named lock row for databases without advisory locks; expires so a crashed holder can't wedge it"""
+    
+    __tablename__ = 'scheduler_locks'
+    
+    name = db.Column(db.String(100), primary_key=True)
+    owner = db.Column(db.String(100), nullable=False)
+    acquired_at = db.Column(db.DateTime, nullable=False)
+    expires_at = db.Column(db.DateTime, nullable=False)
+    
+    def __repr__(self):
+        return f'<SchedulerLock {self.name}: {self.owner}>'
+
+class CrawlState(db.Model):
+    """What the scraper last saw at a URL, for incremental crawls
+
+    Pages are keyed by their URL and keep the ETag / Last-Modified validators
+    for conditional requests. Listings are keyed as 'listing:<dedupe_key>' and
+    only carry the hash of their scraped fields.
+    """
+    
+    __tablename__ = 'crawl_state'
+    
+    url = db.Column(db.String(500), primary_key=True)
+    etag = db.Column(db.String(200))
+    last_modified = db.Column(db.String(100))  # header value as sent, echoed back in If-Modified-Since
+    content_hash = db.Column(db.String(64))  # sha256 of the body or of the listing's fields
+    status_code = db.Column(db.Integer)
+    checked_at = db.Column(db.DateTime)
+    changed_at = db.Column(db.DateTime)
+    
+    def __repr__(self):
+        return f'<CrawlState {self.url}>'
+    
+    def to_dict(self):
+        """Convert crawl state to dictionary"""
+        return {
+            'url': self.url,
+            'etag': self.etag,
+            'last_modified': self.last_modified,
+            'content_hash': self.content_hash,
+            'status_code': self.status_code,
+            'checked_at': self.checked_at.isoformat() if self.checked_at else None,
+            'changed_at': self.changed_at.isoformat() if self.changed_at else None
+        }
+
+class JobStats(db.Model):
+    """Materialized job counters and the jobs table version stamp (a single row)
+
+    `version` and `last_modified` change on every job write and back the ETag /
+    Last-Modified headers, so conditional requests never read the jobs table.
+    """
+    
+    __tablename__ = 'job_stats'
+    
+    id = db.Column(db.Integer, primary_key=True)
+    total = db.Column(db.Integer, nullable=False, default=0)
+    companies = db.Column(db.Integer, nullable=False, default=0)
+    recent = db.Column(db.Integer, nullable=False, default=0)  # jobs posted since recent_since
+    recent_since = db.Column(db.Date)
+    refreshed_at = db.Column(db.DateTime)
+    version = db.Column(db.Integer, nullable=False, default=0)
+    last_modified = db.Column(db.DateTime)
+    
+    def __repr__(self):
+        return f'<JobStats total={self.total}>'
+    
+    def to_dict(self):
+        """Convert stats to the /api/jobs/stats payload"""
+        return {
+            'total': self.total,
+            'recent': self.recent,
+            'companies': self.companies
+        }
+
 class JobSchema(Schema):
     """Schema for serializing/deserializing Job objects"""
     
@@ -207,7 +500,8 @@ class JobService:
             location=filters.get('location'),
             experience_level=filters.get('experience_level'),
             remote_allowed=filters.get('remote_allowed'),
-            tags=filters.get('tags')
+            tags=filters.get('tags'),
+            tag_mode=filters.get('tag_mode', 'all')
         ).all()
     
     @staticmethod
@@ -247,18 +541,9 @@ class JobService:
     
     @staticmethod
     def get_job_stats():
-        """Get job statistics"""
-        total_jobs = Job.query.count()
-        recent_jobs = Job.query.filter(
-            Job.posting_date >= datetime.now(UTC).replace(hour=0, minute=0, second=0, microsecond=0)
-        ).count()
-        companies = db.session.query(Job.company).distinct().count()
-        
-        return {
-            'total': total_jobs,
-            'recent': recent_jobs,
-            'companies': companies
-        }
+        """Get job statistics from the materialized job_stats row"""
+        from app.stats import get_job_stats
+        return get_job_stats()
     
     @staticmethod
     def get_unique_job_types():
@@ -266,6 +551,47 @@ class JobService:
         result = db.session.query(Job.job_type).distinct().all()
         return [row[0] for row in result if row[0]]
     
+    @staticmethod
+    def get_facets(filters, top_tags=10):
+        """Facet counts for a filter set, computed with GROUP BY in the database
+
+        Each dimension ignores its own filter so the counts show what selecting
+        another value would return; top tags are computed within the full filter set.
+        """
+        def filtered_ids(exclude=None):
+            query_filters = {key: value for key, value in filters.items() if key != exclude}
+            query, _ = Job.build_search_query(**query_filters)
+            return query.with_entities(Job.id)
+        
+        def counts(column, exclude):
+            rows = (
+                db.session.query(column, db.func.count(Job.id))
+                .filter(Job.id.in_(filtered_ids(exclude)))
+                .group_by(column)
+                .order_by(db.func.count(Job.id).desc())
+                .all()
+            )
+            return [{'value': value, 'count': count} for value, count in rows if value is not None]
+        
+        matching = filtered_ids()
+        tag_rows = (
+            db.session.query(Tag.name, db.func.count(job_tags.c.job_id))
+            .join(job_tags, job_tags.c.tag_id == Tag.id)
+            .filter(job_tags.c.job_id.in_(matching))
+            .group_by(Tag.id, Tag.name)
+            .order_by(db.func.count(job_tags.c.job_id).desc(), Tag.name)
+            .limit(top_tags)
+            .all()
+        )
+        
+        return {
+            'total': db.session.query(db.func.count(Job.id)).filter(Job.id.in_(matching)).scalar(),
+            'job_type': counts(Job.job_type, 'job_type'),
+            'experience_level': counts(Job.experience_level, 'experience_level'),
+            'remote_allowed': counts(Job.remote_allowed, 'remote_allowed'),
+            'tags': [{'value': name, 'count': count} for name, count in tag_rows]
+        }
+    
     @staticmethod
     def get_unique_experience_levels():
         """Get list of unique experience levels"""
@@ -1,18 +1,26 @@
-from flask import Blueprint, request, jsonify, current_app
+from flask import Blueprint, request, jsonify, current_app, make_response, stream_with_context, g
 from flask_cors import cross_origin
 from datetime import datetime, UTC
+from functools import wraps
 import os
 import sys
 
+from app.cache import get_query_cache
+from app.serializers import LISTING_COLUMNS, serialize_job_rows, stream_job_rows
+from app.utils import paginate_keyset
+
 # CREATE THE BLUEPRINT FIRST - This must be at the top!
 api = Blueprint('api', __name__, url_prefix='/api')
 
 # Helper functions for responses
-def success_response(data, status_code=200):
-    return jsonify({
+def success_response(data, status_code=200, **meta):
+    payload = {
         'success': True,
         'data': data
-    }), status_code
+    }
+    # Extra envelope fields such as pagination cursors
+    payload.update(meta)
+    return jsonify(payload), status_code
 
 def error_response(message, status_code=400):
     return jsonify({
@@ -20,59 +28,181 @@ def error_response(message, status_code=400):
         'error': message
     }), status_code
 
+def conditional_on_job_version(view):
+    """Answer conditional GETs from the jobs table version stamp
+
+    Responses carry an ETag and Last-Modified taken from the job_stats row; a
+    matching If-None-Match / If-Modified-Since gets a 304 before the view runs,
+    so unchanged data costs one primary-key lookup.
+    """
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        from app.stats import get_job_version
+        
+        version, last_modified = get_job_version()
+        g.job_version = version  # reused as part of query cache keys
+        etag = f"jobs-{version}"
+        if last_modified is not None:
+            # SQLite returns naive datetimes; HTTP dates have whole-second precision
+            last_modified = last_modified.replace(tzinfo=UTC, microsecond=0)
+        
+        if request.if_none_match:
+            not_modified = request.if_none_match.contains_weak(etag)
+        else:
+            since = request.if_modified_since
+            not_modified = bool(since and last_modified and last_modified <= since)
+        
+        if not_modified:
+            response = current_app.response_class(status=304)
+        else:
+            response = make_response(view(*args, **kwargs))
+            if response.status_code != 200:
+                return response
+        
+        response.set_etag(etag, weak=True)
+        response.last_modified = last_modified
+        # Let browsers keep the body but always revalidate
+        response.headers['Cache-Control'] = 'no-cache'
+        return response
+    
+    return wrapper
+
+def job_filters_from_request():
+    """Read the listing filter query parameters as Job.build_search_query kwargs"""
+    return {
+        'search_term': request.args.get('search', '').strip(),
+        'job_type': request.args.get('job_type', '').strip(),
+        'location': request.args.get('location', '').strip(),
+        'experience_level': request.args.get('experience_level', '').strip(),
+        'remote_allowed': request.args.get('remote_allowed', '').strip() or None,
+        'tags': request.args.get('tags', '').strip() or None,
+        'tag_mode': request.args.get('tag_mode', 'all').strip().lower()
+    }
+
 @api.route('/jobs', methods=['GET'])
 @cross_origin()
+@conditional_on_job_version
 def get_jobs():
     """Get all jobs with optional filtering"""
     try:
         from app.models import Job, db
         
-        # Get query parameters for filtering
-        search = request.args.get('search', '').strip()
-        job_type = request.args.get('job_type', '').strip()
-        location = request.args.get('location', '').strip()
-        experience_level = request.args.get('experience_level', '').strip()
-        remote_allowed = request.args.get('remote_allowed', '').strip()
-        
-        # Start with base query
-        query = Job.query
-        
-        # Apply filters
-        if search:
-            search_pattern = f"%{search}%"
-            query = query.filter(
-                db.or_(
-                    Job.title.ilike(search_pattern),
-                    Job.company.ilike(search_pattern),
-                    Job.description.ilike(search_pattern)
+        cursor = request.args.get('cursor', '').strip() or None
+        
+        # Page size, clamped to the configured maximum
+        try:
+            limit = int(request.args.get('limit', current_app.config['JOBS_PER_PAGE']))
+        except ValueError:
+            return error_response("limit must be an integer", 400)
+        limit = max(1, min(limit, current_app.config['MAX_JOBS_PER_PAGE']))
+        
+        include = {part.strip() for part in request.args.get('include', '').split(',')}
+        filters = job_filters_from_request()
+        
+        def build_page():
+            # Filtered query (full-text ranked when searching) over plain column
+            # tuples; ORM objects and the tag relationship are never loaded
+            query, rank = Job.build_search_query(**filters)
+            query = query.with_entities(*LISTING_COLUMNS)
+            
+            if rank:
+                # Keyset pagination on (relevance, id), most relevant first
+                rank_expression, descending = rank
+                rows, next_cursor = paginate_keyset(
+                    query.add_columns(rank_expression.label('search_rank')),
+                    keys=[(rank_expression, descending), (Job.id, True)],
+                    limit=limit,
+                    cursor=cursor,
+                    key_types=[float, int],
+                    key_func=lambda row: [row.search_rank, row.id]
+                )
+            else:
+                # Keyset pagination on (posting_date, id), newest first
+                rows, next_cursor = paginate_keyset(
+                    query,
+                    keys=[(Job.posting_date, True), (Job.id, True)],
+                    limit=limit,
+                    cursor=cursor,
+                    key_types=[datetime, int]
                 )
+            
+            return {
+                'data': serialize_job_rows(rows, include_tags_list='tags_list' in include),
+                'next_cursor': next_cursor
+            }
+        
+        try:
+            page = get_query_cache().get_or_set(
+                'jobs', g.job_version,
+                dict(filters, limit=limit, cursor=cursor, include=','.join(include)),
+                build_page
             )
+        except ValueError:
+            return error_response("Invalid cursor", 400)
         
-        if job_type and job_type.lower() != 'all':
-            query = query.filter(Job.job_type == job_type)
+        return success_response(page['data'], next_cursor=page['next_cursor'], limit=limit)
+        
+    except Exception as e:
+        current_app.logger.error(f"Error fetching jobs: {str(e)}")
+        return error_response("Failed to fetch jobs", 500)
+
+@api.route('/jobs/export', methods=['GET'])
+@cross_origin()
+@conditional_on_job_version
+def export_jobs():
+    """Stream every job matching the filters as one JSON document"""
+    try:
+        from app.models import Job
         
-        if location:
-            location_pattern = f"%{location}%"
-            query = query.filter(Job.location.ilike(location_pattern))
+        query, rank = Job.build_search_query(**job_filters_from_request())
+        query = query.with_entities(*LISTING_COLUMNS)
+        if rank:
+            rank_expression, descending = rank
+            query = query.add_columns(rank_expression).order_by(
+                rank_expression.desc() if descending else rank_expression.asc(), Job.id.desc()
+            )
+        else:
+            query = query.order_by(Job.posting_date.desc(), Job.id.desc())
         
-        if experience_level and experience_level.lower() != 'all':
-            query = query.filter(Job.experience_level == experience_level)
+        include = {part.strip() for part in request.args.get('include', '').split(',')}
+        rows = stream_job_rows(
+            query,
+            include_tags_list='tags_list' in include,
+            batch_size=current_app.config['EXPORT_BATCH_SIZE']
+        )
+        return current_app.response_class(stream_with_context(rows), mimetype='application/json')
         
-        if remote_allowed and remote_allowed.lower() != 'all':
-            is_remote = remote_allowed.lower() == 'true'
-            query = query.filter(Job.remote_allowed == is_remote)
+    except Exception as e:
+        current_app.logger.error(f"Error exporting jobs: {str(e)}")
+        return error_response("Failed to export jobs", 500)
+
+@api.route('/jobs/facets', methods=['GET'])
+@cross_origin()
+@conditional_on_job_version
+def get_job_facets():
+    """Counts per job type, experience level, remote flag and top tags for the current filters"""
+    try:
+        from app.models import JobService
         
-        # Get results ordered by posting date
-        jobs = query.order_by(Job.posting_date.desc()).all()
+        try:
+            top_tags = max(1, min(int(request.args.get('top_tags', 10)), 50))
+        except ValueError:
+            return error_response("top_tags must be an integer", 400)
         
-        return success_response([job.to_dict() for job in jobs])
+        filters = job_filters_from_request()
+        facets = get_query_cache().get_or_set(
+            'facets', g.job_version, dict(filters, top_tags=top_tags),
+            lambda: JobService.get_facets(filters, top_tags=top_tags)
+        )
+        return success_response(facets)
         
     except Exception as e:
-        current_app.logger.error(f"Error fetching jobs: {str(e)}")
-        return error_response("Failed to fetch jobs", 500)
+        current_app.logger.error(f"Error fetching job facets: {str(e)}")
+        return error_response("Failed to fetch facets", 500)
 
 @api.route('/jobs/<int:job_id>', methods=['GET'])
 @cross_origin()
+@conditional_on_job_version
 def get_job(job_id):
     """Get a specific job"""
     try:
@@ -178,296 +308,78 @@ def delete_job(job_id):
 @api.route('/scrape', methods=['POST'])
 @cross_origin()
 def trigger_scraper():
-    """FAST optimized scraper for ActuaryList.com"""
+    """Queue an ActuaryList.com scraper run and return its run id right away"""
     try:
-        from app.models import Job, db
+        from app.scrape_queue import enqueue_scrape
         
-        # Try to import scraping libraries
+        data = request.get_json(silent=True) or {}
         try:
-            import requests
-            from bs4 import BeautifulSoup
-            import re
-            
-            print("🔄 Starting FAST ActuaryList.com scraper...")
-            
-            # OPTIMIZED: Single page scraping approach
-            base_url = "https://www.actuarylist.com"
-            
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36',
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-                'Accept-Language': 'en-US,en;q=0.5',
-                'Connection': 'keep-alive',
-            }
-            
-            scraped_jobs = []
-            
-            try:
-                # FAST APPROACH: Only scrape the main page for job listings
-                print(f"📡 Fetching main page: {base_url}")
-                response = requests.get(base_url, headers=headers, timeout=15)
-                response.raise_for_status()
-                
-                print(f"✅ Got response: {response.status_code}")
-                
-                # Parse the HTML
-                soup = BeautifulSoup(response.content, 'html.parser')
-                
-                # OPTIMIZED: Extract job info directly from main page
-                # Look for job titles and companies on the homepage
-                job_elements = []
-                
-                # Method 1: Find links with job URLs
-                job_links = soup.find_all('a', href=True)
-                for link in job_links:
-                    href = link.get('href', '')
-                    if '/actuarial-jobs/' in href:
-                        job_elements.append(link)
-                
-                print(f"🎯 Found {len(job_elements)} job elements on main page")
-                
-                # FAST: Extract info from main page instead of visiting each job
-                for i, element in enumerate(job_elements[:8]):  # Limit to 8 for speed
-                    try:
-                        # Get the job URL
-                        href = element.get('href')
-                        if href.startswith('/'):
-                            job_url = base_url + href
-                        else:
-                            job_url = href
-                        
-                        # Extract title from link text or nearby elements
-                        title = element.get_text(strip=True)
-                        if not title or len(title) < 5:
-                            # Look for title in parent or sibling elements
-                            parent = element.parent
-                            if parent:
-                                title = parent.get_text(strip=True)
-                            if not title or len(title) < 5:
-                                title = f"Actuarial Position {i+1}"
-                        
-                        # Extract company from URL
-                        url_parts = href.split('/')[-1].split('-')
-                        if len(url_parts) > 1:
-                            company = url_parts[-1].replace('-', ' ').title()
-                        else:
-                            company = f"Company {i+1}"
-                        
-                        # Clean up title
-                        if len(title) > 200:
-                            title = title[:200]
-                        
-                        # Generate realistic location based on company
-                        locations = [
-                            "New York, NY", "Chicago, IL", "Boston, MA", "Hartford, CT",
-                            "Milwaukee, WI", "Philadelphia, PA", "Atlanta, GA", "Remote"
-                        ]
-                        location = locations[i % len(locations)]
-                        
-                        # Generate experience level
-                        experience_levels = ["Entry Level", "Mid-Level", "Senior", "Senior"]
-                        experience_level = experience_levels[i % len(experience_levels)]
-                        
-                        # Create job data with current timestamp
-                        current_time = datetime.now(UTC)
-                        job_data = {
-                            'title': title.strip()[:200],
-                            'company': company.strip()[:200],
-                            'location': location,
-                            'job_type': 'Full-time',
-                            'description': f'Real job opportunity scraped from ActuaryList.com on {current_time.strftime("%B %d, %Y")}. Visit the source URL for complete details.',
-                            'experience_level': experience_level,
-                            'remote_allowed': location == "Remote" or i % 3 == 0,
-                            'tags': 'Actuarial, Insurance, Risk Management, Live Scraping',
-                            'salary_range': f'${65 + i*10},000 - ${95 + i*15},000' if i % 2 == 0 else '',
-                            'source_url': job_url,
-                            'posting_date': current_time,
-                            'is_scraped': True
-                        }
-                        
-                        scraped_jobs.append(job_data)
-                        print(f"   ✅ Extracted: {title[:50]} at {company}")
-                        
-                    except Exception as e:
-                        print(f"   ⚠️ Error processing job element {i}: {e}")
-                        continue
-                
-                # If no jobs found from links, try alternative approach
-                if not scraped_jobs:
-                    print("🔄 No job links found, trying text extraction...")
-                    
-                    # Look for job-related text patterns
-                    page_text = soup.get_text()
-                    
-                    # Find patterns that look like job titles
-                    job_patterns = [
-                        r'(Senior\s+Actuarial?\s+Analyst)',
-                        r'(Actuarial?\s+Analyst)',
-                        r'(Risk\s+Management\s+Actuarial?)',
-                        r'(Pricing\s+Actuarial?)',
-                        r'(Chief\s+Actuarial?\s+Officer)',
-                        r'(Actuarial?\s+Manager)',
-                        r'(Health\s+Actuarial?)',
-                        r'(Life\s+Insurance\s+Actuarial?)'
-                    ]
-                    
-                    companies = ['MetLife', 'Prudential', 'Aetna', 'AIG', 'Hartford', 'Travelers']
-                    current_time = datetime.now(UTC)
-                    
-                    for i, pattern in enumerate(job_patterns[:5]):
-                        matches = re.findall(pattern, page_text, re.IGNORECASE)
-                        if matches:
-                            title = matches[0]
-                            company = companies[i % len(companies)]
-                            
-                            job_data = {
-                                'title': f'{title} - Scraped {current_time.strftime("%m/%d %H:%M")}',
-                                'company': company,
-                                'location': ['New York, NY', 'Chicago, IL', 'Hartford, CT'][i % 3],
-                                'job_type': 'Full-time',
-                                'description': f'Live actuarial opportunity found on ActuaryList.com via pattern matching on {current_time.strftime("%Y-%m-%d")}.',
-                                'experience_level': ['Mid-Level', 'Senior', 'Entry Level'][i % 3],
-                                'remote_allowed': i % 2 == 0,
-                                'tags': 'Pattern Matched, Live Scraping, Actuarial',
-                                'salary_range': '',
-                                'source_url': base_url,
-                                'posting_date': current_time,
-                                'is_scraped': True
-                            }
-                            
-                            scraped_jobs.append(job_data)
-                            print(f"   📊 Pattern matched: {title} at {company}")
-                
-            except requests.RequestException as e:
-                print(f"❌ Error fetching from ActuaryList.com: {e}")
-                raise e
-            
-            # Final fallback with timestamp if nothing found
-            if not scraped_jobs:
-                print("⚠️ No jobs extracted, creating timestamped data...")
-                current_time = datetime.now(UTC)
-                
-                scraped_jobs = [
-                    {
-                        'title': f'Live Scrape Test - {current_time.strftime("%m/%d %H:%M")}',
-                        'company': 'ActuaryList Live',
-                        'location': 'Multiple Locations',
-                        'job_type': 'Full-time',
-                        'description': f'Real scraping attempt completed on {current_time.strftime("%B %d, %Y at %H:%M")}. The scraper successfully connected to ActuaryList.com.',
-                        'experience_level': 'Mid-Level',
-                        'remote_allowed': True,
-                        'tags': 'Live Connection Test, Real Time',
-                        'salary_range': '',
-                        'source_url': base_url,
-                        'posting_date': current_time,
-                        'is_scraped': True
-                    },
-                    {
-                        'title': f'Connection Verified - {current_time.strftime("%m/%d %H:%M")}',
-                        'company': 'Scraper Status',
-                        'location': 'System',
-                        'job_type': 'Full-time',
-                        'description': f'Successfully connected to ActuaryList.com and parsed content. Timestamp: {current_time.isoformat()}',
-                        'experience_level': 'System',
-                        'remote_allowed': True,
-                        'tags': 'System Status, Live Test',
-                        'salary_range': '',
-                        'source_url': base_url,
-                        'posting_date': current_time,
-                        'is_scraped': True
-                    }
-                ]
-        
-        except ImportError as e:
-            print(f"❌ Missing scraping libraries: {e}")
-            
-            # Library missing fallback
-            current_time = datetime.now(UTC)
-            scraped_jobs = [
-                {
-                    'title': f'Install Required - {current_time.strftime("%m/%d %H:%M")}',
-                    'company': 'System Alert',
-                    'location': 'Backend',
-                    'job_type': 'System',
-                    'description': f'Please install scraping libraries: pip install requests beautifulsoup4',
-                    'experience_level': 'System',
-                    'remote_allowed': False,
-                    'tags': 'System Message',
-                    'salary_range': '',
-                    'source_url': '',
-                    'posting_date': current_time,
-                    'is_scraped': False
-                }
-            ]
-        
-        # Save scraped jobs to database (FAST bulk operation)
-        saved_count = 0
-        skipped_count = 0
-        
-        for job_data in scraped_jobs:
-            try:
-                # Quick duplicate check
-                existing_job = Job.query.filter_by(
-                    title=job_data['title'],
-                    company=job_data['company']
-                ).first()
-                
-                if existing_job:
-                    skipped_count += 1
-                    continue
-                
-                # Create new job
-                job = Job(**job_data)
-                db.session.add(job)
-                saved_count += 1
-                
-            except Exception as e:
-                print(f"⚠️ Error preparing job: {e}")
-                continue
-        
-        # Single commit for all jobs
-        try:
-            db.session.commit()
-            print(f"💾 Database commit successful: {saved_count} saved, {skipped_count} skipped")
-            
-            return success_response({
-                'message': f'Fast scraper completed! Connected to ActuaryList.com and processed {len(scraped_jobs)} jobs.',
-                'jobs_found': len(scraped_jobs),
-                'jobs_saved': saved_count,
-                'jobs_skipped': skipped_count,
-                'source': 'https://www.actuarylist.com (LIVE CONNECTION)',
-                'is_real_scraping': True,
-                'scrape_time': datetime.now(UTC).isoformat()
-            })
-            
-        except Exception as e:
-            db.session.rollback()
-            return error_response(f"Database commit failed: {str(e)}", 500)
+            max_jobs = max(1, min(int(data.get('max_jobs', 50)), 200))
+        except (TypeError, ValueError):
+            return error_response("max_jobs must be an integer", 400)
+        
+        fetch_details = data.get('fetch_details')
+        if fetch_details is not None:
+            fetch_details = bool(fetch_details)
+        
+        # "full": true re-processes every page and listing, ignoring the crawl state
+        incremental = not data['full'] if data.get('full') is not None else None
+        
+        sources = data.get('sources')
+        if sources is not None:
+            from app.scraping.sources import available_sources
+            if isinstance(sources, str):
+                sources = sources.split(',')
+            if not isinstance(sources, list) or not sources:
+                return error_response("sources must be a list of source names", 400)
+            sources = [str(name).strip().lower() for name in sources]
+            unknown = [name for name in sources if name not in available_sources()]
+            if unknown:
+                return error_response(f"Unknown sources: {', '.join(unknown)}", 400)
+        
+        run, created = enqueue_scrape(
+            current_app._get_current_object(),
+            max_jobs=max_jobs,
+            fetch_details=fetch_details,
+            incremental=incremental,
+            sources=sources
+        )
+        
+        result = run.to_dict()
+        result['message'] = 'Scraper run queued' if created else 'A scraper run is already in progress'
+        result['status_url'] = f"/api/scrape/{run.id}"
+        return success_response(result, 202)
         
     except Exception as e:
-        current_app.logger.error(f"Error running scraper: {str(e)}")
+        current_app.logger.error(f"Error queueing scraper: {str(e)}")
         return error_response(f"Scraper error: {str(e)}", 500)
+
+@api.route('/scrape/<run_id>', methods=['GET'])
+@cross_origin()
+def get_scrape_run(run_id):
+    """Report progress, counts and timing for a scraper run"""
+    try:
+        from app.models import ScrapeRun, db
+        
+        run = db.session.get(ScrapeRun, run_id)
+        if run is None:
+            return error_response("Scrape run not found", 404)
+        
+        return success_response(run.to_dict())
+        
+    except Exception as e:
+        current_app.logger.error(f"Error fetching scrape run {run_id}: {str(e)}")
+        return error_response("Failed to fetch scrape run", 500)
     
 @api.route('/jobs/stats', methods=['GET'])
 @cross_origin()
+@conditional_on_job_version
 def get_job_stats():
-    """Get job statistics"""
+    """Get job statistics from the materialized counters"""
     try:
-        from app.models import Job, db
+        from app.models import JobService
         
-        total_jobs = Job.query.count()
-        recent_jobs = Job.query.filter(
-            Job.posting_date >= datetime.now(UTC).replace(hour=0, minute=0, second=0, microsecond=0)
-        ).count()
-        companies = db.session.query(Job.company).distinct().count()
-        
-        stats = {
-            'total': total_jobs,
-            'recent': recent_jobs,
-            'companies': companies
-        }
-        
-        return success_response(stats)
+        return success_response(JobService.get_job_stats())
         
     except Exception as e:
         current_app.logger.error(f"Error fetching job stats: {str(e)}")
@@ -476,16 +388,54 @@ def get_job_stats():
 @api.route('/health', methods=['GET'])
 @cross_origin()
 def health_check():
-    """Health check endpoint"""
+    """Liveness probe: answers without touching the database"""
+    return success_response({
+        'status': 'healthy',
+        'message': 'Job Board API is running',
+        'timestamp': datetime.now(UTC).isoformat()
+    })
+
+@api.route('/ready', methods=['GET'])
+@cross_origin()
+def readiness_check():
+    """Readiness probe: the database answers and the counter row can be read"""
     try:
-        from app.models import Job
-        job_count = Job.query.count()
+        from sqlalchemy import text
+        from app.models import JobStats, db
+        from app.stats import STATS_ROW_ID
+        
+        db.session.execute(text('SELECT 1'))
+        stats = db.session.get(JobStats, STATS_ROW_ID)
         
         return success_response({
-            'status': 'healthy',
-            'message': 'Job Board API is running',
-            'job_count': job_count,
+            'status': 'ready',
+            'database': 'ok',
+            'job_count': stats.total if stats else None,
             'timestamp': datetime.now(UTC).isoformat()
         })
     except Exception as e:
-        return error_response(f"Health check failed: {str(e)}", 500)
\ No newline at end of file
+        current_app.logger.error(f"Readiness check failed: {str(e)}")
+        return error_response(f"Not ready: {str(e)}", 503)
+
+@api.route('/db/pool', methods=['GET'])
+@cross_origin()
+def get_db_pool_stats():
+    """Connection pool usage and effective database settings for this worker"""
+    try:
+        from app.engine import get_pool_stats
+        from app.models import db
+        
+        return success_response(get_pool_stats(db))
+    except Exception as e:
+        current_app.logger.error(f"Error fetching pool stats: {str(e)}")
+        return error_response("Failed to fetch pool stats", 500)
+
+@api.route('/cache/stats', methods=['GET'])
+@cross_origin()
+def get_cache_stats():
+    """Query cache hit/miss metrics for this worker"""
+    try:
+        return success_response(get_query_cache().stats())
+    except Exception as e:
+        current_app.logger.error(f"Error fetching cache stats: {str(e)}")
+        return error_response("Failed to fetch cache stats", 500)
@@ -11,10 +11,6 @@ import re
 # Add parent directory to path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-# Import your Flask app
-from app import create_app
-from app.models import db, Job
-
 def scrape_actuarylist_jobs():
     """
     Scrape jobs from ActuaryList.com and add them to database
@@ -159,48 +155,28 @@ def scrape_actuarylist_jobs():
     
     return scraped_jobs
 
-def save_scraped_jobs_to_database(jobs):
-    """Save scraped jobs to the database"""
-    app = create_app()
+def save_scraped_jobs_to_database(jobs, app=None):
+    """Save scraped jobs to the database, reusing the current app context or `app`"""
+    from flask import has_app_context
+    from app.ingest import ingest_jobs
     
-    with app.app_context():
-        saved_count = 0
-        skipped_count = 0
-        
-        for job_data in jobs:
-            try:
-                # Check for duplicates
-                existing_job = Job.query.filter_by(
-                    title=job_data['title'],
-                    company=job_data['company']
-                ).first()
-                
-                if existing_job:
-                    skipped_count += 1
-                    print(f"⏭️ Skipped duplicate: {job_data['title']} at {job_data['company']}")
-                    continue
-                
-                # Create new job
-                job = Job(**job_data)
-                db.session.add(job)
-                saved_count += 1
-                print(f"✅ Added: {job_data['title']} at {job_data['company']}")
-                
-            except Exception as e:
-                print(f"⚠️ Error saving job '{job_data.get('title', 'Unknown')}': {e}")
-                continue
-        
-        # Commit all changes
-        try:
-            db.session.commit()
-            print(f"\n💾 Database Results:")
-            print(f"   ✅ Saved: {saved_count} new jobs")
-            print(f"   ⏭️ Skipped: {skipped_count} duplicates")
-            return saved_count
-        except Exception as e:
-            db.session.rollback()
-            print(f"❌ Database commit failed: {e}")
-            return 0
+    if not has_app_context():
+        if app is None:
+            from app import create_app
+            app = create_app()
+        with app.app_context():
+            return save_scraped_jobs_to_database(jobs)
+    
+    try:
+        counts = ingest_jobs(jobs)
+        print(f"\n💾 Database Results:")
+        print(f"   ✅ Saved: {counts['saved']} new jobs")
+        print(f"   🔄 Updated: {counts['updated']} changed jobs")
+        print(f"   ⏭️ Skipped: {counts['skipped']} duplicates")
+        return counts['saved']
+    except Exception as e:
+        print(f"❌ Database commit failed: {e}")
+        return 0
 
 def run_selenium_scraper():
     """
@@ -208,42 +184,28 @@ def run_selenium_scraper():
     This would use the selenium code from earlier but simplified for demo
     """
     try:
-        from selenium import webdriver
-        from selenium.webdriver.chrome.options import Options
-        from selenium.webdriver.chrome.service import Service
+        from app.scrape_jobs import get_scraper_browser_pool
+        from app.scraping.browser import BrowserUnavailable
         
         print("🔄 Attempting to run Selenium scraper...")
         
-        # Setup Chrome options
-        chrome_options = Options()
-        chrome_options.add_argument("--headless")
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        
-        # Try to setup webdriver
-        try:
-            from webdriver_manager.chrome import ChromeDriverManager
-            service = Service(ChromeDriverManager().install())
-            driver = webdriver.Chrome(service=service, options=chrome_options)
-        except:
-            # Fallback if webdriver-manager fails
-            print("⚠️ WebDriver setup failed, using simulated data instead")
-            return scrape_actuarylist_jobs()
-        
+        # Lease a warm browser from the shared pool rather than starting Chrome here
         try:
-            # Navigate to ActuaryList
-            driver.get("https://www.actuarylist.com/jobs")
-            time.sleep(3)
-            
-            # In a real implementation, this would extract actual job data
-            # For now, we'll use simulated data and close the driver
-            driver.quit()
+            with get_scraper_browser_pool(headless=True).lease() as driver:
+                # Navigate to ActuaryList; get() returns once the page has loaded
+                driver.get("https://www.actuarylist.com/jobs")
+                
+                # In a real implementation, this would extract actual job data
+                # For now, we'll use simulated data and return the browser
             
             print("✅ Selenium scraper completed (using simulated data for demo)")
             return scrape_actuarylist_jobs()
             
+        except BrowserUnavailable:
+            # Fallback if no browser could be started
+            print("⚠️ WebDriver setup failed, using simulated data instead")
+            return scrape_actuarylist_jobs()
         except Exception as e:
-            driver.quit()
             print(f"⚠️ Scraping failed: {e}")
             print("🔄 Using simulated data instead")
             return scrape_actuarylist_jobs()
@@ -0,0 +1,298 @@
+"""
+Recurring scrape scheduler
+Runs each configured source on an interval or cron schedule, with random jitter
+so several deployments don't hit a site at the same moment. A database lock per
+source (app/locks.py) keeps scheduler processes on different machines from
+running the same source twice; the shared scrape_schedules row tells them when
+it's due. After a failed run the next attempt is pushed back exponentially.
+
+Each run is an ordinary ScrapeRun (trigger 'schedule') executed through the
+scrape queue's execute_run, so duration and counts are recorded the same way
+as for POST /api/scrape.
+
+    python scheduler.py            # run until stopped
+    python scheduler.py --once     # run whatever is due, then exit
+    python scheduler.py --now      # run every source immediately, then keep scheduling
+
+Environment Variables:
+    SCRAPE_SCHEDULE                 source=spec pairs separated by ';' (default: actuarylist=6h)
+                                    spec is an interval (30m, 6h, 1d) or a 5-field cron
+                                    expression in UTC, e.g. 'actuarylist=*/30 * * * *'
+    SCRAPE_SCHEDULE_JITTER          Up to this many seconds are added to every run time (default: 300)
+    SCRAPE_SCHEDULE_BACKOFF         Delay after the first failure, doubled per failure (default: 300)
+    SCRAPE_SCHEDULE_BACKOFF_MAX     Longest failure delay in seconds (default: 21600)
+    SCRAPE_SCHEDULER_TICK           Seconds between checks for due sources (default: 30)
+    SCRAPE_MAX_JOBS                 Jobs per scheduled run (default: 50)
+"""
+import os
+import random
+import re
+import threading
+from datetime import datetime, timedelta, UTC
+
+from app.locks import database_lock
+from app.models import db, ScrapeRun, ScrapeSchedule
+from app.scraping.sources import available_sources
+
+_INTERVAL = re.compile(r'^(\d+)\s*([smhd])$')
+_UNITS = {'s': 1, 'm': 60, 'h': 3600, 'd': 86400}
+
+# (name, lowest, highest) for the five cron fields
+_CRON_FIELDS = (
+    ('minute', 0, 59),
+    ('hour', 0, 23),
+    ('day', 1, 31),
+    ('month', 1, 12),
+    ('weekday', 0, 6),
+)
+
+
+def utcnow():
+    # Schedule times are stored as naive UTC so SQLite and PostgreSQL compare them alike
+    return datetime.now(UTC).replace(tzinfo=None)
+
+
+class IntervalSchedule:
+    """Fixed interval between runs, e.g. '30m'"""
+
+    def __init__(self, spec, seconds):
+        self.spec = spec
+        self.interval = timedelta(seconds=seconds)
+
+    def next_after(self, moment):
+        return moment + self.interval
+
+
+class CronSchedule:
+    """Standard 5-field cron expression: numbers, '*', ranges, lists and '/step'"""
+
+    def __init__(self, spec):
+        fields = spec.split()
+        if len(fields) != 5:
+            raise ValueError(f"Cron expression needs 5 fields: '{spec}'")
+        self.spec = spec
+        self.minutes, self.hours, self.days, self.months, weekdays = (
+            self._parse_field(field, name, low, high)
+            for field, (name, low, high) in zip(fields, _CRON_FIELDS)
+        )
+        # Cron counts Sunday as 0 (and 7); Python's weekday() has Monday as 0
+        self.weekdays = {(day - 1) % 7 for day in weekdays}
+        # Like cron: when both day fields are restricted, either may match
+        self.any_day = fields[2] == '*'
+        self.any_weekday = fields[4] == '*'
+
+    @staticmethod
+    def _parse_field(field, name, low, high):
+        if name == 'weekday':
+            high = 7
+        values = set()
+        for part in field.split(','):
+            value_range, _, step = part.partition('/')
+            if value_range == '*':
+                start, end = low, high
+            elif '-' in value_range:
+                start, end = (int(value) for value in value_range.split('-', 1))
+            else:
+                start = end = int(value_range)
+                if step:
+                    end = high
+            step = int(step) if step else 1
+            if not (low <= start <= end <= high) or step < 1:
+                raise ValueError(f"Invalid cron {name} field: '{field}'")
+            values.update(range(start, end + 1, step))
+        return values
+
+    def _day_matches(self, moment):
+        day_ok = moment.day in self.days
+        weekday_ok = moment.weekday() in self.weekdays
+        if self.any_day:
+            return weekday_ok
+        if self.any_weekday:
+            return day_ok
+        return day_ok or weekday_ok
+
+    def next_after(self, moment):
+        """First matching minute strictly after `moment`"""
+        candidate = moment.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        limit = candidate + timedelta(days=366 * 5)
+        while candidate < limit:
+            if candidate.month not in self.months:
+                year, month = divmod(candidate.month, 12)
+                candidate = candidate.replace(year=candidate.year + year, month=month + 1, day=1, hour=0, minute=0)
+            elif not self._day_matches(candidate):
+                candidate = candidate.replace(hour=0, minute=0) + timedelta(days=1)
+            elif candidate.hour not in self.hours:
+                candidate = candidate.replace(minute=0) + timedelta(hours=1)
+            elif candidate.minute not in self.minutes:
+                candidate += timedelta(minutes=1)
+            else:
+                return candidate
+        raise ValueError(f"Cron expression never matches: '{self.spec}'")
+
+
+def parse_schedule(spec):
+    """IntervalSchedule for '30m' / '6h' / '1d', CronSchedule for a cron expression"""
+    spec = spec.strip()
+    match = _INTERVAL.match(spec)
+    if match:
+        seconds = int(match.group(1)) * _UNITS[match.group(2)]
+        if seconds <= 0:
+            raise ValueError(f"Interval must be positive: '{spec}'")
+        return IntervalSchedule(spec, seconds)
+    return CronSchedule(spec)
+
+
+def parse_schedules(config=None):
+    """{source: schedule} from SCRAPE_SCHEDULE-style 'source=spec; source=spec' text"""
+    if config is None:
+        config = os.getenv('SCRAPE_SCHEDULE', 'actuarylist=6h')
+    schedules = {}
+    for entry in config.split(';'):
+        if not entry.strip():
+            continue
+        source, separator, spec = entry.partition('=')
+        source = source.strip().lower()
+        if not separator or not spec.strip():
+            raise ValueError(f"Expected source=spec in SCRAPE_SCHEDULE, got '{entry.strip()}'")
+        if source not in available_sources():
+            raise ValueError(f"Unknown scrape source '{source}', expected one of {', '.join(available_sources())}")
+        schedules[source] = parse_schedule(spec)
+        # A cron expression can be well-formed yet never fire (e.g. '0 0 31 2 *'); fail now, not at the first sync
+        schedules[source].next_after(utcnow())
+    return schedules
+
+
+class Scheduler:
+    """Runs due sources one at a time; any number of scheduler processes can share a database"""
+
+    def __init__(self, app, schedules, jitter=None, backoff=None, backoff_max=None, tick=None):
+        self.app = app
+        self.schedules = schedules
+        self.jitter = float(os.getenv('SCRAPE_SCHEDULE_JITTER', '300')) if jitter is None else jitter
+        self.backoff = float(os.getenv('SCRAPE_SCHEDULE_BACKOFF', '300')) if backoff is None else backoff
+        self.backoff_max = float(os.getenv('SCRAPE_SCHEDULE_BACKOFF_MAX', '21600')) if backoff_max is None else backoff_max
+        self.tick = float(os.getenv('SCRAPE_SCHEDULER_TICK', '30')) if tick is None else tick
+        self.max_jobs = int(os.getenv('SCRAPE_MAX_JOBS', '50'))
+        self.lock_ttl = int(os.getenv('SCRAPE_RUN_TIMEOUT_MINUTES', '30')) * 60
+        self.stop_event = threading.Event()
+        self._synced = False
+
+    def with_jitter(self, moment):
+        return moment + timedelta(seconds=random.uniform(0, self.jitter)) if self.jitter > 0 else moment
+
+    def next_run_time(self, source, now, failures):
+        """Next scheduled time plus jitter, or the failure backoff if that's later"""
+        next_run = self.with_jitter(self.schedules[source].next_after(now))
+        if failures:
+            delay = min(self.backoff * 2 ** (failures - 1), self.backoff_max)
+            next_run = max(next_run, now + timedelta(seconds=delay))
+        return next_run
+
+    def sync_schedules(self):
+        """Create rows for new sources and reschedule ones whose spec changed"""
+        now = utcnow()
+        rows = {row.source: row for row in ScrapeSchedule.query.filter(ScrapeSchedule.source.in_(list(self.schedules)))}
+        for source, schedule in self.schedules.items():
+            row = rows.get(source)
+            if row is None:
+                row = ScrapeSchedule(source=source, consecutive_failures=0)
+                db.session.add(row)
+            if row.spec != schedule.spec:
+                row.spec = schedule.spec
+                row.next_run_at = self.with_jitter(schedule.next_after(now))
+                print(f"📅 {source}: '{schedule.spec}', next run at {row.next_run_at:%Y-%m-%d %H:%M:%S} UTC")
+        db.session.commit()
+        self._synced = True
+
+    def due_sources(self, now=None):
+        now = now or utcnow()
+        return [
+            source for (source,) in db.session.query(ScrapeSchedule.source).filter(
+                ScrapeSchedule.source.in_(list(self.schedules)),
+                ScrapeSchedule.next_run_at <= now
+            ).order_by(ScrapeSchedule.next_run_at)
+        ]
+
+    def run_source(self, source, force=False):
+        """Run one source under its lock; returns the finished ScrapeRun's dict, or None if skipped"""
+        from app.scrape_queue import execute_run, get_active_run, run_options
+
+        with database_lock(f'scrape:{source}', ttl_seconds=self.lock_ttl) as acquired:
+            if not acquired:
+                print(f"🔒 {source}: another scheduler is running it")
+                return None
+
+            # Re-read under the lock: another process may have just run it
+            row = db.session.get(ScrapeSchedule, source)
+            now = utcnow()
+            if not force and row.next_run_at and row.next_run_at > now:
+                return None
+
+            if get_active_run():
+                # A run started from the API is in progress; look again next tick
+                print(f"⏳ {source}: a scrape is already running, retrying shortly")
+                row.next_run_at = now + timedelta(seconds=self.tick)
+                db.session.commit()
+                return None
+
+            run = ScrapeRun(status='queued', trigger='schedule', source=source, progress='Queued by scheduler')
+            db.session.add(run)
+            db.session.commit()
+            run_id = run.id
+
+            print(f"🚀 {source}: starting scheduled run {run_id}")
+            fetch_details, incremental = run_options()
+            execute_run(self.app, run_id, self.max_jobs, fetch_details, incremental)
+
+            # execute_run worked in its own session; drop what this one cached
+            db.session.expire_all()
+            run = db.session.get(ScrapeRun, run_id)
+            row = db.session.get(ScrapeSchedule, source)
+            finished = utcnow()
+            row.consecutive_failures = row.consecutive_failures + 1 if run.status == 'failed' else 0
+            row.last_run_id = run_id
+            row.last_status = run.status
+            row.last_finished_at = finished
+            row.next_run_at = self.next_run_time(source, finished, row.consecutive_failures)
+            db.session.commit()
+
+            result = run.to_dict()
+            if run.status == 'failed':
+                print(f"❌ {source}: run failed ({run.error}); failure {row.consecutive_failures}, "
+                      f"next attempt at {row.next_run_at:%Y-%m-%d %H:%M:%S} UTC")
+            else:
+                print(f"✅ {source}: {run.progress} in {result['duration_seconds']}s; "
+                      f"next run at {row.next_run_at:%Y-%m-%d %H:%M:%S} UTC")
+            return result
+
+    def run_pending(self, force=False):
+        """Run every due source (or all of them when forced) once"""
+        with self.app.app_context():
+            if not self._synced:
+                self.sync_schedules()
+            sources = list(self.schedules) if force else self.due_sources()
+            results = []
+            for source in sources:
+                if self.stop_event.is_set():
+                    break
+                try:
+                    result = self.run_source(source, force=force)
+                except Exception as e:
+                    db.session.rollback()
+                    print(f"❌ {source}: scheduler error: {e}")
+                    continue
+                if result:
+                    results.append(result)
+            db.session.remove()
+            return results
+
+    def run_forever(self, run_now=False):
+        if run_now:
+            self.run_pending(force=True)
+        while not self.stop_event.is_set():
+            self.run_pending()
+            self.stop_event.wait(self.tick)
+        print("👋 Scheduler stopped")
+
+    def stop(self):
+        self.stop_event.set()
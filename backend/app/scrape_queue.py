@@ -0,0 +1,129 @@
+"""
+Background scrape queue
+POST /api/scrape enqueues a ScrapeRun and returns immediately; a small thread pool
+runs the run's sources (app/scraping/sources.py) side by side, ingests their jobs
+as they arrive and records progress, counts and timing on the run row.
+Runs are incremental by default (SCRAPE_INCREMENTAL): pages and listings that
+haven't changed since the last run are skipped, see app/scraping/crawl_state.py.
+Fetched pages are kept in the snapshot store (app/scraping/snapshots.py).
+"""
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, UTC
+
+from app.ingest import ingest_jobs
+from app.models import db, ScrapeRun
+
+_executor = None
+_executor_lock = threading.Lock()
+
+def get_executor():
+    """Lazily create the shared scrape worker pool"""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            workers = int(os.getenv('SCRAPE_WORKERS', '1'))
+            _executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='scrape-worker')
+        return _executor
+
+def get_active_run():
+    """Return a queued or running run that hasn't gone stale, if there is one"""
+    timeout_minutes = int(os.getenv('SCRAPE_RUN_TIMEOUT_MINUTES', '30'))
+    cutoff = datetime.now(UTC) - timedelta(minutes=timeout_minutes)
+    return ScrapeRun.query.filter(
+        ScrapeRun.status.in_(['queued', 'running']),
+        ScrapeRun.created_at >= cutoff
+    ).order_by(ScrapeRun.created_at.desc()).first()
+
+def run_options(fetch_details=None, incremental=None):
+    """Fill in (fetch_details, incremental) from SCRAPE_FETCH_DETAILS / SCRAPE_INCREMENTAL"""
+    if fetch_details is None:
+        fetch_details = os.getenv('SCRAPE_FETCH_DETAILS', 'False').lower() == 'true'
+    if incremental is None:
+        incremental = os.getenv('SCRAPE_INCREMENTAL', 'True').lower() == 'true'
+    return fetch_details, incremental
+
+def default_sources():
+    """Sources a run scrapes when none are named (SCRAPE_SOURCES, comma-separated)"""
+    return [name.strip().lower() for name in os.getenv('SCRAPE_SOURCES', 'actuarylist').split(',') if name.strip()]
+
+def enqueue_scrape(app, max_jobs=50, trigger='api', fetch_details=None, incremental=None, sources=None):
+    """Create a ScrapeRun and hand it to the worker pool; returns (run, created)"""
+    active_run = get_active_run()
+    if active_run:
+        return active_run, False
+
+    run = ScrapeRun(status='queued', trigger=trigger, source=','.join(sources or default_sources()), progress='Queued')
+    db.session.add(run)
+    db.session.commit()
+
+    fetch_details, incremental = run_options(fetch_details, incremental)
+    get_executor().submit(execute_run, app, run.id, max_jobs, fetch_details, incremental)
+    return run, True
+
+def execute_run(app, run_id, max_jobs=50, fetch_details=False, incremental=True):
+    """Worker entry point: scrape one ScrapeRun's sources inside an app context"""
+    with app.app_context():
+        run = db.session.get(ScrapeRun, run_id)
+        if run is None:
+            return
+
+        run.status = 'running'
+        run.started_at = datetime.now(UTC)
+        run.progress = 'Starting scraper'
+        db.session.commit()
+
+        def on_progress(message, jobs_found=None):
+            run.progress = message[:200]
+            if jobs_found is not None:
+                run.jobs_found = jobs_found
+            db.session.commit()
+
+        try:
+            from app.scraping.crawl_state import CrawlTracker
+            from app.scraping.runner import SourceRunner
+            from app.scraping.snapshots import get_snapshot_store
+            from app.scraping.sources import create_source
+
+            snapshots = get_snapshot_store()
+            sources = [
+                create_source(
+                    name,
+                    max_jobs=max_jobs,
+                    fetch_details=fetch_details,
+                    crawl_state=CrawlTracker() if incremental else None,
+                    snapshots=snapshots
+                )
+                for name in run.source.split(',')
+            ]
+            results = SourceRunner(sources, ingest=ingest_jobs, app=app, on_progress=on_progress).run()
+
+            failed = [result for result in results.values() if result.error]
+            if len(failed) == len(results):
+                raise RuntimeError('; '.join(f"{result.name}: {result.error}" for result in failed))
+
+            run.jobs_found = sum(result.jobs_found for result in results.values())
+            run.jobs_unchanged = sum(result.unchanged for result in results.values())
+            run.jobs_saved = sum(result.counts['saved'] for result in results.values())
+            run.jobs_updated = sum(result.counts['updated'] for result in results.values())
+            run.jobs_skipped = sum(result.counts['skipped'] for result in results.values())
+            run.status = 'completed'
+            run.progress = f"Saved {run.jobs_saved} jobs, updated {run.jobs_updated}, skipped {run.jobs_skipped} duplicates"
+            pages_unchanged = sum(source.crawl_state.pages_unchanged for source in sources if source.crawl_state)
+            if run.jobs_unchanged or pages_unchanged:
+                run.progress += f"; {run.jobs_unchanged} listings and {pages_unchanged} pages unchanged"
+            if failed:
+                run.error = '; '.join(f"{result.name}: {result.error}" for result in failed)
+
+        except Exception as e:
+            db.session.rollback()
+            app.logger.error(f"Scrape run {run_id} failed: {e}")
+            run.status = 'failed'
+            run.error = str(e)
+            run.progress = 'Failed'
+
+        finally:
+            run.finished_at = datetime.now(UTC)
+            db.session.commit()
+            db.session.remove()
@@ -0,0 +1,3 @@
+"""
+Scraping infrastructure shared by the job scrapers (sources, HTTP fetching, rate limiting)
+"""
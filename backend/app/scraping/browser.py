@@ -0,0 +1,218 @@
+"""
+Pool of warm headless browser sessions for the Selenium scrapers
+Starting Chrome costs seconds, so scrape runs lease an already-running WebDriver
+from a process-wide pool and hand it back afterwards instead of quitting it.
+Sessions are health-checked before every lease, replaced when they stop
+responding and retired after a number of uses (Chrome's memory grows with every
+page) or after sitting idle too long.
+
+    pool = get_browser_pool('chrome-headless', factory=create_driver)
+    with pool.lease() as driver:
+        driver.get(url)
+
+Environment Variables:
+    SCRAPE_BROWSER_POOL_SIZE      Browsers kept per pool (default: SCRAPE_WORKERS, else 1)
+    SCRAPE_BROWSER_MAX_USES       Leases before a browser is restarted (default: 50)
+    SCRAPE_BROWSER_MAX_IDLE       Seconds an idle browser is kept (default: 600)
+    SCRAPE_BROWSER_LEASE_TIMEOUT  Seconds to wait for a free browser (default: 300)
+"""
+import atexit
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+
+class BrowserUnavailable(Exception):
+    """No browser could be leased: the factory failed, the pool is closed or the wait timed out"""
+
+
+class PooledBrowser:
+    """A WebDriver plus the bookkeeping the pool needs"""
+
+    __slots__ = ('driver', 'uses', 'created_at', 'last_used')
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.uses = 0
+        self.created_at = time.monotonic()
+        self.last_used = self.created_at
+
+
+def _quit(driver):
+    try:
+        driver.quit()
+    except Exception as e:
+        print(f"⚠️ Error closing browser: {e}")
+
+
+def is_healthy(driver):
+    """True if the session still answers a trivial script"""
+    try:
+        return driver.execute_script('return 1') == 1
+    except Exception:
+        return False
+
+
+class BrowserPool:
+    """Bounded, thread-safe pool of WebDriver sessions
+
+    `factory` returns a new driver, or None when the browser can't be started.
+    """
+
+    def __init__(self, factory, max_size=1, max_uses=50, max_idle=600, lease_timeout=300):
+        self.factory = factory
+        self.max_size = max(1, max_size)
+        self.max_uses = max(1, max_uses)
+        self.max_idle = max_idle
+        self.lease_timeout = lease_timeout
+
+        self._idle = []  # most recently used last
+        self._size = 0   # idle + leased + being started
+        self._closed = False
+        self._condition = threading.Condition()
+        self._counters = {'started': 0, 'reused': 0, 'recycled': 0, 'unhealthy': 0, 'start_failures': 0}
+
+    def _count(self, name):
+        with self._condition:
+            self._counters[name] += 1
+
+    def _start(self):
+        """Launch a browser for a slot already reserved in _size"""
+        try:
+            driver = self.factory()
+        except Exception as e:
+            print(f"⚠️ Browser start failed: {e}")
+            driver = None
+        if driver is None:
+            with self._condition:
+                self._size -= 1
+                self._counters['start_failures'] += 1
+                self._condition.notify()
+            raise BrowserUnavailable("Could not start a browser")
+        self._count('started')
+        return PooledBrowser(driver)
+
+    def acquire(self, timeout=None):
+        """Take a healthy browser out of the pool, starting one if there's room
+
+        Blocks while every browser is leased. Pair with release(), or use lease().
+        """
+        timeout = self.lease_timeout if timeout is None else timeout
+        deadline = time.monotonic() + timeout
+
+        with self._condition:
+            while True:
+                if self._closed:
+                    raise BrowserUnavailable("Browser pool is closed")
+                if self._idle:
+                    browser = self._idle.pop()
+                    break
+                if self._size < self.max_size:
+                    self._size += 1
+                    browser = None
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise BrowserUnavailable(f"No browser free after {timeout}s")
+                self._condition.wait(remaining)
+
+        # Checks and start-up happen outside the lock; the slot stays reserved
+        if browser is not None:
+            expired = self.max_idle and time.monotonic() - browser.last_used > self.max_idle
+            if expired or not is_healthy(browser.driver):
+                self._count('recycled' if expired else 'unhealthy')
+                _quit(browser.driver)
+                browser = None
+            else:
+                self._count('reused')
+
+        if browser is None:
+            browser = self._start()
+
+        browser.uses += 1
+        return browser
+
+    def release(self, browser, discard=False):
+        """Return a leased browser; it is quit instead when discarded, worn out or the pool is closed"""
+        browser.last_used = time.monotonic()
+        with self._condition:
+            retire = discard or self._closed or browser.uses >= self.max_uses
+            if retire:
+                self._size -= 1
+                self._counters['recycled'] += 1
+            else:
+                self._idle.append(browser)
+            self._condition.notify()
+        if retire:
+            _quit(browser.driver)
+
+    @contextmanager
+    def lease(self, timeout=None):
+        """Context manager yielding a driver; it goes back to the pool on exit
+
+        If the block raises, the browser may be mid-navigation or wedged, so it
+        is quit rather than handed to the next caller.
+        """
+        browser = self.acquire(timeout)
+        discard = False
+        try:
+            yield browser.driver
+        except BaseException:
+            discard = True
+            raise
+        finally:
+            self.release(browser, discard=discard)
+
+    def close(self):
+        """Quit idle browsers now; leased ones are quit when they come back"""
+        with self._condition:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._size -= len(idle)
+            self._condition.notify_all()
+        for browser in idle:
+            _quit(browser.driver)
+
+    def stats(self):
+        with self._condition:
+            return dict(
+                self._counters,
+                size=self._size,
+                idle=len(self._idle),
+                leased=self._size - len(self._idle),
+                max_size=self.max_size,
+                max_uses=self.max_uses
+            )
+
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+def get_browser_pool(name, factory):
+    """Process-wide pool registered under `name`, created with `factory` on first use"""
+    with _pools_lock:
+        pool = _pools.get(name)
+        if pool is None:
+            pool = BrowserPool(
+                factory,
+                max_size=int(os.getenv('SCRAPE_BROWSER_POOL_SIZE', os.getenv('SCRAPE_WORKERS', '1'))),
+                max_uses=int(os.getenv('SCRAPE_BROWSER_MAX_USES', '50')),
+                max_idle=float(os.getenv('SCRAPE_BROWSER_MAX_IDLE', '600')),
+                lease_timeout=float(os.getenv('SCRAPE_BROWSER_LEASE_TIMEOUT', '300'))
+            )
+            _pools[name] = pool
+        return pool
+
+
+def close_browser_pools():
+    """Quit every pooled browser (registered to run at interpreter exit)"""
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.close()
+
+
+atexit.register(close_browser_pools)
@@ -0,0 +1,156 @@
+"""
+Incremental crawl state for the scrapers
+A CrawlTracker remembers, per URL, the ETag / Last-Modified validators and a
+content hash from the last successful run (the crawl_state table). Scrapers use
+it to send conditional requests, skip parsing pages whose body hasn't changed,
+and pass on only listings that are new or whose fields changed since last time.
+
+Observations are staged in memory and written by save(), which the caller runs
+after the scraped jobs were ingested, so a failed run re-processes everything
+it saw.
+
+    tracker = CrawlTracker()
+    tracker.load([url])
+    response = fetcher.get(url, headers=tracker.conditional_headers(url))
+    if tracker.page_changed(url, response):
+        ...parse...
+    jobs = tracker.changed_listings(jobs)
+    ingest_jobs(jobs)
+    tracker.save()
+
+Must run inside an app context. Disable with SCRAPE_INCREMENTAL=False.
+"""
+import hashlib
+import json
+from datetime import datetime, UTC
+
+from app.ingest import make_dedupe_key
+from app.models import db, CrawlState
+
+# Listing fields that say whether a job changed; posting_date is left out because
+# it's computed from relative text ("3 days ago") and drifts between runs
+LISTING_FIELDS = (
+    'title', 'company', 'location', 'job_type', 'tags', 'salary_range',
+    'experience_level', 'remote_allowed', 'source_url'
+)
+
+STATE_COLUMNS = ('etag', 'last_modified', 'content_hash', 'status_code', 'checked_at', 'changed_at')
+
+
+def content_hash(body):
+    """sha256 of a response body (bytes or str)"""
+    if isinstance(body, str):
+        body = body.encode('utf-8')
+    return hashlib.sha256(body or b'').hexdigest()
+
+
+def listing_key(job):
+    """Crawl-state key for a scraped listing: the same identity ingestion dedupes on"""
+    return f"listing:{make_dedupe_key(job.get('title'), job.get('company'))}"
+
+
+def listing_hash(job):
+    fields = {field: job.get(field) for field in LISTING_FIELDS}
+    return content_hash(json.dumps(fields, sort_keys=True, default=str))
+
+
+class CrawlTracker:
+    """Per-run view of the crawl_state table with staged updates"""
+
+    def __init__(self, batch_size=500):
+        self.batch_size = batch_size
+        self._known = {}    # url -> {column: value} as stored
+        self._pending = {}  # url -> {column: value} to write on save()
+        self.pages_unchanged = 0
+        self.listings_unchanged = 0
+
+    def load(self, urls):
+        """Read the stored state for any of `urls` not loaded yet, in batched IN queries"""
+        missing = [url for url in dict.fromkeys(urls) if url not in self._known]
+        for start in range(0, len(missing), self.batch_size):
+            chunk = missing[start:start + self.batch_size]
+            for state in CrawlState.query.filter(CrawlState.url.in_(chunk)):
+                self._known[state.url] = {column: getattr(state, column) for column in STATE_COLUMNS}
+        return self
+
+    def conditional_headers(self, url):
+        """If-None-Match / If-Modified-Since for a page fetched before (load() it first); {} otherwise"""
+        state = self._known.get(url)
+        if not state:
+            return {}
+        headers = {}
+        if state['etag']:
+            headers['If-None-Match'] = state['etag']
+        if state['last_modified']:
+            headers['If-Modified-Since'] = state['last_modified']
+        return headers
+
+    def _stage(self, url, changed, **values):
+        now = datetime.now(UTC)
+        state = dict(self._known.get(url) or dict.fromkeys(STATE_COLUMNS))
+        state.update(values)
+        state['checked_at'] = now
+        if changed:
+            state['changed_at'] = now
+        self._pending[url] = state
+
+    def page_changed(self, url, response):
+        """Record a fetched page; False when it's a 304 or its body hashes the same as last run"""
+        known = self._known.get(url)
+        if response.status_code == 304:
+            self._stage(url, False, status_code=304)
+            self.pages_unchanged += 1
+            return False
+
+        digest = content_hash(response.content)
+        changed = known is None or known['content_hash'] != digest
+        self._stage(
+            url, changed,
+            etag=response.headers.get('ETag'),
+            last_modified=response.headers.get('Last-Modified'),
+            content_hash=digest,
+            status_code=response.status_code
+        )
+        if not changed:
+            self.pages_unchanged += 1
+        return changed
+
+    def seen_before(self, job):
+        """True if this listing was ingested by an earlier run"""
+        return listing_key(job) in self._known
+
+    def changed_listings(self, jobs):
+        """Drop listings whose fields hash the same as when they were last ingested"""
+        keyed = [(listing_key(job), listing_hash(job), job) for job in jobs]
+        self.load(key for key, _, _ in keyed)
+
+        changed = []
+        for key, digest, job in keyed:
+            known = self._known.get(key)
+            is_changed = known is None or known['content_hash'] != digest
+            self._stage(key, is_changed, content_hash=digest)
+            if is_changed:
+                changed.append(job)
+            else:
+                self.listings_unchanged += 1
+        return changed
+
+    def save(self):
+        """Write staged state: one bulk UPDATE for known URLs and one bulk INSERT for new ones"""
+        if not self._pending:
+            return
+        updates = [dict(state, url=url) for url, state in self._pending.items() if url in self._known]
+        inserts = [dict(state, url=url) for url, state in self._pending.items() if url not in self._known]
+        try:
+            if updates:
+                db.session.execute(db.update(CrawlState), updates)
+            if inserts:
+                db.session.execute(db.insert(CrawlState), inserts)
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            raise
+
+        for url, state in self._pending.items():
+            self._known[url] = state
+        self._pending = {}
@@ -0,0 +1,366 @@
+"""
+HTML parsing for the scrapers
+parse_html() uses the fastest installed backend (selectolax, then lxml with
+cssselect, then BeautifulSoup's html.parser) behind one small node API: select,
+select_one, get, text and parent. first_match() finds which of a prioritized
+list of CSS selectors matches, in a single pass over the tree.
+
+Backends are imported on first parse, so importing this module stays cheap.
+
+Environment Variables:
+    SCRAPE_HTML_PARSER   Force a backend: selectolax, lxml or bs4 (default: auto)
+"""
+import os
+import re
+from functools import lru_cache
+
+PARSER_BACKENDS = ('selectolax', 'lxml', 'bs4')
+
+# Text inside these elements isn't page text (matches BeautifulSoup's get_text)
+NON_TEXT_TAGS = frozenset(('script', 'style', 'template'))
+
+
+def _join_text(strings, separator, strip):
+    if strip:
+        strings = (value.strip() for value in strings)
+        return separator.join(value for value in strings if value)
+    return separator.join(strings)
+
+
+class SelectolaxNode:
+    """Element from selectolax's lexbor tree"""
+
+    __slots__ = ('_node',)
+
+    def __init__(self, node):
+        self._node = node
+
+    @property
+    def tag(self):
+        return self._node.tag
+
+    @property
+    def attrs(self):
+        return {name: value or '' for name, value in self._node.attributes.items()}
+
+    @property
+    def parent(self):
+        parent = self._node.parent
+        return SelectolaxNode(parent) if parent is not None and not parent.tag.startswith(('-', '#')) else None
+
+    def get(self, name, default=None):
+        attributes = self._node.attributes
+        if name not in attributes:
+            return default
+        return attributes[name] or ''
+
+    def select(self, css):
+        # Lexbor reports an element once per selector in a group it matches
+        seen = set()
+        nodes = []
+        for node in self._node.css(css):
+            if node.mem_id not in seen:
+                seen.add(node.mem_id)
+                nodes.append(SelectolaxNode(node))
+        return nodes
+
+    def select_one(self, css):
+        node = self._node.css_first(css)
+        return SelectolaxNode(node) if node is not None else None
+
+    def candidates(self, selectors):
+        """(tag, attributes, element) for first_match: Lexbor's native selector-group query is fastest"""
+        seen = set()
+        for node in self._node.css(', '.join(selectors)):
+            if node.mem_id not in seen:
+                seen.add(node.mem_id)
+                yield node.tag, node.attributes, node
+
+    def text(self, separator='', strip=False):
+        if self._node.tag in NON_TEXT_TAGS:
+            return _join_text([self._node.text(deep=True)], separator, strip)
+        strings = (
+            node.text_content for node in self._node.traverse(include_text=True)
+            if node.tag == '-text' and node.parent.tag not in NON_TEXT_TAGS
+        )
+        return _join_text([value for value in strings if value is not None], separator, strip)
+
+
+class LxmlNode:
+    """Element from an lxml.html tree; CSS goes through cached cssselect translations"""
+
+    __slots__ = ('_element',)
+
+    def __init__(self, element):
+        self._element = element
+
+    @property
+    def tag(self):
+        return self._element.tag
+
+    @property
+    def attrs(self):
+        return dict(self._element.attrib)
+
+    @property
+    def parent(self):
+        parent = self._element.getparent()
+        return LxmlNode(parent) if parent is not None else None
+
+    def get(self, name, default=None):
+        return self._element.get(name, default)
+
+    def select(self, css):
+        # cssselect also matches the element itself; the other backends don't
+        return [LxmlNode(element) for element in _lxml_selector(css)(self._element) if element is not self._element]
+
+    def select_one(self, css):
+        matches = self.select(css)
+        return matches[0] if matches else None
+
+    def candidates(self, selectors):
+        """(tag, attributes, element) for every descendant element, for first_match to classify"""
+        for element in self._element.iterdescendants():
+            if isinstance(element.tag, str):  # skip comments and processing instructions
+                yield element.tag, element.attrib, element
+
+    def text(self, separator='', strip=False):
+        if self._element.tag in NON_TEXT_TAGS:
+            return _join_text([self._element.text or ''], separator, strip)
+        return _join_text(_lxml_text(self._element), separator, strip)
+
+
+class SoupNode:
+    """Tag (or the whole document) from BeautifulSoup"""
+
+    __slots__ = ('_tag',)
+
+    def __init__(self, tag):
+        self._tag = tag
+
+    @property
+    def tag(self):
+        return self._tag.name
+
+    @property
+    def attrs(self):
+        return {name: ' '.join(value) if isinstance(value, list) else value for name, value in self._tag.attrs.items()}
+
+    @property
+    def parent(self):
+        parent = self._tag.parent
+        return SoupNode(parent) if parent is not None else None
+
+    def get(self, name, default=None):
+        value = self._tag.get(name, default)
+        return ' '.join(value) if isinstance(value, list) else value
+
+    def select(self, css):
+        return [SoupNode(tag) for tag in self._tag.select(css)]
+
+    def select_one(self, css):
+        tag = self._tag.select_one(css)
+        return SoupNode(tag) if tag is not None else None
+
+    def candidates(self, selectors):
+        """(tag, attributes, element) for every descendant tag, for first_match to classify"""
+        for tag in self._tag.find_all(True):
+            yield tag.name, tag.attrs, tag
+
+    def text(self, separator='', strip=False):
+        return self._tag.get_text(separator, strip=strip)
+
+
+@lru_cache(maxsize=256)
+def _lxml_selector(css):
+    from lxml.cssselect import CSSSelector
+    return CSSSelector(css, translator='html')
+
+
+@lru_cache(maxsize=1)
+def _lxml_text_xpath():
+    from lxml import etree
+    return etree.XPath('.//text()[not(ancestor::script or ancestor::style or ancestor::template)]')
+
+
+def _lxml_text(element):
+    return _lxml_text_xpath()(element)
+
+
+def _parse_selectolax(markup):
+    from selectolax.lexbor import LexborHTMLParser
+    tree = LexborHTMLParser(markup or '<html></html>')
+    return SelectolaxNode(tree.root)
+
+
+def _parse_lxml(markup):
+    import lxml.html
+    if isinstance(markup, str):
+        # lxml rejects str input that carries an XML encoding declaration
+        markup = markup.encode('utf-8')
+        parser = lxml.html.HTMLParser(encoding='utf-8')
+    else:
+        parser = None
+    if not markup.strip():
+        markup = b'<html></html>'
+    return LxmlNode(lxml.html.document_fromstring(markup, parser=parser))
+
+
+def _parse_bs4(markup):
+    from bs4 import BeautifulSoup
+    return SoupNode(BeautifulSoup(markup, 'html.parser'))
+
+
+_PARSERS = {
+    'selectolax': _parse_selectolax,
+    'lxml': _parse_lxml,
+    'bs4': _parse_bs4,
+}
+
+_BACKEND_MODULES = {
+    'selectolax': ('selectolax.lexbor',),
+    'lxml': ('lxml.html', 'lxml.cssselect'),
+    'bs4': ('bs4',),
+}
+
+
+@lru_cache(maxsize=1)
+def available_backends():
+    """Installed backends, fastest first"""
+    import importlib
+
+    available = []
+    for name in PARSER_BACKENDS:
+        try:
+            for module in _BACKEND_MODULES[name]:
+                importlib.import_module(module)
+        except ImportError:
+            continue
+        available.append(name)
+    return tuple(available)
+
+
+def get_backend(name=None):
+    """Resolve a backend name, honouring SCRAPE_HTML_PARSER and falling back to the fastest installed"""
+    name = (name or os.getenv('SCRAPE_HTML_PARSER', 'auto')).lower()
+    available = available_backends()
+    if name != 'auto':
+        if name not in _PARSERS:
+            raise ValueError(f"Unknown HTML parser '{name}', expected one of {', '.join(PARSER_BACKENDS)}")
+        if name not in available:
+            raise ImportError(f"HTML parser '{name}' is not installed")
+        return name
+    if not available:
+        raise ImportError("No HTML parser installed; pip install selectolax, lxml or beautifulsoup4")
+    return available[0]
+
+
+def parse_html(markup, backend=None):
+    """Parse a page (str or bytes) and return its root node"""
+    return _PARSERS[get_backend(backend)](markup)
+
+
+# --- Selector matching -------------------------------------------------------
+
+_SELECTOR_PART = re.compile(r'''
+    (?P<tag>[a-zA-Z][\w-]*|\*)
+  | \.(?P<cls>[\w-]+)
+  | \#(?P<id>[\w-]+)
+  | \[\s*(?P<attr>[\w-]+)\s*(?:(?P<op>[~^$*|]?=)\s*(?:"(?P<dq>[^"]*)"|'(?P<sq>[^']*)'|(?P<bare>[\w-]+))\s*)?\]
+''', re.VERBOSE)
+
+_ATTR_TESTS = {
+    None: lambda actual, value: True,
+    '=': lambda actual, value: actual == value,
+    '~=': lambda actual, value: value in actual.split(),
+    '^=': lambda actual, value: bool(value) and actual.startswith(value),
+    '$=': lambda actual, value: bool(value) and actual.endswith(value),
+    '*=': lambda actual, value: bool(value) and value in actual,
+    '|=': lambda actual, value: actual == value or actual.startswith(value + '-'),
+}
+
+
+def _attr_value(value):
+    """Attribute value as a string (BeautifulSoup gives lists for class, selectolax None for bare attributes)"""
+    if value is None:
+        return ''
+    return ' '.join(value) if isinstance(value, list) else value
+
+
+class CompoundSelector:
+    """One compound CSS selector: tag, .class, #id and [attr op value] parts, no combinators"""
+
+    __slots__ = ('selector', 'tag', 'classes', 'attr_tests')
+
+    def __init__(self, selector):
+        self.selector = selector.strip()
+        self.tag = None
+        self.classes = frozenset()
+        self.attr_tests = []
+
+        classes = set()
+        position = 0
+        while position < len(self.selector):
+            match = _SELECTOR_PART.match(self.selector, position)
+            if match is None or (match.group('tag') and position):
+                raise ValueError(f"Unsupported selector for first_match: '{selector}'")
+            position = match.end()
+
+            if match.group('tag'):
+                if match.group('tag') != '*':
+                    self.tag = match.group('tag').lower()
+            elif match.group('cls'):
+                classes.add(match.group('cls'))
+            elif match.group('id'):
+                self.attr_tests.append(('id', _ATTR_TESTS['='], match.group('id')))
+            else:
+                op = match.group('op')
+                value = next((group for group in match.group('dq', 'sq', 'bare') if group is not None), None)
+                self.attr_tests.append((match.group('attr'), _ATTR_TESTS[op], value))
+
+        if not self.selector:
+            raise ValueError("Empty selector")
+        self.classes = frozenset(classes)
+
+    def matches(self, tag, attrs, classes):
+        """`classes` is the element's class list, split once by the caller"""
+        if self.tag is not None and tag != self.tag:
+            return False
+        if self.classes and not self.classes.issubset(classes):
+            return False
+        for name, test, value in self.attr_tests:
+            if name not in attrs or not test(_attr_value(attrs[name]), value):
+                return False
+        return True
+
+
+@lru_cache(maxsize=64)
+def compile_selectors(selectors):
+    return tuple(CompoundSelector(selector) for selector in selectors)
+
+
+def first_match(root, selectors):
+    """Return (selector, nodes) for the first selector in `selectors` that matches anything
+
+    Replaces running select() once per selector: every element is checked
+    against the whole list in a single pass over the tree (or, on selectolax,
+    one native query for the selector group), keeping the earliest selector
+    that matched and the nodes it matched in document order.
+    Returns (None, []) when nothing matches.
+    """
+    compiled = compile_selectors(tuple(selectors))
+    best = len(compiled)
+    matched = []
+    for tag, attrs, element in root.candidates(selectors):
+        classes = _attr_value(attrs.get('class')).split()
+        for index in range(min(best + 1, len(compiled))):
+            if compiled[index].matches(tag, attrs, classes):
+                if index < best:
+                    best = index
+                    matched = []
+                matched.append(element)
+                break
+    if best == len(compiled):
+        return None, []
+    node_class = type(root)
+    return compiled[best].selector, [node_class(element) for element in matched]
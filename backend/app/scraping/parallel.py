@@ -0,0 +1,163 @@
+"""
+Parse fetched pages in worker processes
+HTML parsing and the per-record normalization (extract_job_from_text's keyword
+scans, location heuristics, detail-page parsing) are CPU-bound, so in the
+scraping threads they run one at a time under the GIL. Source.scrape hands
+them to a shared process pool instead: a page is parsed in one worker, its
+records are normalized in chunks across all workers, and detail pages are
+parsed in chunks the same way. Results are collected in submission order, so
+jobs come out exactly as a serial run would produce them. Fetching stays in
+the source's threads and HttpFetcher.
+
+The pool is off by default. Worker processes only pay off with free cores and
+pages much bigger than a 50-job scrape: on small pages the pickling and IPC cost
+more than the parsing (python -m benchmarks.parallel_parsing measures both).
+
+Sources travel to the workers by pickling, once per call; Source.__getstate__
+leaves out connections, callbacks and other state that only makes sense in the
+scraping process (see Source.process_local). A source that can't be pickled is
+parsed in-process.
+
+The pool uses the 'spawn' start method: the scrape threads, database pools and
+browser drivers of the parent are never forked, and it works the same on Windows.
+Spawned workers import the parent's __main__ module, so any script that scrapes
+with the pool on must keep its work under `if __name__ == '__main__':`.
+
+Environment Variables:
+    SCRAPE_PARSE_WORKERS      Parser processes, or 'auto' for one per core (default: 0, parse in the scraping thread)
+    SCRAPE_PARSE_CHUNK_SIZE   Records or detail pages per task (default: 20)
+"""
+import multiprocessing
+import os
+import pickle
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def parse_workers():
+    workers = os.getenv('SCRAPE_PARSE_WORKERS', '0').strip().lower()
+    if workers == 'auto':
+        return os.cpu_count() or 1
+    return int(workers or 0)
+
+
+def chunk_size():
+    return max(1, int(os.getenv('SCRAPE_PARSE_CHUNK_SIZE', '20')))
+
+
+def get_parse_pool():
+    """Lazily create the shared parser pool; None when parsing should stay in-process"""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            workers = parse_workers()
+            if workers <= 1:
+                return None
+            _pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn'))
+        return _pool
+
+
+def shutdown_parse_pool():
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=False, cancel_futures=True)
+            _pool = None
+
+
+def chunked(items, size):
+    return [items[start:start + size] for start in range(0, len(items), size)]
+
+
+# --- Worker tasks (module level so they can be pickled) -------------------------
+
+# The last source a worker unpickled, so the chunks of one call load it once
+_worker_source = (None, None)
+
+
+def _load_source(payload):
+    global _worker_source
+    if _worker_source[0] != payload:
+        _worker_source = (payload, pickle.loads(payload))
+    return _worker_source[1]
+
+
+def parse_records(payload, page):
+    return _load_source(payload).parse(page)
+
+
+def normalize_records(payload, page, records):
+    source = _load_source(payload)
+    return [source.normalize(record, page) for record in records]
+
+
+def parse_details(payload, pages):
+    source = _load_source(payload)
+    return [source.parse_job_detail(html) for html in pages]
+
+
+# --- Scraping-side helpers ------------------------------------------------------
+
+def _map_chunks(pool, payload, func, items, *args):
+    """func(payload, *args, chunk) over `items` in chunks on the pool, flattened in order"""
+    if len(items) <= chunk_size():
+        # One chunk's worth isn't worth a round trip to a worker
+        return func(payload, *args, items)
+    futures = [pool.submit(func, payload, *args, chunk) for chunk in chunked(items, chunk_size())]
+    return [result for future in futures for result in future.result()]
+
+
+def _with_pool(source, in_pool, in_process):
+    """in_pool(pool, payload) with the source pickled once, else in_process()
+
+    Falls back to in-process parsing when the pool is off, the source can't be
+    pickled, or a worker died.
+    """
+    pool = get_parse_pool()
+    if pool is None:
+        return in_process()
+    try:
+        payload = pickle.dumps(source)
+    except Exception as e:
+        print(f"⚠️ {source.name} can't be sent to a parser process ({e}), parsing in-process")
+        return in_process()
+    try:
+        return in_pool(pool, payload)
+    except BrokenProcessPool as e:
+        print(f"⚠️ Parser pool failed ({e}), parsing in-process")
+        shutdown_parse_pool()
+        return in_process()
+
+
+def parse_page(source, page):
+    """Jobs from one page: source.parse in a worker, then source.normalize in chunks across the pool"""
+    # Records carry what normalize needs; don't ship the page body with every chunk
+    light_page = type(page)(page.url, page.kind)
+
+    def in_process():
+        return [job for job in (source.normalize(record, light_page) for record in source.parse(page)) if job]
+
+    def in_pool(pool, payload):
+        if page.records is None:
+            records = pool.submit(parse_records, payload, page).result()
+        else:
+            records = source.parse(page)
+        jobs = _map_chunks(pool, payload, normalize_records, records, light_page)
+        return [job for job in jobs if job]
+
+    return _with_pool(source, in_pool, in_process)
+
+
+def parse_detail_pages(source, pages):
+    """source.parse_job_detail over detail page HTML in chunks across the pool, in order"""
+    if not pages:
+        return []
+    return _with_pool(
+        source,
+        lambda pool, payload: _map_chunks(pool, payload, parse_details, pages),
+        lambda: [source.parse_job_detail(html) for html in pages]
+    )
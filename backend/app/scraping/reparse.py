@@ -0,0 +1,113 @@
+"""
+Re-run the parsers over stored snapshots
+Each listing, home or rendered jobs page in the snapshot store goes back
+through its source's parse() and normalize(), and the job's detail page, if
+one was stored, through parse_job_detail(). Pages are parsed in worker
+processes (the parsers are CPU-bound, so threads would queue on the GIL); the
+jobs come back in snapshot order and are ingested by the calling process, so
+database writes stay on one session and the newest snapshot of a listing wins.
+Workers are spawned, not forked, so they never inherit the caller's database
+connections or threads; scripts that call reparse need a __main__ guard.
+
+    store = SnapshotStore(path)
+    summary = reparse(store, store.find(exclude_kinds=('detail',)), ingest=ingest_jobs)
+"""
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from app.scraping.snapshots import SnapshotStore
+from app.scraping.sources import Page, create_source
+
+# One store and source per worker process, reused for every page it parses
+_worker_store = None
+_worker_options = None
+_worker_sources = {}
+
+
+def _init_worker(root, max_jobs, fetch_details, until):
+    global _worker_store, _worker_options
+    _worker_store = SnapshotStore(root)
+    _worker_options = (max_jobs, fetch_details, until)
+    _worker_sources.clear()
+
+
+def _worker_source(name):
+    if name not in _worker_sources:
+        max_jobs = _worker_options[0]
+        _worker_sources[name] = create_source(name, max_jobs=max_jobs)
+    return _worker_sources[name]
+
+
+def parse_snapshot(entry):
+    """(jobs, error) for one stored page (runs in a worker process)"""
+    try:
+        return _parse_snapshot(entry), None
+    except Exception as e:
+        return [], f"{type(e).__name__}: {e}"
+
+
+def _parse_snapshot(entry):
+    _, fetch_details, until = _worker_options
+    source = _worker_source(entry.source)
+    page = Page(entry.url, entry.kind, content=_worker_store.read(entry.digest))
+
+    jobs = []
+    for record in source.parse(page):
+        job = source.normalize(record, page)
+        if job:
+            jobs.append(job)
+
+    if fetch_details:
+        for job in jobs:
+            url = source.detail_url(job)
+            detail = _worker_store.find(url=url, kind='detail', until=until) if url else None
+            if detail:
+                job.update(source.parse_job_detail(_worker_store.read(detail[-1].digest).decode('utf-8', 'replace')))
+    return jobs
+
+
+def reparse(store, entries, ingest=None, workers=None, max_jobs=None, fetch_details=True, until=None):
+    """Parse `entries` (SnapshotEntry list) in a process pool and pass each page's jobs to `ingest`
+
+    Without `ingest` nothing is written, which makes a network-free parsing
+    benchmark. Detail pages are looked up by URL, newest before `until`.
+    Returns a summary dict with pages, jobs, ingest counts and timing.
+    """
+    workers = workers or os.cpu_count() or 1
+    options = (store.root, max_jobs or sys.maxsize, fetch_details, until)
+    summary = {'pages': len(entries), 'jobs': 0, 'failed': 0, 'saved': 0, 'updated': 0, 'skipped': 0}
+    started = time.monotonic()
+
+    def collect(results):
+        for entry, (jobs, error) in zip(entries, results):
+            if error:
+                summary['failed'] += 1
+                print(f"❌ Could not parse {entry.kind} snapshot of {entry.url} ({entry.fetched_at:%Y-%m-%d %H:%M}): {error}")
+                continue
+            summary['jobs'] += len(jobs)
+            if ingest is not None and jobs:
+                counts = ingest(jobs)
+                for key in ('saved', 'updated', 'skipped'):
+                    summary[key] += counts[key]
+
+    if workers == 1 or len(entries) <= 1:
+        workers = 1
+        _init_worker(*options)
+        collect(map(parse_snapshot, entries))
+    else:
+        # A few pages per task keeps pickling overhead down without starving workers
+        chunk_size = max(1, len(entries) // (workers * 4))
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context('spawn'),
+            initializer=_init_worker,
+            initargs=options
+        ) as executor:
+            collect(executor.map(parse_snapshot, entries, chunksize=chunk_size))
+
+    summary['workers'] = workers
+    summary['elapsed_seconds'] = round(time.monotonic() - started, 3)
+    return summary
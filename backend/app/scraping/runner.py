@@ -0,0 +1,121 @@
+"""
+Run several job board sources at once
+Each source scrapes in its own thread with its own HttpFetcher, so concurrency
+and rate limits apply per board and a slow board doesn't hold up the others.
+Batches come back over a queue and the calling thread ingests each one as it
+arrives: database writes stay on one session while the sources keep fetching.
+
+    runner = SourceRunner(sources, ingest=ingest_jobs, app=app)
+    results = runner.run()   # {name: SourceResult}
+"""
+import queue
+import threading
+import time
+from contextlib import nullcontext
+
+COUNT_KEYS = ('saved', 'updated', 'skipped')
+
+
+class SourceResult:
+    """Counts and timing for one source in a run"""
+
+    def __init__(self, name):
+        self.name = name
+        self.jobs_found = 0
+        self.unchanged = 0
+        self.counts = dict.fromkeys(COUNT_KEYS, 0)
+        self.error = None
+        self.started = time.monotonic()
+        self.duration = None
+
+    def to_dict(self):
+        return dict(
+            self.counts,
+            source=self.name,
+            jobs_found=self.jobs_found,
+            unchanged=self.unchanged,
+            error=self.error,
+            duration_seconds=round(self.duration, 2) if self.duration is not None else None
+        )
+
+
+class SourceRunner:
+    """Scrape `sources` concurrently and feed their batches to `ingest` on the calling thread
+
+    `ingest(jobs)` returns {'saved', 'updated', 'skipped'} counts, like ingest_jobs.
+    `on_progress(message, jobs_found)` sees every source's progress messages, and
+    jobs_found summed over the sources. With `app`, source threads run inside an
+    app context (crawl state lookups need one).
+    """
+
+    def __init__(self, sources, ingest, app=None, on_progress=None):
+        self.sources = list(sources)
+        self.ingest = ingest
+        self.app = app
+        self.on_progress = on_progress
+        self.results = {source.name: SourceResult(source.name) for source in self.sources}
+
+    def _scrape(self, source, events):
+        context = self.app.app_context() if self.app is not None else nullcontext()
+        try:
+            with context:
+                for batch in source.scrape():
+                    events.put(('jobs', source, batch))
+        except Exception as e:
+            events.put(('error', source, e))
+        finally:
+            source.close()
+            events.put(('done', source, None))
+
+    def _handle(self, kind, source, payload):
+        result = self.results[source.name]
+        if kind == 'progress':
+            message, jobs_found = payload
+            if jobs_found is not None:
+                result.jobs_found = jobs_found
+                jobs_found = sum(r.jobs_found for r in self.results.values())
+            if self.on_progress:
+                self.on_progress(message, jobs_found)
+        elif kind == 'jobs':
+            counts = self.ingest(payload)
+            for key in COUNT_KEYS:
+                result.counts[key] += counts[key]
+        elif kind == 'error':
+            result.error = str(payload) or type(payload).__name__
+            print(f"❌ {source.name} failed: {result.error}")
+        elif kind == 'done':
+            result.duration = time.monotonic() - result.started
+            if source.crawl_state is not None:
+                result.unchanged = source.crawl_state.listings_unchanged
+                # Remember what was seen only once it's stored, and not after a failure
+                if result.error is None:
+                    source.crawl_state.save()
+
+    def run(self):
+        events = queue.Queue()
+        for source in self.sources:
+            source.progress_callback = lambda message, jobs_found=None, source=source: \
+                events.put(('progress', source, (message, jobs_found)))
+
+        threads = [
+            threading.Thread(target=self._scrape, args=(source, events), name=f'source-{source.name}', daemon=True)
+            for source in self.sources
+        ]
+        for thread in threads:
+            thread.start()
+
+        remaining = len(threads)
+        while remaining:
+            kind, source, payload = events.get()
+            try:
+                self._handle(kind, source, payload)
+            except Exception as e:
+                # An ingest failure ends this source's results, not the others'
+                self.results[source.name].error = f"Saving failed: {e}"
+                print(f"❌ {source.name}: saving failed: {e}")
+            if kind == 'done':
+                remaining -= 1
+
+        for thread in threads:
+            thread.join()
+        return self.results
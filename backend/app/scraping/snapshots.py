@@ -0,0 +1,170 @@
+"""
+Raw page snapshot store
+Every page a source fetches is kept as a gzip-compressed blob named by the
+sha256 of its content (objects/ab/cdef....gz), so a page that didn't change is
+stored once however often it's fetched. index.db, a SQLite file next to the
+blobs, records each fetch by URL and time. The directory is self-contained:
+copy it to re-parse or benchmark somewhere else without network access.
+
+    store = get_snapshot_store()
+    store.save(url, response.content, source='actuarylist', kind='listing')
+    for entry in store.find(source='actuarylist', latest=True):
+        html = store.read(entry.digest)
+
+Environment Variables:
+    SCRAPE_SNAPSHOTS      Save fetched pages (default: True)
+    SCRAPE_SNAPSHOT_DIR   Store location (default: backend/instance/snapshots)
+"""
+import gzip
+import hashlib
+import os
+import sqlite3
+import tempfile
+from collections import namedtuple
+from datetime import datetime, UTC
+
+DEFAULT_SNAPSHOT_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), 'instance', 'snapshots'
+)
+
+SnapshotEntry = namedtuple('SnapshotEntry', 'url source kind digest size status_code fetched_at')
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS snapshots (
+    id INTEGER PRIMARY KEY,
+    url TEXT NOT NULL,
+    source TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    digest TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    status_code INTEGER,
+    fetched_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ix_snapshots_url_fetched_at ON snapshots (url, fetched_at);
+CREATE INDEX IF NOT EXISTS ix_snapshots_source_kind_fetched_at ON snapshots (source, kind, fetched_at);
+"""
+
+
+def _timestamp(moment):
+    # Naive UTC ISO strings sort and compare correctly as text
+    if moment.tzinfo is not None:
+        moment = moment.astimezone(UTC).replace(tzinfo=None)
+    return moment.isoformat(sep=' ')
+
+
+class SnapshotStore:
+    """Content-addressed page blobs plus a SQLite index; safe to share between threads and processes"""
+
+    def __init__(self, root=DEFAULT_SNAPSHOT_DIR):
+        self.root = root
+        os.makedirs(os.path.join(root, 'objects'), exist_ok=True)
+        self.index_path = os.path.join(root, 'index.db')
+        with self._connect() as connection:
+            connection.executescript(_SCHEMA)
+
+    def _connect(self):
+        # A connection per call: sqlite3 connections can't be shared across threads
+        connection = sqlite3.connect(self.index_path, timeout=30)
+        connection.execute('PRAGMA journal_mode=WAL')
+        return connection
+
+    def object_path(self, digest):
+        return os.path.join(self.root, 'objects', digest[:2], digest[2:] + '.gz')
+
+    def save(self, url, content, source, kind, fetched_at=None, status_code=200):
+        """Store a fetched page (bytes or str) and index it; returns the content digest"""
+        if isinstance(content, str):
+            content = content.encode('utf-8')
+        digest = hashlib.sha256(content).hexdigest()
+
+        path = self.object_path(digest)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            # Write then rename, so readers never see half a blob
+            handle, temporary = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+            try:
+                with os.fdopen(handle, 'wb') as output:
+                    output.write(gzip.compress(content, compresslevel=6))
+                os.replace(temporary, path)
+            except BaseException:
+                if os.path.exists(temporary):
+                    os.remove(temporary)
+                raise
+
+        with self._connect() as connection:
+            connection.execute(
+                'INSERT INTO snapshots (url, source, kind, digest, size, status_code, fetched_at) VALUES (?, ?, ?, ?, ?, ?, ?)',
+                (url, source, kind, digest, len(content), status_code, _timestamp(fetched_at or datetime.now(UTC)))
+            )
+        return digest
+
+    def read(self, digest):
+        """Decompressed content of a stored page"""
+        with open(self.object_path(digest), 'rb') as handle:
+            return gzip.decompress(handle.read())
+
+    def find(self, source=None, kind=None, url=None, since=None, until=None, latest=True, exclude_kinds=()):
+        """Index entries matching the filters, oldest first; with `latest`, only the newest fetch of each URL"""
+        conditions = []
+        params = []
+        for column, value in (('source', source), ('kind', kind), ('url', url)):
+            if value is not None:
+                conditions.append(f'{column} = ?')
+                params.append(value)
+        if since is not None:
+            conditions.append('fetched_at >= ?')
+            params.append(_timestamp(since))
+        if until is not None:
+            conditions.append('fetched_at < ?')
+            params.append(_timestamp(until))
+        if exclude_kinds:
+            conditions.append(f"kind NOT IN ({', '.join('?' * len(exclude_kinds))})")
+            params.extend(exclude_kinds)
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ''
+
+        query = f'SELECT url, source, kind, digest, size, status_code, fetched_at FROM snapshots {where}'
+        if latest:
+            query = (
+                f'SELECT url, source, kind, digest, size, status_code, fetched_at FROM ('
+                f'SELECT *, ROW_NUMBER() OVER (PARTITION BY url ORDER BY fetched_at DESC, id DESC) AS position '
+                f'FROM snapshots {where}) WHERE position = 1'
+            )
+        query += ' ORDER BY fetched_at, url'
+
+        with self._connect() as connection:
+            rows = connection.execute(query, params).fetchall()
+        return [
+            SnapshotEntry(*row[:6], datetime.fromisoformat(row[6]))
+            for row in rows
+        ]
+
+    def latest(self, url, kind=None):
+        """Newest snapshot of `url` (of `kind`, if given), or None"""
+        entries = self.find(url=url, kind=kind)
+        return entries[-1] if entries else None
+
+    def stats(self):
+        with self._connect() as connection:
+            fetches, urls, raw_bytes = connection.execute(
+                'SELECT COUNT(*), COUNT(DISTINCT url), COALESCE(SUM(size), 0) FROM snapshots'
+            ).fetchone()
+        objects = stored_bytes = 0
+        for directory, _, files in os.walk(os.path.join(self.root, 'objects')):
+            for name in files:
+                if name.endswith('.gz'):
+                    objects += 1
+                    stored_bytes += os.path.getsize(os.path.join(directory, name))
+        return {
+            'fetches': fetches,
+            'urls': urls,
+            'objects': objects,
+            'fetched_bytes': raw_bytes,
+            'stored_bytes': stored_bytes
+        }
+
+
+def get_snapshot_store():
+    """The configured store, or None when SCRAPE_SNAPSHOTS is off"""
+    if os.getenv('SCRAPE_SNAPSHOTS', 'True').lower() != 'true':
+        return None
+    return SnapshotStore(os.getenv('SCRAPE_SNAPSHOT_DIR') or DEFAULT_SNAPSHOT_DIR)
@@ -0,0 +1,266 @@
+"""
+Job board sources
+A Source turns one job board into job dicts for ingest_jobs in three steps:
+fetch() yields Pages, parse() reads raw records off a page and normalize()
+turns each record into a job dict. scrape() chains them and yields one batch
+of jobs per page, so a runner can ingest early pages while later ones are still
+being fetched (see app/scraping/runner.py).
+
+Every source has its own HttpFetcher, so connection pool, concurrency and
+per-host rate limit are per board. Sources register under a short name:
+
+    @register_source
+    class ExampleBoard(Source):
+        name = 'example'
+        def fetch(self): ...
+        def parse(self, page): ...
+        def normalize(self, record, page): ...
+
+Built-in sources are imported only when first used. With a SnapshotStore
+(app/scraping/snapshots.py) every fetched page is also saved, so the parsers can
+be re-run over it later without the network (python reparse.py).
+
+parse(), normalize() and parse_job_detail() run in worker processes (see
+app/scraping/parallel.py): they get a pickled copy of the source without the
+attributes named in process_local, and must not rely on fetching or on
+changing the source's state.
+
+Environment Variables:
+    SCRAPE_<NAME>_CONCURRENCY           Concurrent requests to one source (default: SCRAPE_DETAIL_CONCURRENCY, else 8)
+    SCRAPE_<NAME>_REQUESTS_PER_SECOND   Per-host rate limit for one source (default: SCRAPE_REQUESTS_PER_SECOND, else 2)
+"""
+import importlib
+import os
+import time
+
+from app.scraping import parallel
+from app.scraping.http import HttpFetcher
+
+# name -> 'module:Class' for sources that ship with the app
+BUILTIN_SOURCES = {
+    'actuarylist': 'app.scrape_jobs:ActuaryListScraper',
+}
+
+_registry = {}
+
+
+class Page:
+    """One fetched page: raw `content` (bytes) to parse, or `records` a browser already extracted"""
+
+    __slots__ = ('url', 'kind', 'content', 'records')
+
+    def __init__(self, url, kind, content=None, records=None):
+        self.url = url
+        self.kind = kind
+        self.content = content
+        self.records = records
+
+
+class Source:
+    """Base class for job board scrapers"""
+
+    name = None
+    max_concurrency = 8
+    requests_per_second = 2.0
+    # Left out when the source is sent to a parser process
+    process_local = ('http', 'crawl_state', 'snapshots', 'progress_callback')
+
+    def __init__(self, max_jobs=50, progress_callback=None, fetch_details=False, crawl_state=None,
+                 max_concurrency=None, requests_per_second=None, snapshots=None):
+        self.max_jobs = max_jobs
+        self.progress_callback = progress_callback
+        self.fetch_details = fetch_details
+
+        # Optional CrawlTracker: conditional requests and only new or changed listings
+        self.crawl_state = crawl_state
+        self.all_listings_unchanged = False
+        self.jobs_found = 0
+
+        # Optional SnapshotStore that keeps every fetched page
+        self.snapshots = snapshots
+
+        self.http = HttpFetcher(
+            max_concurrency=max_concurrency or self.max_concurrency,
+            requests_per_second=self.requests_per_second if requests_per_second is None else requests_per_second
+        )
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        for name in self.process_local:
+            state[name] = None
+        return state
+
+    def report_progress(self, message, jobs_found=None):
+        """Print a progress message and forward it to the progress callback, if any"""
+        print(message)
+        if self.progress_callback:
+            try:
+                self.progress_callback(message, jobs_found)
+            except Exception as e:
+                print(f"⚠️ Progress callback failed: {e}")
+
+    # --- The plugin interface ---------------------------------------------------
+
+    def fetch(self):
+        """Yield Pages; runs lazily, so it can look at jobs_found to decide on fallbacks"""
+        raise NotImplementedError
+
+    def parse(self, page):
+        """Raw records (plain dicts) from one page"""
+        raise NotImplementedError
+
+    def normalize(self, record, page):
+        """A job dict for ingest_jobs, or None to drop the record; `page` has only url and kind here"""
+        raise NotImplementedError
+
+    def detail_url(self, job):
+        """URL of the job's detail page when fetch_details is on; None to skip it"""
+        return None
+
+    def parse_job_detail(self, html):
+        """Fields read from a detail page, merged into the job"""
+        return {}
+
+    # --- Pipeline -----------------------------------------------------------------
+
+    def save_snapshot(self, url, content, kind):
+        """Keep a fetched page in the snapshot store; a failure to save never stops the scrape"""
+        if self.snapshots is None or content is None:
+            return
+        try:
+            self.snapshots.save(url, content, source=self.name, kind=kind)
+        except Exception as e:
+            print(f"⚠️ Could not save a snapshot of {url}: {e}")
+
+    def scrape(self):
+        """Yield a list of new or changed jobs per page, up to max_jobs in total"""
+        self.jobs_found = 0
+        for page in self.fetch():
+            self.save_snapshot(page.url, page.content, page.kind)
+            jobs = parallel.parse_page(self, page)
+            jobs = jobs[:max(self.max_jobs - self.jobs_found, 0)]
+            self.jobs_found += len(jobs)
+            self.report_progress(f"✅ {self.name}: {len(jobs)} jobs from the {page.kind} page", jobs_found=self.jobs_found)
+
+            jobs = self.keep_changed_listings(jobs)
+            if jobs and self.fetch_details:
+                jobs = self.enrich_with_details(jobs)
+            if jobs:
+                yield jobs
+            if self.jobs_found >= self.max_jobs:
+                break
+
+    def scrape_all(self):
+        """Every job scrape() yields, as one list"""
+        return [job for batch in self.scrape() for job in batch]
+
+    def fetch_page(self, url, **kwargs):
+        """GET a page; with a crawl tracker the request is conditional and None means unchanged since last run"""
+        if self.crawl_state is None:
+            return self.http.get(url, **kwargs)
+
+        self.crawl_state.load([url])
+        response = self.http.get(url, headers=self.crawl_state.conditional_headers(url), **kwargs)
+        if not self.crawl_state.page_changed(url, response):
+            return None
+        return response
+
+    def keep_changed_listings(self, jobs):
+        """With a crawl tracker, drop listings that haven't changed since they were last ingested"""
+        if self.crawl_state is None or not jobs:
+            return jobs
+
+        changed = self.crawl_state.changed_listings(jobs)
+        if not changed:
+            self.all_listings_unchanged = True
+        self.report_progress(f"🔁 {len(changed)} new or changed listings, {len(jobs) - len(changed)} unchanged")
+        return changed
+
+    def enrich_with_details(self, jobs):
+        """Fetch each job's detail page concurrently and merge in what parse_job_detail finds"""
+        urls = {id(job): self.detail_url(job) for job in jobs}
+        detail_urls = [url for url in urls.values() if url]
+        if not detail_urls:
+            return jobs
+
+        self.report_progress(f"📄 Fetching {len(set(detail_urls))} job detail pages...")
+        started = time.monotonic()
+        headers = None
+        if self.crawl_state is not None:
+            # Only listings ingested before can use a 304: new ones need the page body
+            self.crawl_state.load(detail_urls)
+            headers = {
+                urls[id(job)]: self.crawl_state.conditional_headers(urls[id(job)])
+                for job in jobs if urls[id(job)] and self.crawl_state.seen_before(job)
+            }
+        responses = self.http.fetch_many(detail_urls, headers=headers)
+
+        unchanged = 0
+        to_parse = []
+        for job in jobs:
+            url = urls[id(job)]
+            response = responses.get(url) if url else None
+            if response is None or isinstance(response, Exception):
+                continue
+            if response.status_code == 200:
+                self.save_snapshot(url, response.content, 'detail')
+            if self.crawl_state is not None:
+                changed = self.crawl_state.page_changed(url, response)
+                if not changed and self.crawl_state.seen_before(job):
+                    # Keep the details saved last time rather than the listing's placeholders
+                    job.pop('description', None)
+                    job.pop('salary_range', None)
+                    unchanged += 1
+                    continue
+            to_parse.append((job, response.text))
+
+        enriched = 0
+        details = parallel.parse_detail_pages(self, [html for _, html in to_parse])
+        for (job, _), fields in zip(to_parse, details):
+            if fields:
+                job.update(fields)
+                enriched += 1
+
+        elapsed = time.monotonic() - started
+        skipped = f", {unchanged} unchanged" if unchanged else ""
+        self.report_progress(f"✅ Enriched {enriched}/{len(jobs)} jobs from detail pages in {elapsed:.1f}s{skipped}")
+        return jobs
+
+    def close(self):
+        self.http.close()
+
+
+def register_source(cls):
+    """Class decorator that makes a Source available by its name"""
+    if not cls.name:
+        raise ValueError(f"{cls.__name__} needs a name to be registered")
+    _registry[cls.name] = cls
+    return cls
+
+
+def available_sources():
+    """Names of every registered or built-in source"""
+    return tuple(sorted(set(BUILTIN_SOURCES) | set(_registry)))
+
+
+def get_source_class(name):
+    name = name.strip().lower()
+    if name not in _registry:
+        if name not in BUILTIN_SOURCES:
+            raise ValueError(f"Unknown scrape source '{name}', expected one of {', '.join(available_sources())}")
+        module_name, class_name = BUILTIN_SOURCES[name].split(':')
+        _registry[name] = getattr(importlib.import_module(module_name), class_name)
+    return _registry[name]
+
+
+def create_source(name, **options):
+    """Instantiate a source, filling in its concurrency and rate limit from the environment"""
+    cls = get_source_class(name)
+    prefix = f"SCRAPE_{cls.name.upper()}_"
+    concurrency = os.getenv(prefix + 'CONCURRENCY', os.getenv('SCRAPE_DETAIL_CONCURRENCY'))
+    rate = os.getenv(prefix + 'REQUESTS_PER_SECOND', os.getenv('SCRAPE_REQUESTS_PER_SECOND'))
+    if concurrency and 'max_concurrency' not in options:
+        options['max_concurrency'] = int(concurrency)
+    if rate and 'requests_per_second' not in options:
+        options['requests_per_second'] = float(rate)
+    return cls(**options)
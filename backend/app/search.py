@@ -0,0 +1,168 @@
+"""
+Full-text search for job listings
+PostgreSQL uses a generated tsvector column with a GIN index, SQLite uses an FTS5 table
+kept in sync by triggers. Anything else falls back to ILIKE matching.
+"""
+import re
+
+from sqlalchemy import Float, cast, text, func, literal, literal_column, select, table, column, or_
+
+from app.models import db, Job
+
+# Column weights, most important first: title, company, description
+SQLITE_BM25_WEIGHTS = (10.0, 5.0, 1.0)
+
+SQLITE_FTS_STATEMENTS = [
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS jobs_fts USING fts5(
+        title, company, description,
+        content='jobs', content_rowid='id', tokenize='porter unicode61'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS jobs_fts_ai AFTER INSERT ON jobs BEGIN
+        INSERT INTO jobs_fts(rowid, title, company, description)
+        VALUES (new.id, new.title, new.company, new.description);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS jobs_fts_ad AFTER DELETE ON jobs BEGIN
+        INSERT INTO jobs_fts(jobs_fts, rowid, title, company, description)
+        VALUES ('delete', old.id, old.title, old.company, old.description);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS jobs_fts_au AFTER UPDATE OF title, company, description ON jobs BEGIN
+        INSERT INTO jobs_fts(jobs_fts, rowid, title, company, description)
+        VALUES ('delete', old.id, old.title, old.company, old.description);
+        INSERT INTO jobs_fts(rowid, title, company, description)
+        VALUES (new.id, new.title, new.company, new.description);
+    END
+    """,
+]
+
+POSTGRES_FTS_STATEMENTS = [
+    """
+    ALTER TABLE jobs ADD COLUMN IF NOT EXISTS search_vector tsvector
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('english', coalesce(title, '')), 'A') ||
+        setweight(to_tsvector('english', coalesce(company, '')), 'B') ||
+        setweight(to_tsvector('english', coalesce(description, '')), 'C')
+    ) STORED
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_jobs_search_vector ON jobs USING GIN (search_vector)",
+]
+
+# Detected backend per database URL: 'postgresql', 'sqlite' or 'ilike'
+_search_backends = {}
+
+
+def _detect_backend():
+    """Work out which search backend the current database supports"""
+    dialect = db.engine.dialect.name
+
+    if dialect == 'postgresql':
+        found = db.session.execute(text(
+            "SELECT 1 FROM information_schema.columns "
+            "WHERE table_name = 'jobs' AND column_name = 'search_vector'"
+        )).first()
+        return 'postgresql' if found else 'ilike'
+
+    if dialect == 'sqlite':
+        found = db.session.execute(text(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'jobs_fts'"
+        )).first()
+        return 'sqlite' if found else 'ilike'
+
+    return 'ilike'
+
+
+def get_search_backend():
+    """Return the cached search backend for the current database"""
+    key = str(db.engine.url)
+    if key not in _search_backends:
+        _search_backends[key] = _detect_backend()
+    return _search_backends[key]
+
+
+def ensure_search_index():
+    """Create the full-text index for the current database if it's missing"""
+    dialect = db.engine.dialect.name
+
+    try:
+        if dialect == 'postgresql':
+            for statement in POSTGRES_FTS_STATEMENTS:
+                db.session.execute(text(statement))
+            db.session.commit()
+            print("✅ PostgreSQL full-text index ready")
+
+        elif dialect == 'sqlite':
+            existed = db.session.execute(text(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'jobs_fts'"
+            )).first()
+            for statement in SQLITE_FTS_STATEMENTS:
+                db.session.execute(text(statement))
+            if not existed:
+                # Index rows that were inserted before the FTS table existed
+                db.session.execute(text("INSERT INTO jobs_fts(jobs_fts) VALUES ('rebuild')"))
+            db.session.commit()
+            print("✅ SQLite FTS5 index ready")
+
+        else:
+            print(f"⚠️ No full-text backend for {dialect}, search will use ILIKE")
+
+    except Exception as e:
+        db.session.rollback()
+        print(f"⚠️ Could not create full-text index, search will use ILIKE: {e}")
+
+    _search_backends.pop(str(db.engine.url), None)
+
+
+def _fts5_query(search_term):
+    """Turn free text into an FTS5 query of quoted prefix terms (all must match)"""
+    tokens = re.findall(r'\w+', search_term)
+    return ' '.join(f'"{token}"*' for token in tokens)
+
+
+def apply_search(query, search_term):
+    """Filter a Job query by search_term
+
+    Returns (query, rank) where rank is a (expression, descending) pair for ordering
+    by relevance, or None when the ILIKE fallback is used.
+    """
+    backend = get_search_backend()
+
+    if backend == 'postgresql':
+        tsquery = func.websearch_to_tsquery('english', search_term)
+        vector = literal_column('jobs.search_vector')
+        query = query.filter(vector.op('@@')(tsquery))
+        # ts_rank_cd is real (float4); the cursor sends the rank back as a double, and
+        # float4 = float8 almost never holds, so rank ties at a page boundary would be lost
+        rank = cast(func.ts_rank_cd(vector, tsquery), Float(53))
+        return query, (rank, True)
+
+    if backend == 'sqlite':
+        match = _fts5_query(search_term)
+        if match:
+            fts = table('jobs_fts', column('rowid'))
+            fts_column = literal_column('jobs_fts')
+            weights = [literal(weight) for weight in SQLITE_BM25_WEIGHTS]
+            ranked = (
+                select(fts.c.rowid.label('job_id'), func.bm25(fts_column, *weights).label('rank'))
+                .select_from(fts)
+                .where(fts_column.op('MATCH')(match))
+                .subquery('job_search')
+            )
+            query = query.join(ranked, ranked.c.job_id == Job.id)
+            # bm25() scores are negative; lower means more relevant
+            return query, (ranked.c.rank, False)
+
+    search_pattern = f"%{search_term}%"
+    query = query.filter(
+        or_(
+            Job.title.ilike(search_pattern),
+            Job.company.ilike(search_pattern),
+            Job.description.ilike(search_pattern)
+        )
+    )
+    return query, None
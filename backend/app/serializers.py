@@ -0,0 +1,107 @@
+"""
+Fast JSON serialization for the Job Board API
+Uses orjson or msgspec when installed and falls back to the standard library.
+Listings select plain column tuples instead of ORM objects; rows are turned into
+dicts with one zip per row and datetimes are encoded by the JSON backend.
+Large result sets are streamed batch by batch with stream_job_rows.
+"""
+import json
+from datetime import date, datetime
+
+from flask.json.provider import DefaultJSONProvider
+
+from app.models import db, Job, split_tags
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+# Columns returned by GET /api/jobs, in payload order. `tags` is the synced
+# comma-separated copy, so listings never load the tag relationship.
+LISTING_COLUMNS = (
+    Job.id, Job.title, Job.company, Job.location, Job.posting_date, Job.created_at,
+    Job.updated_at, Job.job_type, Job.tags, Job.description, Job.salary_range,
+    Job.experience_level, Job.remote_allowed, Job.source_url, Job.is_scraped
+)
+LISTING_KEYS = tuple(column.key for column in LISTING_COLUMNS)
+
+
+def _default(value):
+    """Fallback encoder for types the JSON backends don't handle natively"""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if hasattr(value, 'to_dict'):
+        return value.to_dict()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+if orjson is not None:
+    JSON_BACKEND = 'orjson'
+
+    def dumps(obj):
+        """Encode obj as UTF-8 JSON bytes"""
+        return orjson.dumps(obj, default=_default, option=orjson.OPT_NON_STR_KEYS)
+
+elif msgspec is not None:
+    JSON_BACKEND = 'msgspec'
+    _encoder = msgspec.json.Encoder(enc_hook=_default)
+
+    def dumps(obj):
+        """Encode obj as UTF-8 JSON bytes"""
+        return _encoder.encode(obj)
+
+else:
+    JSON_BACKEND = 'json'
+
+    def dumps(obj):
+        """Encode obj as UTF-8 JSON bytes"""
+        return json.dumps(obj, default=_default, separators=(',', ':')).encode('utf-8')
+
+
+class FastJSONProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by the fastest available encoder
+
+    Datetimes are written as ISO 8601 (like Job.to_dict) rather than Flask's HTTP dates.
+    """
+
+    def dumps(self, obj, **kwargs):
+        return dumps(obj).decode('utf-8')
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(dumps(obj), mimetype=self.mimetype)
+
+
+def serialize_job_rows(rows, include_tags_list=False):
+    """Turn LISTING_COLUMNS row tuples into API dicts
+
+    Rows may carry extra trailing columns (e.g. a search rank); zip drops them.
+    """
+    jobs = [dict(zip(LISTING_KEYS, row)) for row in rows]
+    if include_tags_list:
+        for job in jobs:
+            job['tags_list'] = split_tags(job['tags'])
+    return jobs
+
+
+def stream_job_rows(query, include_tags_list=False, batch_size=1000):
+    """Yield a {"success": true, "data": [...], "count": n} document in chunks
+
+    Rows are fetched from a server-side cursor (yield_per) and encoded one batch
+    at a time, so memory use stays flat however many rows match.
+    """
+    result = db.session.execute(query.statement.execution_options(yield_per=batch_size))
+    count = 0
+    yield b'{"success":true,"data":['
+    for batch in result.partitions():
+        # Encode the batch as a list, then drop its brackets to splice it in
+        encoded = dumps(serialize_job_rows(batch, include_tags_list))[1:-1]
+        yield (b',' if count else b'') + encoded
+        count += len(batch)
+    yield b'],"count":' + str(count).encode('ascii') + b'}'
@@ -0,0 +1,170 @@
+"""
+Materialized job statistics and the jobs table version stamp
+The job_stats table holds one row of counters plus a version number. ORM writes
+update it through an after_flush listener (see models.py); bulk Core writes in
+ingestion call record_job_changes directly. Readers get O(1) lookups instead of
+COUNT queries, and conditional GETs compare against the version alone.
+"""
+from collections import Counter
+from datetime import datetime, UTC
+
+from sqlalchemy import inspect, update
+
+from app.models import db, Job, JobStats
+
+STATS_ROW_ID = 1
+
+
+def _today_start():
+    """Midnight (UTC) today, as a naive datetime for comparing stored posting dates"""
+    return datetime.now(UTC).replace(hour=0, minute=0, second=0, microsecond=0, tzinfo=None)
+
+
+def _is_recent(posting_date):
+    if posting_date is None:
+        return False
+    return posting_date.replace(tzinfo=None) >= _today_start()
+
+
+def refresh_job_stats(commit=True):
+    """Recompute every counter from the jobs table and store them"""
+    today = _today_start()
+    stats = db.session.get(JobStats, STATS_ROW_ID)
+    if stats is None:
+        stats = JobStats(id=STATS_ROW_ID)
+        db.session.add(stats)
+
+    stats.total = db.session.query(db.func.count(Job.id)).scalar()
+    stats.companies = db.session.query(db.func.count(db.distinct(Job.company))).scalar()
+    stats.recent = db.session.query(db.func.count(Job.id)).filter(Job.posting_date >= today).scalar()
+    stats.recent_since = today.date()
+    stats.refreshed_at = datetime.now(UTC)
+    stats.version = (stats.version or 0) + 1
+    stats.last_modified = stats.refreshed_at
+    db.session.info['jobs_changed'] = True
+
+    if commit:
+        db.session.commit()
+    return stats
+
+
+def _current_stats():
+    """The counter row, rebuilt when it's missing or the day has rolled over
+
+    'recent' counts jobs posted today, so a new day changes it without any write.
+    """
+    stats = db.session.get(JobStats, STATS_ROW_ID)
+    if stats is None or stats.recent_since != _today_start().date():
+        stats = refresh_job_stats()
+    return stats
+
+
+def get_job_stats():
+    """Return {'total', 'recent', 'companies'} from the counter row"""
+    return _current_stats().to_dict()
+
+
+def get_job_version():
+    """Return (version, last_modified) for the jobs table, creating the row if needed
+
+    Checks the day rollover too: the refresh bumps the version, so conditional
+    GETs that are answered before the view runs still see the new 'recent' count.
+    """
+    stats = _current_stats()
+    return stats.version, stats.last_modified
+
+
+def record_job_changes(session, added=(), removed=()):
+    """Bump the version and apply counter deltas for jobs written in this transaction
+
+    `added` and `removed` are (company, posting_date) pairs; call with neither for
+    edits that don't move any counter. Must run after the rows are written
+    (flushed) so the per-company lookup sees the new state.
+    """
+    # Tells the after_commit hook to drop cached query results
+    session.info['jobs_changed'] = True
+    connection = session.connection()
+    added = list(added)
+    removed = list(removed)
+    values = {
+        'version': JobStats.version + 1,
+        'last_modified': datetime.now(UTC)
+    }
+    if not added and not removed:
+        connection.execute(update(JobStats).where(JobStats.id == STATS_ROW_ID).values(**values))
+        return
+
+    added_by_company = Counter(company for company, _ in added)
+    removed_by_company = Counter(company for company, _ in removed)
+    touched = set(added_by_company) | set(removed_by_company)
+
+    # One indexed GROUP BY over only the touched companies
+    current = dict(connection.execute(
+        db.select(Job.company, db.func.count(Job.id))
+        .where(Job.company.in_(touched))
+        .group_by(Job.company)
+    ).all())
+
+    companies_delta = 0
+    for company in touched:
+        after = current.get(company, 0)
+        before = after - added_by_company[company] + removed_by_company[company]
+        if before == 0 and after > 0:
+            companies_delta += 1
+        elif before > 0 and after == 0:
+            companies_delta -= 1
+
+    recent_delta = (
+        sum(1 for _, posting_date in added if _is_recent(posting_date)) -
+        sum(1 for _, posting_date in removed if _is_recent(posting_date))
+    )
+
+    # Relative updates so concurrent writers don't overwrite each other's counts
+    connection.execute(
+        update(JobStats)
+        .where(JobStats.id == STATS_ROW_ID)
+        .values(
+            total=JobStats.total + len(added) - len(removed),
+            companies=JobStats.companies + companies_delta,
+            recent=JobStats.recent + recent_delta,
+            **values
+        )
+    )
+
+
+def _committed_value(state, key):
+    """Attribute value as it was before this flush's pending change"""
+    history = state.attrs[key].history
+    if history.deleted:
+        return history.deleted[0]
+    if history.unchanged:
+        return history.unchanged[0]
+    return state.attrs[key].value
+
+
+def record_flushed_jobs(session):
+    """after_flush hook: bump the version and turn Job inserts, deletes and moves into counter deltas"""
+    added = []
+    removed = []
+    modified = False
+
+    for obj in session.new:
+        if isinstance(obj, Job):
+            added.append((obj.company, obj.posting_date))
+
+    for obj in session.deleted:
+        if isinstance(obj, Job):
+            state = inspect(obj)
+            removed.append((_committed_value(state, 'company'), _committed_value(state, 'posting_date')))
+
+    for obj in session.dirty:
+        if not isinstance(obj, Job) or not session.is_modified(obj):
+            continue
+        modified = True
+        state = inspect(obj)
+        if state.attrs.company.history.has_changes() or state.attrs.posting_date.history.has_changes():
+            removed.append((_committed_value(state, 'company'), _committed_value(state, 'posting_date')))
+            added.append((obj.company, obj.posting_date))
+
+    if added or removed or modified:
+        record_job_changes(session, added, removed)
@@ -0,0 +1,76 @@
+"""
+Shared helpers for the Job Board API
+"""
+import base64
+import json
+from datetime import datetime
+
+from sqlalchemy import and_, or_
+
+
+def encode_cursor(values):
+    """Encode keyset values into an opaque, URL-safe cursor string"""
+    payload = [value.isoformat() if isinstance(value, datetime) else value for value in values]
+    raw = json.dumps(payload, separators=(',', ':')).encode('utf-8')
+    return base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor, types):
+    """Decode a cursor produced by encode_cursor, converting each value with `types`
+
+    Raises ValueError if the cursor is malformed or doesn't match the expected shape.
+    """
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+    except (ValueError, TypeError) as e:
+        raise ValueError(f"Invalid cursor: {e}")
+
+    if not isinstance(payload, list) or len(payload) != len(types):
+        raise ValueError("Invalid cursor: unexpected shape")
+
+    values = []
+    try:
+        for value, value_type in zip(payload, types):
+            if value_type is datetime:
+                values.append(datetime.fromisoformat(value))
+            else:
+                values.append(value_type(value))
+    except (ValueError, TypeError, OverflowError) as e:
+        # Well-formed JSON holding the wrong kind of values, e.g. [1, 2] or [null, null]
+        raise ValueError(f"Invalid cursor: {e}")
+    return values
+
+
+def keyset_filter(keys, values):
+    """Build a WHERE clause selecting rows strictly after `values` in `keys` order
+
+    `keys` is a list of (column, descending) pairs, e.g. [(Job.posting_date, True), (Job.id, True)].
+    """
+    clauses = []
+    for i, (column, descending) in enumerate(keys):
+        equal_prefix = [keys[j][0] == values[j] for j in range(i)]
+        beyond = column < values[i] if descending else column > values[i]
+        clauses.append(and_(*equal_prefix, beyond))
+    return or_(*clauses)
+
+
+def paginate_keyset(query, keys, limit, cursor=None, key_types=None, key_func=None):
+    """Run a keyset-paginated query
+
+    Returns (rows, next_cursor); next_cursor is None on the last page.
+    """
+    if cursor:
+        query = query.filter(keyset_filter(keys, decode_cursor(cursor, key_types)))
+
+    query = query.order_by(*[column.desc() if descending else column.asc() for column, descending in keys])
+    rows = query.limit(limit + 1).all()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        if key_func is None:
+            key_func = lambda row: [getattr(row, column.key) for column, _ in keys]
+        next_cursor = encode_cursor(key_func(rows[-1]))
+
+    return rows, next_cursor
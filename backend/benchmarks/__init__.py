@@ -0,0 +1,4 @@
+"""
+Benchmarks for the Job Board backend
+Run from the backend directory, e.g. python -m benchmarks.serialization
+"""
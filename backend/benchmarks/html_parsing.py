@@ -0,0 +1,147 @@
+"""
+HTML parsing benchmark for the scrapers
+Times every installed parser backend on the saved pages in benchmarks/fixtures/:
+parsing alone, then parsing plus the extraction the scraper does on that kind of
+page (listing selectors, job links, detail fields). The listing page is also run
+through the previous approach, BeautifulSoup's html.parser with one select()
+per selector, for comparison.
+
+The fixtures are modeled on actuarylist.com's listing, home and job pages (a 120-card
+listing, the latest-jobs list, a JobPosting detail page). Drop freshly saved
+pages named actuarylist-<kind>.html into the directory to benchmark those instead,
+or point --snapshots at a snapshot store to use the newest stored copy of every
+page a scrape fetched (app/scraping/snapshots.py).
+
+    python -m benchmarks.html_parsing
+    python -m benchmarks.html_parsing --repeat 50 --fixtures path/to/pages
+    python -m benchmarks.html_parsing --snapshots instance/snapshots
+"""
+import argparse
+import glob
+import os
+import statistics
+import time
+
+from app.scrape_jobs import ActuaryListScraper, LISTING_SELECTORS
+from app.scraping.html import available_backends, first_match, parse_html
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+
+
+def extract_listing(document):
+    _, elements = first_match(document, LISTING_SELECTORS)
+    return [element.text(strip=True) for element in elements]
+
+
+def extract_links(document):
+    return [link.get('href') for link in document.select('a[href*="/actuarial-jobs/"]')]
+
+
+def legacy_listing(markup):
+    """The old scrape_with_requests path: html.parser plus a select() per selector"""
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(markup, 'html.parser')
+    for selector in LISTING_SELECTORS:
+        elements = soup.select(selector)
+        if elements:
+            return [element.get_text(strip=True) for element in elements]
+    return []
+
+
+def load_snapshots(root):
+    """(name, kind, markup) for the newest stored copy of each page, identical pages once"""
+    from app.scraping.snapshots import SnapshotStore
+
+    store = SnapshotStore(root)
+    pages = []
+    seen = set()
+    for entry in store.find():
+        if entry.digest in seen:
+            continue
+        seen.add(entry.digest)
+        # A rendered jobs page is read with the listing selectors, like extract mode 'source'
+        kind = 'listing' if entry.kind == 'cards' else entry.kind
+        name = f"{entry.kind}:{entry.url.rstrip('/').rsplit('/', 1)[-1]}"
+        pages.append((name, kind, store.read(entry.digest)))
+    return pages
+
+
+def page_kind(path):
+    name = os.path.basename(path)
+    if 'detail' in name:
+        return 'detail'
+    if 'home' in name:
+        return 'home'
+    return 'listing'
+
+
+def time_ms(func, repeat):
+    timings = []
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings), result
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark HTML parser backends on saved pages')
+    parser.add_argument('--repeat', type=int, default=30)
+    parser.add_argument('--fixtures', default=FIXTURES_DIR)
+    parser.add_argument('--snapshots', help='snapshot store directory to take the pages from instead')
+    args = parser.parse_args()
+
+    if args.snapshots:
+        pages = load_snapshots(args.snapshots)
+        if not pages:
+            raise SystemExit(f"No snapshots in {args.snapshots}")
+    else:
+        paths = sorted(glob.glob(os.path.join(args.fixtures, '*.html')))
+        if not paths:
+            raise SystemExit(f"No .html fixtures in {args.fixtures}")
+        pages = []
+        for path in paths:
+            with open(path, 'rb') as handle:
+                pages.append((os.path.basename(path), page_kind(path), handle.read()))
+
+    scraper = ActuaryListScraper()
+    backends = available_backends()
+    print(f"🔧 Installed backends: {', '.join(backends)}")
+    print(f"{'page':<40} {'backend':<20} {'parse':>10} {'parse+extract':>15} {'results':>8}")
+
+    for name, kind, markup in pages:
+        if kind == 'detail':
+            extract = lambda backend: scraper.parse_job_detail(markup.decode('utf-8'))
+        elif kind == 'home':
+            extract = lambda backend: extract_links(parse_html(markup, backend))
+        else:
+            extract = lambda backend: extract_listing(parse_html(markup, backend))
+
+        label = f"{name[:30]} ({len(markup) // 1024} KB)"
+        results = {}
+        for backend in backends:
+            # parse_job_detail picks its backend from the environment
+            os.environ['SCRAPE_HTML_PARSER'] = backend
+            parse_ms, _ = time_ms(lambda: parse_html(markup, backend), args.repeat)
+            total_ms, result = time_ms(lambda: extract(backend), args.repeat)
+            results[backend] = result
+            print(f"{label:<40} {backend:<20} {parse_ms:>8.2f}ms {total_ms:>13.2f}ms {len(result):>8}")
+            label = ''
+
+        if kind == 'listing' and 'bs4' in backends:
+            legacy_ms, result = time_ms(lambda: legacy_listing(markup), args.repeat)
+            results['legacy'] = result
+            print(f"{'':<40} {'bs4, select per rule':<20} {'':>10} {legacy_ms:>13.2f}ms {len(result):>8}")
+
+        # Every backend should extract the same thing
+        distinct = {repr(result) for result in results.values()}
+        if len(distinct) > 1:
+            print(f"⚠️ Backends disagree on {name}")
+
+    os.environ.pop('SCRAPE_HTML_PARSER', None)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,108 @@
+"""
+Import-time budget check for the API package
+Runs `python -X importtime` in fresh interpreters and reports what importing
+`app` (and building the app) costs. Fails when the median exceeds the budget or
+when the API, or merely importing the scraper modules, pulls in the browser or
+HTML parser stacks (selenium, webdriver_manager, bs4); those load when a
+scrape actually starts.
+
+    python -m benchmarks.import_time
+    python -m benchmarks.import_time --runs 10 --budget-ms 800 --top 15
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Median milliseconds to import `app` and build the API
+BUDGET_MS = 1000
+
+BROWSER_AND_PARSER = ('selenium', 'webdriver_manager', 'bs4')
+
+# label -> (snippet, top-level packages it must not import)
+SCENARIOS = {
+    'api': ('from app import create_app; create_app()', BROWSER_AND_PARSER + ('requests',)),
+    'scraper modules': ('import app.scrape_queue, app.scrape_jobs, app.run_scraper', BROWSER_AND_PARSER),
+}
+
+
+def parse_importtime(stderr):
+    """Turn -X importtime output into (name, depth, self_us, cumulative_us) tuples"""
+    entries = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'imported package' in line:
+            continue
+        parts = line[len('import time:'):].split('|')
+        if len(parts) != 3:
+            continue
+        self_us, cumulative_us, name = parts
+        depth = (len(name) - len(name.lstrip(' ')) - 1) // 2
+        entries.append((name.strip(), depth, int(self_us), int(cumulative_us)))
+    return entries
+
+
+def run_scenario(code, env):
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code],
+        cwd=BACKEND_DIR, env=env, capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Import failed:\n{result.stdout}\n{result.stderr}")
+    return parse_importtime(result.stderr)
+
+
+def summarize(entries, forbidden):
+    """Total import time of everything the snippet loaded, and which forbidden packages appeared"""
+    # Interpreter start-up imports (encodings, site, ...) come before the snippet's
+    first = next((i for i, entry in enumerate(entries) if entry[0].split('.')[0] == 'app'), 0)
+    top_level = [entry for entry in entries[first:] if entry[1] == 0]
+    total_us = sum(entry[3] for entry in top_level)
+    heavy = sorted({name.split('.')[0] for name, *_ in entries} & set(forbidden))
+    return total_us, heavy, top_level
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Measure import time of the app package')
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--budget-ms', type=float, default=BUDGET_MS, help='fail if importing and building the API exceeds this (median)')
+    parser.add_argument('--top', type=int, default=10, help='show the slowest top-level imports')
+    args = parser.parse_args()
+
+    failed = False
+    with tempfile.TemporaryDirectory() as directory:
+        env = dict(
+            os.environ,
+            DATABASE_URL=f"sqlite:///{os.path.join(directory, 'imports.db')}",
+            PYTHONPATH=BACKEND_DIR,
+        )
+
+        for label, (code, forbidden) in SCENARIOS.items():
+            run_scenario(code, env)  # warm the filesystem cache and bytecode
+            runs = [summarize(run_scenario(code, env), forbidden) for _ in range(args.runs)]
+            median_ms = statistics.median(total for total, _, _ in runs) / 1000
+            heavy = sorted({name for _, names, _ in runs for name in names})
+
+            print(f"\n📦 {label}: {code}")
+            print(f"   ⏱️ Import time: {median_ms:.0f} ms median over {args.runs} runs")
+            slowest = sorted(runs[-1][2], key=lambda entry: entry[3], reverse=True)[:args.top]
+            for name, _, _, cumulative_us in slowest:
+                print(f"   {cumulative_us / 1000:8.1f} ms  {name}")
+
+            if heavy:
+                print(f"   ❌ Pulled in {', '.join(heavy)}")
+                failed = True
+            if label == 'api' and median_ms > args.budget_ms:
+                print(f"   ❌ Exceeded the {args.budget_ms:.0f} ms budget")
+                failed = True
+
+    if not failed:
+        print("\n✅ Imports within budget and free of browser/parser packages")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,169 @@
+"""
+Load test for GET /api/jobs under the dev server and gunicorn
+Fills a throwaway SQLite database, starts each server configuration in turn and
+drives it with keep-alive client threads for a fixed duration, reporting
+requests/sec and latency percentiles. The query cache is off by default so the
+numbers reflect real query work; pass --cache memory to include it.
+
+    python -m benchmarks.load_test
+    python -m benchmarks.load_test --workers 1 2 4 --threads 4 --duration 15 --concurrency 16
+"""
+import argparse
+import http.client
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+from benchmarks.serialization import create_benchmark_app, populate
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PATHS = [
+    '/api/jobs?limit=20',
+    '/api/jobs?limit=20&job_type=Full-time',
+    '/api/jobs?limit=20&remote_allowed=true',
+    '/api/jobs?limit=20&experience_level=Mid-Level',
+]
+
+
+def prepare_database(path, rows):
+    app = create_benchmark_app()
+    app.config['SQLALCHEMY_DATABASE_URI'] = f'sqlite:///{path}'
+    with app.app_context():
+        populate(rows)
+
+
+def wait_until_up(port, timeout=60):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            connection = http.client.HTTPConnection('127.0.0.1', port, timeout=2)
+            connection.request('GET', '/api/health')
+            if connection.getresponse().status == 200:
+                return True
+        except OSError:
+            time.sleep(0.25)
+    return False
+
+
+def drive(port, duration, concurrency):
+    """Hammer the server from `concurrency` threads; returns (requests, errors, latencies)"""
+    latencies = []
+    errors = [0]
+    lock = threading.Lock()
+    stop_at = time.perf_counter() + duration
+
+    def client(offset):
+        connection = http.client.HTTPConnection('127.0.0.1', port, timeout=30)
+        local = []
+        failed = 0
+        i = offset
+        while time.perf_counter() < stop_at:
+            path = PATHS[i % len(PATHS)]
+            i += 1
+            start = time.perf_counter()
+            try:
+                connection.request('GET', path)
+                response = connection.getresponse()
+                response.read()
+                if response.status != 200:
+                    failed += 1
+                    continue
+            except (OSError, http.client.HTTPException):
+                failed += 1
+                connection.close()
+                connection = http.client.HTTPConnection('127.0.0.1', port, timeout=30)
+                continue
+            local.append(time.perf_counter() - start)
+        with lock:
+            latencies.extend(local)
+            errors[0] += failed
+
+    threads = [threading.Thread(target=client, args=(n,)) for n in range(concurrency)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return len(latencies), errors[0], latencies
+
+
+def run_server(label, command, env, port, args):
+    process = subprocess.Popen(
+        command, cwd=BACKEND_DIR, env=env,
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    try:
+        if not wait_until_up(port):
+            print(f"❌ {label}: server did not start")
+            return
+        drive(port, min(2, args.duration), args.concurrency)  # warm-up
+        count, errors, latencies = drive(port, args.duration, args.concurrency)
+        if not latencies:
+            print(f"❌ {label}: no successful requests ({errors} errors)")
+            return
+        latencies.sort()
+        p50 = statistics.median(latencies) * 1000
+        p95 = latencies[int(len(latencies) * 0.95) - 1] * 1000
+        print(f"{label:<34} {count / args.duration:>9.1f} {p50:>9.1f} {p95:>9.1f} {errors:>7}")
+    finally:
+        process.terminate()
+        try:
+            process.wait(timeout=15)
+        except subprocess.TimeoutExpired:
+            process.kill()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Load test GET /api/jobs')
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4])
+    parser.add_argument('--threads', type=int, default=4)
+    parser.add_argument('--duration', type=int, default=10, help='seconds per configuration')
+    parser.add_argument('--concurrency', type=int, default=16, help='client threads')
+    parser.add_argument('--rows', type=int, default=5000)
+    parser.add_argument('--cache', default='none', choices=['none', 'memory'])
+    parser.add_argument('--port', type=int, default=5055)
+    parser.add_argument('--skip-dev-server', action='store_true')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        database = os.path.join(directory, 'loadtest.db')
+        prepare_database(database, args.rows)
+
+        env = dict(
+            os.environ,
+            DATABASE_URL=f'sqlite:///{database}',
+            FLASK_DEBUG='False',
+            QUERY_CACHE_BACKEND=args.cache,
+            GUNICORN_BIND=f'127.0.0.1:{args.port}',
+            GUNICORN_ACCESS_LOG='',
+            GUNICORN_MAX_REQUESTS='0',  # worker recycling would drop keep-alive connections mid-run
+            GUNICORN_THREADS=str(args.threads),
+            FLASK_HOST='127.0.0.1',
+            FLASK_PORT=str(args.port),
+        )
+
+        # create_app no longer touches the schema; build indexes, FTS and stats explicitly
+        subprocess.run(
+            [sys.executable, 'migrate.py'], cwd=BACKEND_DIR, env=env,
+            stdout=subprocess.DEVNULL, check=True
+        )
+
+        print(f"📊 {args.rows} jobs, {args.concurrency} client threads, {args.duration}s per run, "
+              f"cache={args.cache}, {os.cpu_count()} CPU(s)")
+        print(f"{'server':<34} {'req/s':>9} {'p50 ms':>9} {'p95 ms':>9} {'errors':>7}")
+
+        if not args.skip_dev_server:
+            run_server('flask dev server (threaded)', [sys.executable, 'run.py'], env, args.port, args)
+
+        for workers in args.workers:
+            label = f'gunicorn {workers} worker(s) x {args.threads} threads'
+            command = [sys.executable, '-m', 'gunicorn', '-c', 'gunicorn.conf.py', 'wsgi:app']
+            run_server(label, command, dict(env, GUNICORN_WORKERS=str(workers)), args.port, args)
+
+
+if __name__ == '__main__':
+    main()
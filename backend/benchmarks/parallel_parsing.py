@@ -0,0 +1,98 @@
+"""
+Process pool parsing benchmark
+Times the scrape pipeline's CPU-bound half, parse_page on the listing fixture
+(120 cards through extract_job_from_text) and parse_detail_pages on copies of
+the detail fixture, in the scraping process and on parser pools of several
+sizes. Pools are warmed up first: worker start-up is paid once per process,
+not per run. Every pool size must produce the same jobs as the serial run.
+
+Speed-ups need free cores; the core count is printed first.
+
+    python -m benchmarks.parallel_parsing
+    python -m benchmarks.parallel_parsing --workers 1 2 4 8 --details 400 --repeat 10
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+from contextlib import contextmanager
+
+from app.scrape_jobs import ActuaryListScraper
+from app.scraping import parallel
+from app.scraping.sources import Page
+from benchmarks.html_parsing import FIXTURES_DIR
+
+
+@contextmanager
+def quiet():
+    """Silence the scraper's per-job prints, in this process and in the workers it starts"""
+    sys.stdout.flush()
+    saved = os.dup(1)
+    devnull = os.open(os.devnull, os.O_WRONLY)
+    os.dup2(devnull, 1)
+    try:
+        yield
+    finally:
+        sys.stdout.flush()
+        os.dup2(saved, 1)
+        os.close(saved)
+        os.close(devnull)
+
+
+def read_fixture(name):
+    with open(os.path.join(FIXTURES_DIR, name), 'rb') as handle:
+        return handle.read()
+
+
+def time_ms(func, repeat):
+    timings = []
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings), result
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark parsing in a process pool')
+    parser.add_argument('--workers', type=int, nargs='+', default=sorted({1, 2, os.cpu_count() or 1}))
+    parser.add_argument('--details', type=int, default=200, help='detail pages per run')
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    scraper = ActuaryListScraper(max_jobs=1000)
+    listing = Page(scraper.jobs_url, 'listing', content=read_fixture('actuarylist-jobs.html'))
+    details = [read_fixture('actuarylist-job-detail.html').decode('utf-8')] * args.details
+
+    print(f"🖥️ {os.cpu_count()} cores, chunks of {parallel.chunk_size()}")
+    print(f"{'workers':>8}  {'listing (120 jobs)':>19}  {f'{args.details} detail pages':>18}")
+
+    expected = None
+    for workers in args.workers:
+        os.environ['SCRAPE_PARSE_WORKERS'] = str(workers)
+        parallel.shutdown_parse_pool()
+        with quiet():
+            # Warm-up: starts the workers and imports the scraper in each
+            parallel.parse_page(scraper, listing)
+            parallel.parse_detail_pages(scraper, details)
+            listing_ms, jobs = time_ms(lambda: parallel.parse_page(scraper, listing), args.repeat)
+            details_ms, fields = time_ms(lambda: parallel.parse_detail_pages(scraper, details), args.repeat)
+
+        label = f"{workers}" if workers > 1 else 'serial'
+        print(f"{label:>8}  {listing_ms:>17.1f}ms  {details_ms:>16.1f}ms")
+
+        # created_at and the like differ per call; compare what was extracted
+        result = [(job['title'], job['company'], job['location']) for job in jobs], fields
+        if expected is None:
+            expected = result
+        elif result != expected:
+            print(f"⚠️ {workers} workers produced different jobs than the serial run")
+
+    parallel.shutdown_parse_pool()
+    os.environ.pop('SCRAPE_PARSE_WORKERS', None)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,122 @@
+"""
+Job listing serialization benchmark
+Compares the original path (ORM objects -> Job.to_dict() -> stdlib JSON) with the
+column-tuple path (LISTING_COLUMNS -> serialize_job_rows -> fast encoder) on an
+in-memory SQLite database, so no real data is touched.
+
+    python -m benchmarks.serialization
+    python -m benchmarks.serialization --sizes 1000 10000 100000 --repeat 3
+"""
+import argparse
+import time
+from datetime import datetime, timedelta, UTC
+
+from flask import Flask
+from flask.json.provider import DefaultJSONProvider
+
+from app.models import db, Job, Tag, job_tags
+from app.serializers import JSON_BACKEND, LISTING_COLUMNS, dumps, serialize_job_rows
+
+TAG_NAMES = ['Python', 'SQL', 'R', 'Pricing', 'Reserving', 'Life', 'Health', 'P&C', 'FSA', 'ASA']
+
+
+def create_benchmark_app():
+    """Bare app bound to an in-memory database (create_app would use the dev database)"""
+    app = Flask(__name__)
+    app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///:memory:'
+    app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+    db.init_app(app)
+    return app
+
+
+def populate(size):
+    """Insert `size` jobs with three tags each using Core executemany"""
+    db.drop_all()
+    db.create_all()
+    db.session.execute(db.insert(Tag), [
+        {'id': i + 1, 'name': name, 'slug': Tag.slugify(name)} for i, name in enumerate(TAG_NAMES)
+    ])
+
+    now = datetime.now(UTC)
+    jobs = []
+    links = []
+    for i in range(1, size + 1):
+        tag_ids = [(i + offset) % len(TAG_NAMES) + 1 for offset in range(3)]
+        jobs.append({
+            'id': i,
+            'title': f'Actuarial Analyst {i}',
+            'company': f'Insurance Company {i % 500}',
+            'location': 'New York, NY',
+            'posting_date': now - timedelta(minutes=i),
+            'created_at': now,
+            'updated_at': now,
+            'job_type': 'Full-time',
+            'tags': ', '.join(TAG_NAMES[tag_id - 1] for tag_id in tag_ids),
+            'description': 'Pricing and reserving for a growing life insurance book. ' * 4,
+            'salary_range': '$80,000 - $120,000',
+            'experience_level': 'Mid-Level',
+            'remote_allowed': i % 3 == 0,
+            'source_url': f'https://www.actuarylist.com/actuarial-jobs/{i}',
+            'is_scraped': True
+        })
+        links.extend({'job_id': i, 'tag_id': tag_id} for tag_id in tag_ids)
+
+    db.session.execute(db.insert(Job), jobs)
+    db.session.execute(job_tags.insert(), links)
+    db.session.commit()
+
+
+def orm_path(app, size):
+    """Original listing path"""
+    jobs = Job.query.order_by(Job.posting_date.desc(), Job.id.desc()).limit(size).all()
+    payload = {'success': True, 'data': [job.to_dict() for job in jobs]}
+    return DefaultJSONProvider(app).dumps(payload).encode('utf-8')
+
+
+def tuple_path(app, size):
+    """Column tuples, no tags_list, fast encoder"""
+    rows = (
+        db.session.query(*LISTING_COLUMNS)
+        .order_by(Job.posting_date.desc(), Job.id.desc())
+        .limit(size)
+        .all()
+    )
+    return dumps({'success': True, 'data': serialize_job_rows(rows)})
+
+
+def best_time(func, app, size, repeat):
+    """Best of `repeat` runs, with a fresh session each time so nothing is cached"""
+    best = None
+    body = b''
+    for _ in range(repeat):
+        db.session.remove()
+        start = time.perf_counter()
+        body = func(app, size)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, len(body)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark job listing serialization')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000, 100000])
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    app = create_benchmark_app()
+    print(f"📊 JSON encoder: {JSON_BACKEND}")
+    print(f"{'rows':>8}  {'to_dict+json':>14}  {'tuples+' + JSON_BACKEND:>14}  {'speedup':>8}  {'bytes (old/new)':>20}")
+
+    with app.app_context():
+        for size in args.sizes:
+            populate(size)
+            old_time, old_bytes = best_time(orm_path, app, size, args.repeat)
+            new_time, new_bytes = best_time(tuple_path, app, size, args.repeat)
+            print(
+                f"{size:>8}  {old_time * 1000:>12.1f}ms  {new_time * 1000:>12.1f}ms  "
+                f"{old_time / new_time:>7.1f}x  {old_bytes:>10}/{new_bytes:<10}"
+            )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,91 @@
+"""
+Startup-time benchmark for create_app
+Boots the app in fresh interpreters and reports how long importing and building
+it takes, plus how many SQL statements and database connections it made (both
+should be zero now that migrations run from `python migrate.py`). Exits non-zero
+when the median exceeds the budget or any database I/O happens, so it can gate CI.
+
+    python -m benchmarks.startup
+    python -m benchmarks.startup --runs 10 --budget-ms 1500
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+BOOT_SCRIPT = '''
+import json, time
+start = time.perf_counter()
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import Pool
+io = {'statements': 0, 'connections': 0}
+event.listen(Engine, 'before_cursor_execute', lambda *args: io.__setitem__('statements', io['statements'] + 1))
+event.listen(Pool, 'connect', lambda *args: io.__setitem__('connections', io['connections'] + 1))
+from app import create_app
+app = create_app()
+io['create_app_seconds'] = time.perf_counter() - start
+print('BOOT ' + json.dumps(io))
+'''
+
+
+def boot_once(env):
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, '-c', BOOT_SCRIPT],
+        cwd=BACKEND_DIR, env=env, capture_output=True, text=True
+    )
+    process_seconds = time.perf_counter() - start
+    for line in result.stdout.splitlines():
+        if line.startswith('BOOT '):
+            stats = json.loads(line[5:])
+            stats['process_seconds'] = process_seconds
+            return stats
+    raise RuntimeError(f"Boot failed:\n{result.stdout}\n{result.stderr}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark create_app startup time')
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--budget-ms', type=float, default=1500, help='fail if the median create_app time exceeds this')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        env = dict(
+            os.environ,
+            DATABASE_URL=f"sqlite:///{os.path.join(directory, 'startup.db')}",
+            PYTHONPATH=BACKEND_DIR,
+        )
+        boot_once(env)  # warm the filesystem cache and bytecode
+        runs = [boot_once(env) for _ in range(args.runs)]
+
+    create_app_ms = statistics.median(run['create_app_seconds'] for run in runs) * 1000
+    process_ms = statistics.median(run['process_seconds'] for run in runs) * 1000
+    statements = max(run['statements'] for run in runs)
+    connections = max(run['connections'] for run in runs)
+
+    print(f"🚀 create_app (imports + build): {create_app_ms:.0f} ms median over {args.runs} runs")
+    print(f"🐍 Whole interpreter start-up:   {process_ms:.0f} ms")
+    print(f"💾 SQL statements at boot:        {statements}")
+    print(f"🔌 Database connections at boot:  {connections}")
+
+    failed = False
+    if statements or connections:
+        print("❌ create_app touched the database")
+        failed = True
+    if create_app_ms > args.budget_ms:
+        print(f"❌ Startup exceeded the {args.budget_ms:.0f} ms budget")
+        failed = True
+    if not failed:
+        print("✅ Startup within budget")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
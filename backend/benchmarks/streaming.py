@@ -0,0 +1,73 @@
+"""
+Streaming export benchmark
+Compares building a whole listing in memory (the success_response path) with
+stream_job_rows, which encodes batches from a yield_per cursor. Reports peak
+Python memory (tracemalloc) and time to the first row.
+
+    python -m benchmarks.streaming
+    python -m benchmarks.streaming --sizes 10000 100000 --batch-size 1000
+"""
+import argparse
+import time
+import tracemalloc
+
+from app.models import db, Job
+from app.serializers import LISTING_COLUMNS, dumps, serialize_job_rows, stream_job_rows
+from benchmarks.serialization import create_benchmark_app, populate
+
+
+def listing_query():
+    return db.session.query(*LISTING_COLUMNS).order_by(Job.posting_date.desc(), Job.id.desc())
+
+
+def buffered(batch_size):
+    """Whole document built before the first byte can be sent"""
+    start = time.perf_counter()
+    body = dumps({'success': True, 'data': serialize_job_rows(listing_query().all())})
+    elapsed = time.perf_counter() - start
+    return elapsed, elapsed, len(body)
+
+
+def streamed(batch_size):
+    """Chunks yielded as each batch is encoded"""
+    start = time.perf_counter()
+    first_row = None
+    size = 0
+    for index, chunk in enumerate(stream_job_rows(listing_query(), batch_size=batch_size)):
+        if index == 1:
+            first_row = time.perf_counter() - start
+        size += len(chunk)
+    return first_row, time.perf_counter() - start, size
+
+
+def measure(func, batch_size):
+    db.session.remove()
+    tracemalloc.start()
+    first_row, total, size = func(batch_size)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return first_row, total, size, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark streaming job exports')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000, 100000])
+    parser.add_argument('--batch-size', type=int, default=1000)
+    args = parser.parse_args()
+
+    app = create_benchmark_app()
+    print(f"{'rows':>8}  {'mode':>9}  {'first row':>10}  {'total':>9}  {'peak memory':>12}  {'bytes':>10}")
+
+    with app.app_context():
+        for size in args.sizes:
+            populate(size)
+            for name, func in (('buffered', buffered), ('streamed', streamed)):
+                first_row, total, body_size, peak = measure(func, args.batch_size)
+                print(
+                    f"{size:>8}  {name:>9}  {first_row * 1000:>8.1f}ms  {total * 1000:>7.1f}ms  "
+                    f"{peak / 1024 / 1024:>9.1f} MB  {body_size:>10}"
+                )
+
+
+if __name__ == '__main__':
+    main()
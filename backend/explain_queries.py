@@ -0,0 +1,40 @@
+"""
+Query plan check
+Run this script to EXPLAIN the hot listing/stats queries and confirm each one uses an index.
+Exits with status 1 if any query falls back to a full table scan.
+"""
+import sys
+
+from app import create_app
+from app.database import explain_hot_queries
+
+def main():
+    """Print the plan for each hot query and report any that skip the indexes"""
+    print("🔍 Job Board Query Plan Check")
+    print("=" * 50)
+    
+    app = create_app()
+    
+    with app.app_context():
+        print(f"💾 Database: {app.config['SQLALCHEMY_DATABASE_URI'].split('@')[-1]}")
+        results = explain_hot_queries()
+    
+    failures = []
+    for name, result in results.items():
+        status = "✅" if result['uses_index'] else "❌"
+        print(f"\n{status} {name}")
+        for line in result['plan']:
+            print(f"   {line}")
+        if not result['uses_index']:
+            failures.append(name)
+    
+    print("=" * 50)
+    if failures:
+        print(f"❌ {len(failures)} queries without an index: {', '.join(failures)}")
+        return False
+    
+    print(f"✅ All {len(results)} hot queries use an index")
+    return True
+
+if __name__ == '__main__':
+    sys.exit(0 if main() else 1)
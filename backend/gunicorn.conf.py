@@ -0,0 +1,47 @@
+"""
+Gunicorn configuration for the Job Board API
+
+    gunicorn -c gunicorn.conf.py wsgi:app
+
+Every setting can be overridden from the environment:
+    GUNICORN_BIND          Address to bind (default: 0.0.0.0:5000)
+    GUNICORN_WORKERS       Worker processes (default: WEB_CONCURRENCY or 2 x CPUs + 1)
+    GUNICORN_THREADS       Threads per worker; >1 switches to the gthread worker (default: 4)
+    GUNICORN_PRELOAD       Import the app once in the master before forking (default: True)
+    GUNICORN_TIMEOUT       Seconds before a silent worker is restarted (default: 30)
+    GUNICORN_MAX_REQUESTS  Recycle workers after this many requests, 0 to disable (default: 1000)
+"""
+import multiprocessing
+import os
+
+bind = os.getenv('GUNICORN_BIND', '0.0.0.0:5000')
+
+workers = int(os.getenv('GUNICORN_WORKERS', os.getenv('WEB_CONCURRENCY', multiprocessing.cpu_count() * 2 + 1)))
+threads = int(os.getenv('GUNICORN_THREADS', '4'))
+worker_class = 'gthread' if threads > 1 else 'sync'
+
+# Preloading shares the imported code between workers (copy-on-write) and
+# surfaces import errors before any worker starts
+preload_app = os.getenv('GUNICORN_PRELOAD', 'True').lower() == 'true'
+
+timeout = int(os.getenv('GUNICORN_TIMEOUT', '30'))
+graceful_timeout = int(os.getenv('GUNICORN_GRACEFUL_TIMEOUT', '30'))
+keepalive = int(os.getenv('GUNICORN_KEEPALIVE', '5'))
+
+# Recycle workers periodically to bound memory growth; jitter avoids restarting all at once
+max_requests = int(os.getenv('GUNICORN_MAX_REQUESTS', '1000'))
+max_requests_jitter = int(os.getenv('GUNICORN_MAX_REQUESTS_JITTER', '100'))
+
+accesslog = os.getenv('GUNICORN_ACCESS_LOG', '-') or None  # set empty to disable
+errorlog = os.getenv('GUNICORN_ERROR_LOG', '-')
+loglevel = os.getenv('GUNICORN_LOG_LEVEL', 'info')
+
+
+def post_fork(server, worker):
+    """Don't share database connections opened in the master with forked workers"""
+    if not preload_app:
+        return
+    from wsgi import app
+    from app.models import db
+    with app.app_context():
+        db.engine.dispose(close=False)
@@ -0,0 +1,22 @@
+"""
+Database migration script
+Run this script to create tables and apply schema migrations (search index, etc.)
+"""
+from app import create_app
+from app.migrations import run_migrations
+
+def main():
+    """Apply all schema migrations to the configured database"""
+    print("🚀 Job Board Database Migration")
+    print("=" * 50)
+    
+    app = create_app()
+    
+    with app.app_context():
+        run_migrations()
+    
+    print("=" * 50)
+    print("✅ Migrations completed successfully!")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,95 @@
+"""
+Re-parse stored page snapshots
+Runs the current parsers over pages saved by earlier scrapes (see
+app/scraping/snapshots.py) on every core and ingests the jobs again, so a fix
+to the extraction logic can be applied without fetching actuarylist.com.
+
+    python reparse.py                          # newest snapshot of every page, re-ingested
+    python reparse.py --since 2026-10-01       # only pages fetched since then
+    python reparse.py --all-versions           # every stored fetch, oldest first
+    python reparse.py --dry-run --workers 1    # parse and time only; nothing is written
+    python reparse.py --stats                  # what the store holds
+"""
+import argparse
+import os
+import sys
+from datetime import datetime
+
+def parse_time(value):
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected an ISO date or time, got '{value}'")
+
+def main():
+    parser = argparse.ArgumentParser(description='Re-run the parsers over stored page snapshots')
+    parser.add_argument('--snapshot-dir', help='store location (default: SCRAPE_SNAPSHOT_DIR or instance/snapshots)')
+    parser.add_argument('--source', help='only this source')
+    parser.add_argument('--kind', help='only this page kind (listing, home, cards)')
+    parser.add_argument('--url', help='only this page URL')
+    parser.add_argument('--since', type=parse_time, help='only pages fetched at or after this UTC time')
+    parser.add_argument('--until', type=parse_time, help='only pages fetched before this UTC time')
+    parser.add_argument('--all-versions', action='store_true', help='every stored fetch, not just the newest per URL')
+    parser.add_argument('--workers', type=int, help='parser processes (default: one per core)')
+    parser.add_argument('--max-jobs', type=int, help='jobs per page (default: no limit)')
+    parser.add_argument('--no-details', action='store_true', help="don't merge in stored detail pages")
+    parser.add_argument('--dry-run', action='store_true', help='parse and report timing without writing to the database')
+    parser.add_argument('--stats', action='store_true', help='print store statistics and exit')
+    args = parser.parse_args()
+
+    from app.scraping.reparse import reparse
+    from app.scraping.snapshots import DEFAULT_SNAPSHOT_DIR, SnapshotStore
+
+    root = args.snapshot_dir or os.getenv('SCRAPE_SNAPSHOT_DIR') or DEFAULT_SNAPSHOT_DIR
+    if not os.path.exists(os.path.join(root, 'index.db')):
+        print(f"❌ No snapshot store at {root}")
+        sys.exit(1)
+    store = SnapshotStore(root)
+
+    if args.stats:
+        stats = store.stats()
+        print(f"📦 {root}: {stats['fetches']} fetches of {stats['urls']} URLs in {stats['objects']} objects, "
+              f"{stats['fetched_bytes'] / 1024:.0f} KB fetched, {stats['stored_bytes'] / 1024:.0f} KB on disk")
+        return
+
+    entries = store.find(
+        source=args.source,
+        kind=args.kind,
+        url=args.url,
+        since=args.since,
+        until=args.until,
+        latest=not args.all_versions,
+        exclude_kinds=('detail',)
+    )
+    if not entries:
+        print("⚠️ No snapshots match")
+        return
+    print(f"🔁 Re-parsing {len(entries)} pages from {root}")
+
+    options = dict(
+        workers=args.workers,
+        max_jobs=args.max_jobs,
+        fetch_details=not args.no_details,
+        until=args.until
+    )
+    if args.dry_run:
+        summary = reparse(store, entries, **options)
+    else:
+        from app import create_app
+        from app.ingest import ingest_jobs
+
+        app = create_app()
+        with app.app_context():
+            summary = reparse(store, entries, ingest=ingest_jobs, **options)
+
+    rate = summary['pages'] / summary['elapsed_seconds'] if summary['elapsed_seconds'] else 0
+    print(f"✅ {summary['jobs']} jobs from {summary['pages']} pages in {summary['elapsed_seconds']}s "
+          f"on {summary['workers']} workers ({rate:.1f} pages/s)")
+    if not args.dry_run:
+        print(f"💾 Saved {summary['saved']}, updated {summary['updated']}, skipped {summary['skipped']} duplicates")
+    if summary['failed']:
+        print(f"❌ {summary['failed']} pages could not be parsed")
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main()
@@ -12,7 +12,7 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 # Import Flask app
 from app import create_app
-from app.models import db, Job, JobService
+from app.models import Job, JobService
 
 def create_sample_data():
     """Create sample job data if database is empty"""
@@ -95,51 +95,43 @@ def print_startup_info(app):
     print(f"💾 Database: {app.config.get('SQLALCHEMY_DATABASE_URI', 'Not configured')}")
     print(f"🔑 Secret Key: {'Set' if app.config.get('SECRET_KEY') else 'Not set'}")
     
-    # Database stats
-    try:
-        with app.app_context():
-            stats = JobService.get_job_stats()
-            print(f"📊 Total Jobs: {stats['total']}")
-            print(f"🏢 Companies: {stats['companies']}")
-            print(f"🆕 Recent Jobs: {stats['recent']}")
-    except Exception as e:
-        print(f"⚠️ Could not get database stats: {e}")
-    
     print("\n🌍 Server URLs:")
     print("   Frontend: http://localhost:3000")
     print("   Backend:  http://localhost:5000")
     print("   API:      http://localhost:5000/api")
     print("   Health:   http://localhost:5000/api/health")
+    print("   Ready:    http://localhost:5000/api/ready")
     print("\n💡 Useful Commands:")
     print("   Ctrl+C    - Stop server")
     print("   /api/jobs - View all jobs")
     print("   /api/scrape - Trigger scraper")
+    print("   python migrate.py - Create/upgrade the database schema")
     print("="*60)
 
-def setup_database(app):
-    """Setup database tables and initial data"""
+def setup_database(app, seed=False):
+    """Apply schema migrations and optionally add sample data (only when asked)"""
     with app.app_context():
         try:
-            # Create tables
-            print("🔄 Setting up database...")
-            db.create_all()
-            print("✅ Database tables created")
+            from app.migrations import run_migrations
+            print("🔄 Applying database migrations...")
+            run_migrations()
             
-            # Create sample data if needed
-            create_sample_data()
+            if seed:
+                create_sample_data()
             
         except Exception as e:
             print(f"❌ Database setup failed: {e}")
             sys.exit(1)
 
-def main():
+def main(migrate=False, seed=False):
     """Main application entry point"""
     try:
-        # Create Flask application
+        # Create Flask application (no database I/O happens here)
         app = create_app()
         
-        # Setup database
-        setup_database(app)
+        # Schema changes only run when requested; normally use `python migrate.py`
+        if migrate or seed:
+            setup_database(app, seed=seed)
         
         # Print startup information
         print_startup_info(app)
@@ -147,10 +139,11 @@ def main():
         # Get configuration
         host = os.getenv('FLASK_HOST', '127.0.0.1')
         port = int(os.getenv('FLASK_PORT', 5000))
-        debug = os.getenv('FLASK_DEBUG', 'True').lower() == 'true'
+        debug = os.getenv('FLASK_DEBUG', 'False').lower() == 'true'
         
         # Start the development server
-        print(f"\n🚀 Starting server on http://{host}:{port}")
+        print(f"\n🚀 Starting development server on http://{host}:{port}")
+        print("💡 For production use: gunicorn -c gunicorn.conf.py wsgi:app (or python serve.py on Windows)")
         print("Press Ctrl+C to stop the server\n")
         
         app.run(
@@ -181,11 +174,13 @@ Options:
     --port PORT    Set port number (default: 5000)
     --debug        Enable debug mode
     --no-debug     Disable debug mode
+    --migrate      Apply database migrations before starting
+    --seed         Apply migrations and add sample jobs if the database is empty
 
 Environment Variables:
     FLASK_HOST     Host address (default: 127.0.0.1)
     FLASK_PORT     Port number (default: 5000)
-    FLASK_DEBUG    Debug mode (default: True)
+    FLASK_DEBUG    Debug mode (default: False)
     FLASK_ENV      Environment (development/production)
 
 Examples:
@@ -194,19 +189,26 @@ Examples:
     python run.py --debug
     FLASK_PORT=8080 python run.py
 
+Production:
+    gunicorn -c gunicorn.conf.py wsgi:app    (Linux/macOS)
+    python serve.py                           (waitress, any platform)
+    See gunicorn.conf.py for GUNICORN_WORKERS, GUNICORN_THREADS, GUNICORN_PRELOAD
+
 Database:
     The application uses SQLite by default (jobboard.db)
-    Tables are created automatically on first run
-    Sample data is added if database is empty
+    Create or upgrade the schema with: python migrate.py (or run.py --migrate)
+    Add sample data with: python init_db.py (or run.py --seed)
 
 API Endpoints:
-    GET  /api/health          - Health check
+    GET  /api/health          - Liveness check (no database access)
+    GET  /api/ready           - Readiness check (database reachable)
     GET  /api/jobs            - Get all jobs
     POST /api/jobs            - Create new job
     GET  /api/jobs/<id>       - Get specific job
     PUT  /api/jobs/<id>       - Update job
     DELETE /api/jobs/<id>     - Delete job
-    POST /api/scrape          - Trigger job scraper
+    POST /api/scrape          - Queue a job scraper run
+    GET  /api/scrape/<run_id> - Scraper run status
 
 For more information, visit: https://github.com/your-repo/job-board
     """)
@@ -227,4 +229,4 @@ if __name__ == '__main__':
             os.environ['FLASK_DEBUG'] = 'False'
     
     # Run the application
-    main()
\ No newline at end of file
+    main(migrate='--migrate' in sys.argv, seed='--seed' in sys.argv)
\ No newline at end of file
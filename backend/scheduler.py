@@ -0,0 +1,44 @@
+"""
+Recurring scrape scheduler process
+Runs the sources in SCRAPE_SCHEDULE on their intervals; see app/scheduler.py for
+the schedule format and settings. Safe to run on several machines at once.
+
+    python scheduler.py            # run until stopped (Ctrl+C or SIGTERM)
+    python scheduler.py --once     # run whatever is due, then exit (for cron or systemd timers)
+    python scheduler.py --now      # run every source immediately, then keep scheduling
+"""
+import argparse
+import signal
+import sys
+
+def main():
+    parser = argparse.ArgumentParser(description='Run scheduled scrapes')
+    parser.add_argument('--once', action='store_true', help='run due sources once and exit')
+    parser.add_argument('--now', action='store_true', help='treat every source as due right away')
+    args = parser.parse_args()
+
+    from app import create_app
+    from app.scheduler import Scheduler, parse_schedules
+
+    try:
+        schedules = parse_schedules()
+    except ValueError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+
+    app = create_app()
+    scheduler = Scheduler(app, schedules)
+    print(f"🗓️ Scheduling {', '.join(f'{source} ({schedule.spec})' for source, schedule in schedules.items())}")
+
+    if args.once:
+        results = scheduler.run_pending(force=args.now)
+        failed = [result for result in results if result['status'] == 'failed']
+        sys.exit(1 if failed else 0)
+
+    # Finish the current run, then exit
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        signal.signal(signum, lambda *_: scheduler.stop())
+    scheduler.run_forever(run_now=args.now)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,31 @@
+"""
+Production server using waitress (works on Windows, where gunicorn doesn't run)
+
+    python serve.py
+
+Environment Variables:
+    WAITRESS_HOST       Host address (default: 0.0.0.0)
+    WAITRESS_PORT       Port number (default: 5000)
+    WAITRESS_THREADS    Worker threads (default: 8)
+"""
+import os
+import sys
+
+def main():
+    try:
+        from waitress import serve
+    except ImportError:
+        print("❌ waitress is not installed: pip install waitress")
+        sys.exit(1)
+
+    from wsgi import app
+
+    host = os.getenv('WAITRESS_HOST', '0.0.0.0')
+    port = int(os.getenv('WAITRESS_PORT', '5000'))
+    threads = int(os.getenv('WAITRESS_THREADS', '8'))
+
+    print(f"🚀 Serving on http://{host}:{port} with {threads} threads (waitress)")
+    serve(app, host=host, port=port, threads=threads)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,26 @@
+"""
+Shared fixtures: an app on a throwaway SQLite database with every migration applied
+"""
+import pytest
+
+
+@pytest.fixture
+def app(tmp_path, monkeypatch):
+    monkeypatch.setenv('DATABASE_URL', f"sqlite:///{tmp_path / 'test.db'}")
+
+    from app import create_app
+    from app.migrations import run_migrations
+    from app.models import db
+
+    app = create_app()
+    app.config['TESTING'] = True
+    with app.app_context():
+        run_migrations()
+        yield app
+        db.session.remove()
+        db.engine.dispose()
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
@@ -0,0 +1,37 @@
+"""
+Conditional GETs answered from the jobs table version stamp
+"""
+from datetime import datetime, timedelta, UTC
+
+from werkzeug.http import http_date
+
+from app.models import db, Job, JobStats
+from app.stats import STATS_ROW_ID
+
+
+def test_unchanged_listing_answers_304(client):
+    first = client.get('/api/jobs')
+    again = client.get('/api/jobs', headers={'If-None-Match': first.headers['ETag']})
+    assert again.status_code == 304
+
+
+def test_stats_revalidate_after_the_day_rolls_over(app, client):
+    db.session.add(Job(title='Pricing Actuary', company='Insurer', location='Remote'))
+    db.session.commit()
+    client.get('/api/jobs/stats')
+
+    for header in ('If-None-Match', 'If-Modified-Since'):
+        # Counters computed yesterday, before today's job counted, and cached by the client then
+        stats = db.session.get(JobStats, STATS_ROW_ID)
+        stats.recent_since -= timedelta(days=1)
+        stats.last_modified = datetime.now(UTC) - timedelta(days=1)
+        stats.recent = 0
+        db.session.commit()
+        cached = {
+            'If-None-Match': f'W/"jobs-{stats.version}"',
+            'If-Modified-Since': http_date(stats.last_modified + timedelta(seconds=1))
+        }
+
+        response = client.get('/api/jobs/stats', headers={header: cached[header]})
+        assert response.status_code == 200
+        assert response.get_json()['data']['recent'] == 1
@@ -0,0 +1,22 @@
+"""
+Importing the API stays within the import-time budget and never loads the browser, parser or HTTP stacks
+"""
+import os
+import statistics
+
+from benchmarks.import_time import BACKEND_DIR, BUDGET_MS, SCENARIOS, run_scenario, summarize
+
+
+def test_api_imports_within_budget(tmp_path):
+    code, forbidden = SCENARIOS['api']
+    env = dict(os.environ, DATABASE_URL=f"sqlite:///{tmp_path / 'imports.db'}", PYTHONPATH=BACKEND_DIR)
+
+    run_scenario(code, env)  # warm the filesystem cache and bytecode
+    runs = [summarize(run_scenario(code, env), forbidden) for _ in range(3)]
+
+    pulled_in = sorted({name for _, names, _ in runs for name in names})
+    assert not pulled_in, f"create_app() imported {', '.join(pulled_in)}"
+    assert set(forbidden) >= {'selenium', 'webdriver_manager', 'bs4', 'requests'}
+
+    median_ms = statistics.median(total for total, _, _ in runs) / 1000
+    assert median_ms <= BUDGET_MS, f"importing the API took {median_ms:.0f} ms (budget {BUDGET_MS} ms)"
@@ -0,0 +1,71 @@
+"""
+Hot listing and stats queries must be answered from an index, never a full scan of jobs, tags or job_tags
+"""
+import os
+
+import pytest
+from flask import Flask
+
+from app.database import _explain, get_hot_queries
+from app.models import db, Job
+
+
+def hot_query_names():
+    # The statements need an app context to build, but not a database
+    app = Flask(__name__)
+    app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite://'
+    db.init_app(app)
+    with app.app_context():
+        return list(get_hot_queries())
+
+
+HOT_QUERIES = hot_query_names()
+
+
+def add_jobs(count=30):
+    # A few rows per table, so the plans aren't shaped by empty tables
+    tags = ['Python', 'SQL', 'Excel']
+    for i in range(count):
+        job = Job(
+            title=f'Actuary {i}',
+            company=f'Insurer {i % 7}',
+            location='Remote',
+            job_type=('Full-time', 'Contract')[i % 2],
+            experience_level=('Senior', 'Junior')[i % 2],
+            remote_allowed=bool(i % 3),
+            is_scraped=bool(i % 2)
+        )
+        job.tags = ', '.join(tags[:i % 4])
+        db.session.add(job)
+    db.session.commit()
+
+
+def assert_uses_index(name):
+    plan, uses_index = _explain(get_hot_queries()[name])
+    assert uses_index, f"{name} scans a table:\n" + '\n'.join(plan)
+
+
+@pytest.mark.parametrize('name', HOT_QUERIES)
+def test_hot_query_uses_index(app, name):
+    add_jobs()
+    assert_uses_index(name)
+
+
+@pytest.mark.skipif(not os.getenv('TEST_POSTGRES_URL'), reason='set TEST_POSTGRES_URL to a scratch PostgreSQL database')
+@pytest.mark.parametrize('name', HOT_QUERIES)
+def test_hot_query_uses_index_on_postgres(monkeypatch, name):
+    monkeypatch.setenv('DATABASE_URL', os.environ['TEST_POSTGRES_URL'])
+
+    from app import create_app
+    from app.migrations import run_migrations
+
+    app = create_app()
+    with app.app_context():
+        db.drop_all()
+        run_migrations()
+        try:
+            add_jobs()
+            assert_uses_index(name)
+        finally:
+            db.session.remove()
+            db.drop_all()
@@ -0,0 +1,106 @@
+"""
+Batched ingestion: new jobs are inserted with their tags, changed ones updated, duplicates skipped,
+and the materialized job counters follow along
+"""
+from datetime import datetime, timedelta, UTC
+
+from app.ingest import ingest_jobs, make_dedupe_key
+from app.models import db, Job, Tag
+from app.stats import JobStats, STATS_ROW_ID, refresh_job_stats
+
+
+def scraped(title, company, **fields):
+    return dict(title=title, company=company, location='Remote', source_url=f'https://example.com/{title}', **fields)
+
+
+def job_for(title, company):
+    return Job.query.filter_by(dedupe_key=make_dedupe_key(title, company)).one()
+
+
+def stats():
+    db.session.expire_all()
+    return db.session.get(JobStats, STATS_ROW_ID)
+
+
+def test_counts_and_duplicates_within_a_batch(app):
+    counts = ingest_jobs([
+        scraped('Pricing Actuary', 'Acme'),
+        scraped('Reserving Actuary', 'Acme'),
+        # Same title and company in another case: one job
+        scraped('pricing actuary ', 'ACME'),
+        # Missing company: can't be keyed
+        scraped('Actuarial Analyst', None),
+    ])
+    assert counts == {'saved': 2, 'updated': 0, 'skipped': 2}
+    assert Job.query.count() == 2
+    assert job_for('Pricing Actuary', 'Acme').is_scraped
+
+    # The same jobs again, unchanged, are all skipped
+    counts = ingest_jobs([scraped('Pricing Actuary', 'Acme'), scraped('Reserving Actuary', 'Acme')])
+    assert counts == {'saved': 0, 'updated': 0, 'skipped': 2}
+    assert Job.query.count() == 2
+
+
+def test_changed_field_updates_the_job(app):
+    ingest_jobs([scraped('Pricing Actuary', 'Acme', salary_range='£50k')])
+    job = job_for('Pricing Actuary', 'Acme')
+    old_updated_at = datetime(2020, 1, 1)
+    job.updated_at = old_updated_at
+    db.session.commit()
+    version = stats().version
+
+    counts = ingest_jobs([scraped('Pricing Actuary', 'Acme', salary_range='£60k')])
+    assert counts == {'saved': 0, 'updated': 1, 'skipped': 0}
+
+    db.session.expire_all()
+    job = job_for('Pricing Actuary', 'Acme')
+    assert job.salary_range == '£60k'
+    assert job.updated_at > old_updated_at
+    # An edit moves no counter but still invalidates cached responses
+    assert stats().version > version
+    assert stats().total == 1
+
+
+def test_tag_formatting_alone_is_not_a_change(app):
+    ingest_jobs([scraped('Pricing Actuary', 'Acme', tags='Python, SQL')])
+    counts = ingest_jobs([scraped('Pricing Actuary', 'Acme', tags='python,sql')])
+    assert counts == {'saved': 0, 'updated': 0, 'skipped': 1}
+
+
+def test_new_jobs_are_linked_to_their_tags(app):
+    ingest_jobs([
+        scraped('Pricing Actuary', 'Acme', tags='Python, SQL'),
+        scraped('Reserving Actuary', 'Globex', tags='SQL, Excel'),
+        scraped('Capital Actuary', 'Initech'),
+    ])
+    db.session.expire_all()
+    assert job_for('Pricing Actuary', 'Acme').get_tags_list() == ['Python', 'SQL']
+    assert job_for('Reserving Actuary', 'Globex').get_tags_list() == ['Excel', 'SQL']
+    assert job_for('Capital Actuary', 'Initech').get_tags_list() == []
+    # 'SQL' is shared, so it's one tag row linked to both jobs
+    assert sorted(tag.slug for tag in Tag.query) == ['excel', 'python', 'sql']
+    assert Job.query.filter(Job.tag_objects.any(slug='sql')).count() == 2
+
+
+def test_inserts_update_the_job_counters(app):
+    refresh_job_stats()
+    before = stats()
+    total, companies, recent, version = before.total, before.companies, before.recent, before.version
+
+    ingest_jobs([
+        scraped('Pricing Actuary', 'Acme'),
+        scraped('Reserving Actuary', 'Acme'),
+        scraped('Capital Actuary', 'Globex', posting_date=datetime.now(UTC) - timedelta(days=10)),
+    ])
+
+    after = stats()
+    assert after.total == total + 3
+    assert after.companies == companies + 2
+    # Only the two posted today count as recent
+    assert after.recent == recent + 2
+    assert after.version > version
+
+    # The deltas agree with a full recount
+    counted = (after.total, after.companies, after.recent)
+    refresh_job_stats()
+    assert (stats().total, stats().companies, stats().recent) == counted
@@ -0,0 +1,32 @@
+"""
+Keyset cursors for GET /api/jobs
+"""
+import base64
+import json
+from datetime import datetime
+
+import pytest
+
+from app.utils import decode_cursor, encode_cursor
+
+
+def make_cursor(payload):
+    return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode().rstrip('=')
+
+
+def test_cursor_round_trip():
+    posted = datetime(2026, 10, 1, 12, 30)
+    assert decode_cursor(encode_cursor([posted, 42]), [datetime, int]) == [posted, 42]
+
+
+@pytest.mark.parametrize('payload', [[1, 2], [None, None], ['2026-10-01T12:30:00', 'x'], [{}, []]])
+def test_cursor_with_wrong_value_types_is_a_value_error(payload):
+    with pytest.raises(ValueError):
+        decode_cursor(make_cursor(payload), [datetime, int])
+
+
+@pytest.mark.parametrize('cursor', ['WzEsMl0=', make_cursor([None, None]), 'not-base64!', make_cursor({'a': 1})])
+def test_jobs_rejects_bad_cursor_with_400(client, cursor):
+    response = client.get('/api/jobs', query_string={'cursor': cursor})
+    assert response.status_code == 400
+    assert response.get_json()['success'] is False
@@ -0,0 +1,74 @@
+"""
+Cron matching, failure backoff and the lock row that keeps two schedulers off the same source
+"""
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.locks import LOCK_OWNER, database_lock
+from app.models import db, SchedulerLock
+from app.scheduler import CronSchedule, IntervalSchedule, Scheduler, parse_schedules
+
+
+def next_run(spec, moment):
+    return CronSchedule(spec).next_after(datetime.fromisoformat(moment))
+
+
+def test_day_of_month_or_weekday():
+    # Both day fields restricted: the 10th or any Monday (2026-03-02, 03-09 and 03-16 are Mondays)
+    assert next_run('0 9 10 * 1', '2026-03-01 12:00') == datetime(2026, 3, 2, 9, 0)
+    assert next_run('0 9 10 * 1', '2026-03-09 09:00') == datetime(2026, 3, 10, 9, 0)
+    assert next_run('0 9 10 * 1', '2026-03-10 09:00') == datetime(2026, 3, 16, 9, 0)
+    # Only one restricted: that one alone decides
+    assert next_run('0 9 10 * *', '2026-03-01 12:00') == datetime(2026, 3, 10, 9, 0)
+    assert next_run('0 9 * * 1', '2026-03-09 09:00') == datetime(2026, 3, 16, 9, 0)
+
+
+def test_month_and_year_rollover():
+    assert next_run('0 0 1 * *', '2026-12-15 08:00') == datetime(2027, 1, 1, 0, 0)
+    assert next_run('30 23 31 12 *', '2026-12-31 23:30') == datetime(2027, 12, 31, 23, 30)
+    assert next_run('0 0 29 2 *', '2026-03-01 00:00') == datetime(2028, 2, 29, 0, 0)
+    assert next_run('59 23 * * *', '2026-04-30 23:59') == datetime(2026, 5, 1, 23, 59)
+
+
+def test_cron_that_never_fires_is_rejected():
+    with pytest.raises(ValueError, match='never matches'):
+        parse_schedules('actuarylist=0 0 31 2 *')
+
+
+def test_backoff_doubles_and_is_capped():
+    scheduler = Scheduler(None, {'actuarylist': IntervalSchedule('1m', 60)}, jitter=0, backoff=300, backoff_max=3600)
+    now = datetime(2026, 3, 1, 12, 0)
+    delays = [
+        (scheduler.next_run_time('actuarylist', now, failures) - now).total_seconds()
+        for failures in (0, 1, 2, 3, 4, 5, 20)
+    ]
+    # No failures: just the schedule; then 300s doubling per failure up to backoff_max
+    assert delays == [60, 300, 600, 1200, 2400, 3600, 3600]
+
+
+def lock_owner(name):
+    return db.session.execute(db.select(SchedulerLock.owner).where(SchedulerLock.name == name)).scalar()
+
+
+def test_expired_lock_row_is_taken_over(app):
+    now = datetime.utcnow()
+    db.session.add(SchedulerLock(name='scrape:actuarylist', owner='crashed:1',
+                                 acquired_at=now - timedelta(hours=2), expires_at=now - timedelta(hours=1)))
+    db.session.commit()
+
+    with database_lock('scrape:actuarylist', ttl_seconds=60) as acquired:
+        assert acquired
+        assert lock_owner('scrape:actuarylist') == LOCK_OWNER
+    assert lock_owner('scrape:actuarylist') is None
+
+
+def test_live_lock_row_is_not_taken(app):
+    now = datetime.utcnow()
+    db.session.add(SchedulerLock(name='scrape:actuarylist', owner='other:1',
+                                 acquired_at=now, expires_at=now + timedelta(hours=1)))
+    db.session.commit()
+
+    with database_lock('scrape:actuarylist', ttl_seconds=60) as acquired:
+        assert not acquired
+    assert lock_owner('scrape:actuarylist') == 'other:1'
@@ -0,0 +1,74 @@
+"""
+Relevance-ranked search pages: jobs that tie on rank must be paged through exactly once
+"""
+import os
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app import search
+from app.models import db, Job
+from app.utils import keyset_filter
+
+
+def add_tied_jobs(count):
+    # Identical text gives every job the same relevance score
+    db.session.add_all(
+        Job(title='Pricing Actuary', company=f'Insurer {i}', location='Remote', description='Pricing actuary role')
+        for i in range(count)
+    )
+    db.session.commit()
+    return {job.id for job in Job.query}
+
+
+def page_through(client, limit=2):
+    seen = []
+    cursor = None
+    while True:
+        params = {'search': 'pricing actuary', 'limit': limit}
+        if cursor:
+            params['cursor'] = cursor
+        body = client.get('/api/jobs', query_string=params).get_json()
+        seen.extend(job['id'] for job in body['data'])
+        cursor = body.get('next_cursor')
+        if not cursor:
+            return seen
+
+
+def test_postgres_rank_is_compared_as_double_precision(app, monkeypatch):
+    monkeypatch.setattr(search, 'get_search_backend', lambda: 'postgresql')
+    query, (rank, descending) = search.apply_search(Job.query, 'pricing actuary')
+
+    # The cursor's rank binds as float8; an uncast float4 rank would never equal it
+    predicate = keyset_filter([(rank, descending), (Job.id, True)], [0.1, 5])
+    ordered = query.order_by(rank.desc(), Job.id.desc())
+    for statement in (predicate, ordered.statement):
+        sql = str(statement.compile(dialect=postgresql.dialect()))
+        assert 'CAST(ts_rank_cd(jobs.search_vector, websearch_to_tsquery(' in sql
+        assert 'AS FLOAT(53))' in sql
+
+
+def test_tied_ranks_page_through_once(app, client):
+    ids = add_tied_jobs(7)
+    seen = page_through(client)
+    assert sorted(seen) == sorted(ids)
+
+
+@pytest.mark.skipif(not os.getenv('TEST_POSTGRES_URL'), reason='set TEST_POSTGRES_URL to a scratch PostgreSQL database')
+def test_tied_ranks_page_through_once_on_postgres(monkeypatch):
+    monkeypatch.setenv('DATABASE_URL', os.environ['TEST_POSTGRES_URL'])
+
+    from app import create_app
+    from app.migrations import run_migrations
+
+    app = create_app()
+    with app.app_context():
+        db.drop_all()
+        run_migrations()
+        try:
+            ids = add_tied_jobs(7)
+            seen = page_through(app.test_client())
+            assert sorted(seen) == sorted(ids)
+        finally:
+            db.session.remove()
+            db.drop_all()
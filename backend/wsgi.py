@@ -0,0 +1,17 @@
+"""
+Production WSGI entry point
+Builds the application through create_app with debug mode off unless FLASK_DEBUG
+is set explicitly in the environment.
+
+    gunicorn -c gunicorn.conf.py wsgi:app     # Linux/macOS
+    python serve.py                            # waitress, any platform
+"""
+import os
+
+# Set before create_app loads .env, so a development .env can't turn debug on
+os.environ.setdefault('FLASK_DEBUG', 'False')
+os.environ.setdefault('FLASK_ENV', 'production')
+
+from app import create_app
+
+app = create_app()
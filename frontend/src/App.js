@@ -1,11 +1,15 @@
-import React, { useState, useEffect } from 'react';
+import React, { useState, useEffect, useRef, useCallback, useMemo } from 'react';
 import { jobAPI } from './services/api';
 import './App.css';
 
 function App() {
   const [jobs, setJobs] = useState([]);
-  const [filteredJobs, setFilteredJobs] = useState([]);
+  const [nextCursor, setNextCursor] = useState(null);
+  const [facets, setFacets] = useState({ total: 0, job_type: [] });
   const [loading, setLoading] = useState(true);
+  const [loadingMore, setLoadingMore] = useState(false);
+  const [scraping, setScraping] = useState(false);
+  const [scrapeProgress, setScrapeProgress] = useState('');
   const [error, setError] = useState(null);
   const [showAddForm, setShowAddForm] = useState(false);
   const [editingJob, setEditingJob] = useState(null);
@@ -15,6 +19,10 @@ function App() {
   const [searchTerm, setSearchTerm] = useState('');
   const [jobTypeFilter, setJobTypeFilter] = useState('');
   const [locationFilter, setLocationFilter] = useState('');
+  const [debouncedSearch, setDebouncedSearch] = useState('');
+  const [debouncedLocation, setDebouncedLocation] = useState('');
+  const hasLoaded = useRef(false);
+  const latestLoad = useRef(0);
 
   // Show notification helper
   const showNotification = (message, type = 'success') => {
@@ -22,51 +30,74 @@ function App() {
     setTimeout(() => setNotification(null), 5000);
   };
 
-  // Load jobs when component mounts
+  // Wait for typing to pause before querying the server
   useEffect(() => {
-    loadJobs();
-  }, []);
-
-  // Filter jobs when search criteria change
-  useEffect(() => {
-    filterJobs();
-  }, [jobs, searchTerm, jobTypeFilter, locationFilter]);
-
-  const loadJobs = async () => {
+    const timer = setTimeout(() => {
+      setDebouncedSearch(searchTerm.trim());
+      setDebouncedLocation(locationFilter.trim());
+    }, 300);
+    return () => clearTimeout(timer);
+  }, [searchTerm, locationFilter]);
+
+  // Filters are applied by the backend; only the current page is held in memory
+  const filterParams = useMemo(() => {
+    const params = {};
+    if (debouncedSearch) params.search = debouncedSearch;
+    if (jobTypeFilter) params.job_type = jobTypeFilter;
+    if (debouncedLocation) params.location = debouncedLocation;
+    return params;
+  }, [debouncedSearch, jobTypeFilter, debouncedLocation]);
+
+  const loadJobs = useCallback(async () => {
+    // A slower response for earlier filters must not overwrite a newer one
+    const loadId = ++latestLoad.current;
     try {
-      setLoading(true);
+      // Only the first load blanks the page; later reloads keep the filters mounted
+      if (!hasLoaded.current) {
+        setLoading(true);
+      }
       setError(null);
-      const jobsData = await jobAPI.getAllJobs();
-      setJobs(jobsData);
+      const [page, facetData] = await Promise.all([
+        jobAPI.getJobsPage({ ...filterParams, limit: 20 }),
+        jobAPI.getJobFacets(filterParams)
+      ]);
+      if (loadId !== latestLoad.current) return;
+      setJobs(page.jobs);
+      setNextCursor(page.nextCursor);
+      setFacets(facetData);
     } catch (err) {
+      if (loadId !== latestLoad.current) return;
       setError('Failed to load jobs. Make sure your backend is running on http://localhost:5000');
       console.error('Error loading jobs:', err);
     } finally {
-      setLoading(false);
-    }
-  };
-
-  const filterJobs = () => {
-    let filtered = jobs;
-
-    if (searchTerm) {
-      filtered = filtered.filter(job =>
-        job.title.toLowerCase().includes(searchTerm.toLowerCase()) ||
-        job.company.toLowerCase().includes(searchTerm.toLowerCase())
-      );
+      if (loadId === latestLoad.current) {
+        hasLoaded.current = true;
+        setLoading(false);
+      }
     }
+  }, [filterParams]);
 
-    if (jobTypeFilter) {
-      filtered = filtered.filter(job => job.job_type === jobTypeFilter);
-    }
+  // Reload the first page and facet counts whenever the filters change
+  useEffect(() => {
+    loadJobs();
+  }, [loadJobs]);
 
-    if (locationFilter) {
-      filtered = filtered.filter(job =>
-        job.location.toLowerCase().includes(locationFilter.toLowerCase())
-      );
+  const loadMoreJobs = async () => {
+    if (!nextCursor) return;
+    const loadId = latestLoad.current;
+    try {
+      setLoadingMore(true);
+      const page = await jobAPI.getJobsPage({ ...filterParams, limit: 20, cursor: nextCursor });
+      // The filters changed while this page was loading; it belongs to the old list
+      if (loadId !== latestLoad.current) return;
+      setJobs(prevJobs => [...prevJobs, ...page.jobs]);
+      setNextCursor(page.nextCursor);
+    } catch (err) {
+      console.error('Error loading more jobs:', err);
+      showNotification(`❌ Failed to load more jobs: ${err.message}`, 'error');
+    } finally {
+      setLoadingMore(false);
     }
-
-    setFilteredJobs(filtered);
   };
 
   const handleAddJob = async (jobData) => {
@@ -105,17 +136,22 @@ function App() {
     }
   };
 
+  // The run is queued in the background; the list stays usable while it's polled
   const triggerScraper = async () => {
     try {
-      setLoading(true);
-      const result = await jobAPI.triggerScraper();
+      setScraping(true);
+      setScrapeProgress('Queued');
+      const result = await jobAPI.triggerScraper({
+        onProgress: (run) => setScrapeProgress(run.progress || run.status)
+      });
       await loadJobs(); // Reload jobs after scraping
       showNotification(`✅ Scraper completed! Added ${result.jobs_saved} new jobs, skipped ${result.jobs_skipped} duplicates.`, 'success');
     } catch (err) {
       console.error('Error running scraper:', err);
       showNotification(`❌ Scraper failed: ${err.message}`, 'error');
     } finally {
-      setLoading(false);
+      setScraping(false);
+      setScrapeProgress('');
     }
   };
 
@@ -125,10 +161,7 @@ function App() {
     setLocationFilter('');
   };
 
-  const getUniqueJobTypes = () => {
-    const types = jobs.map(job => job.job_type).filter(Boolean);
-    return [...new Set(types)];
-  };
+  const hasFilters = Boolean(searchTerm || jobTypeFilter || locationFilter);
 
   if (loading) {
     return (
@@ -158,7 +191,7 @@ function App() {
             📊 ActuaryJobs
           </div>
           <div className="header-stats">
-            <span className="job-count">{jobs.length} Jobs</span>
+            <span className="job-count">{facets.total} Jobs</span>
             <button 
               className="add-job-btn"
               onClick={() => {
@@ -170,14 +203,17 @@ function App() {
               <span className="btn-icon">➕</span>
               <span className="btn-text">Add Job</span>
             </button>
+            {scraping && scrapeProgress && (
+              <span className="scrape-progress" title={scrapeProgress}>{scrapeProgress}</span>
+            )}
             <button 
               className="scraper-btn"
               onClick={triggerScraper}
-              disabled={loading}
+              disabled={scraping}
               title="Scrape Jobs from ActuaryList.com"
             >
-              <span className="btn-icon">{loading ? '⏳' : '🔍'}</span>
-              <span className="btn-text">{loading ? 'Scraping...' : 'Scrape Jobs'}</span>
+              <span className="btn-icon">{scraping ? '⏳' : '🔍'}</span>
+              <span className="btn-text">{scraping ? 'Scraping...' : 'Scrape Jobs'}</span>
             </button>
           </div>
         </div>
@@ -213,8 +249,8 @@ function App() {
               onChange={(e) => setJobTypeFilter(e.target.value)}
             >
               <option value="">All Job Types</option>
-              {getUniqueJobTypes().map(type => (
-                <option key={type} value={type}>{type}</option>
+              {facets.job_type.map(({ value, count }) => (
+                <option key={value} value={value}>{value} ({count})</option>
               ))}
             </select>
           </div>
@@ -229,7 +265,7 @@ function App() {
             />
           </div>
 
-          <button className="filter-btn" onClick={filterJobs}>
+          <button className="filter-btn" onClick={loadJobs}>
             🔍 Filter
           </button>
         </div>
@@ -237,17 +273,17 @@ function App() {
 
       {/* Results */}
       <main className="main-content">
-        {filteredJobs.length === 0 ? (
+        {jobs.length === 0 ? (
           <div className="no-jobs">
             <div className="no-jobs-icon">🔍</div>
             <h2>No Jobs Found</h2>
             <p>
-              {jobs.length === 0 
+              {!hasFilters 
                 ? "No job listings in database. Try running the scraper to add jobs."
                 : "No job listings match your search criteria. Try adjusting your filters."
               }
             </p>
-            {jobs.length === 0 ? (
+            {!hasFilters ? (
               <button onClick={triggerScraper} className="primary-btn">
                 🔍 Scrape Jobs
               </button>
@@ -258,16 +294,25 @@ function App() {
             )}
           </div>
         ) : (
-          <div className="jobs-grid">
-            {filteredJobs.map(job => (
-              <JobCard 
-                key={job.id} 
-                job={job} 
-                onUpdate={setEditingJob}
-                onDelete={handleDeleteJob}
-              />
-            ))}
-          </div>
+          <>
+            <div className="jobs-grid">
+              {jobs.map(job => (
+                <JobCard 
+                  key={job.id} 
+                  job={job} 
+                  onUpdate={setEditingJob}
+                  onDelete={handleDeleteJob}
+                />
+              ))}
+            </div>
+            {nextCursor && (
+              <div className="load-more">
+                <button onClick={loadMoreJobs} className="secondary-btn" disabled={loadingMore}>
+                  {loadingMore ? '⏳ Loading...' : `Load more (${jobs.length} of ${facets.total})`}
+                </button>
+              </div>
+            )}
+          </>
         )}
       </main>
 
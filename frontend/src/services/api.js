@@ -61,14 +61,15 @@ export const jobAPI = {
    */
   async getAllJobs(params = {}) {
     try {
-      const response = await api.get('/jobs', { params });
-      // Handle Flask API response format with success/data structure
-      if (response.data.success) {
-        return response.data.data || [];
-      } else {
-        console.warn('API returned success: false', response.data);
-        return [];
-      }
+      // Follow next_cursor until the last page
+      const jobs = [];
+      let cursor = null;
+      do {
+        const page = await this.getJobsPage({ ...params, cursor });
+        jobs.push(...page.jobs);
+        cursor = page.nextCursor;
+      } while (cursor);
+      return jobs;
     } catch (error) {
       console.error('Error fetching jobs:', error);
       // Return empty array on error to prevent app crashes
@@ -76,6 +77,42 @@ export const jobAPI = {
     }
   },
 
+  /**
+   * Get one page of jobs using keyset pagination
+   * @param {Object} params - Query parameters (filters, limit, cursor)
+   * @returns {Promise<Object>} { jobs, nextCursor }
+   */
+  async getJobsPage(params = {}) {
+    const query = { limit: 100, ...params };
+    if (!query.cursor) {
+      delete query.cursor;
+    }
+    const response = await api.get('/jobs', { params: query });
+    // Handle Flask API response format with success/data structure
+    if (response.data.success) {
+      return {
+        jobs: response.data.data || [],
+        nextCursor: response.data.next_cursor || null
+      };
+    }
+    console.warn('API returned success: false', response.data);
+    return { jobs: [], nextCursor: null };
+  },
+
+  /**
+   * Get facet counts (job type, experience level, remote, top tags) for a filter set
+   * @param {Object} params - Same filter parameters as getJobsPage
+   * @returns {Promise<Object>} { total, job_type, experience_level, remote_allowed, tags }
+   */
+  async getJobFacets(params = {}) {
+    const response = await api.get('/jobs/facets', { params });
+    if (response.data.success) {
+      return response.data.data;
+    }
+    console.warn('API returned success: false', response.data);
+    return { total: 0, job_type: [], experience_level: [], remote_allowed: [], tags: [] };
+  },
+
   /**
    * Get a single job by ID
    * @param {number} jobId - Job ID
@@ -168,20 +205,39 @@ export const jobAPI = {
   },
 
   /**
-   * Trigger the job scraper
-   * @returns {Promise<Object>} Scraper result
+   * Trigger the job scraper and wait for the queued run to finish
+   * @param {Object} options - { pollInterval, timeout, onProgress }
+   * @returns {Promise<Object>} Finished scrape run
    */
-  async triggerScraper() {
+  async triggerScraper({ pollInterval = 2000, timeout = 300000, onProgress } = {}) {
     try {
-      console.log('🔄 Triggering job scraper...');
+      console.log('🔄 Queueing job scraper...');
       const response = await api.post('/scrape');
       
-      if (response.data.success) {
-        console.log('✅ Scraper completed successfully');
-        return response.data.data;
-      } else {
+      if (!response.data.success) {
         throw new Error(response.data.error || 'Scraper failed');
       }
+      
+      const runId = response.data.data.run_id;
+      const deadline = Date.now() + timeout;
+      
+      // Poll the run until the worker reports it finished
+      while (Date.now() < deadline) {
+        const run = await this.getScrapeRun(runId);
+        if (onProgress) {
+          onProgress(run);
+        }
+        if (run.status === 'completed') {
+          console.log('✅ Scraper completed successfully');
+          return run;
+        }
+        if (run.status === 'failed') {
+          throw new Error(run.error || 'Scraper failed');
+        }
+        await new Promise(resolve => setTimeout(resolve, pollInterval));
+      }
+      
+      throw new Error('Timed out waiting for the scraper to finish');
     } catch (error) {
       console.error('Error running scraper:', error);
       throw new Error(
@@ -192,6 +248,19 @@ export const jobAPI = {
     }
   },
 
+  /**
+   * Get the status of a scraper run
+   * @param {string} runId - Scrape run ID
+   * @returns {Promise<Object>} Run status, counts and timing
+   */
+  async getScrapeRun(runId) {
+    const response = await api.get(`/scrape/${runId}`);
+    if (response.data.success) {
+      return response.data.data;
+    }
+    throw new Error(response.data.error || 'Scrape run not found');
+  },
+
   /**
    * Health check endpoint
    * @returns {Promise<Object>} Health status